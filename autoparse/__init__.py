@@ -7,5 +7,6 @@ from ._conv import cast
 from . import pattern
 #: text parsers
 from . import find
+from .find import compile  # pylint: disable=redefined-builtin
 
-__all__ = ['pattern', 'find', 'cast']
+__all__ = ['pattern', 'find', 'cast', 'compile']
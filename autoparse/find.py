@@ -5,6 +5,7 @@ Extract information from a file using re patterns.
 """
 import re
 from functools import partial
+from functools import lru_cache
 import numpy as np
 from autoparse._lib import STRING_START as _STRING_START
 from autoparse._lib import STRING_END as _STRING_END
@@ -15,6 +16,50 @@ from autoparse._lib import LINESPACES as _LINESPACES
 from autoparse._lib import NUMBER as _NUMBER
 from autoparse._pattern import maybe as _maybe
 
+#: maximum number of compiled patterns held in the cache
+PATTERN_CACHE_SIZE = 1024
+#: size (in characters) of the first window in reverse scans
+REVERSE_SCAN_CHUNK = 2 ** 16
+
+
+def compile(pattern, case=True):  # pylint: disable=redefined-builtin
+    """ compile a pattern for re-use with the find functions
+
+    Compiled patterns are cached on (pattern, flags), so repeated calls
+    with the same pattern string are cheap. The returned object can be
+    passed anywhere a pattern string is accepted; its own flags take
+    precedence over the `case` argument of the find functions.
+
+    :param pattern: pattern to compile
+    :type pattern: str
+    :param case: if capitalization matters
+    :type case: bool
+    :return: the compiled pattern
+    :rtype: re.Pattern
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return _compile(pattern, _re_flags(case=case))
+
+
+def pattern_cache_info():
+    """ hit and miss statistics for the compiled-pattern cache
+
+    :rtype: functools._CacheInfo
+    """
+    return _compile.cache_info()
+
+
+def clear_pattern_cache():
+    """ empty the compiled-pattern cache and reset its statistics
+    """
+    _compile.cache_clear()
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile(pattern, flags):
+    return re.compile(pattern, flags)
+
 
 def has_match(pattern, string, case=True):
     """ does this string have a pattern match?
@@ -44,6 +89,7 @@ def full_match(pattern, string, case=True):
     :return: does it fully match
     :rtype: bool
     """
+    pattern, case = _pattern_string(pattern, case)
     pattern_ = _STRING_START + pattern + _STRING_END
     return has_match(pattern_, string, case=case)
 
@@ -60,6 +106,7 @@ def starts_with(pattern, string, case=True):
     :return: does it start with the pattern
     :rtype: bool
     """
+    pattern, case = _pattern_string(pattern, case)
     start_pattern = _STRING_START + pattern
     return has_match(start_pattern, string, case=case)
 
@@ -76,6 +123,7 @@ def ends_with(pattern, string, case=True):
     :return: does it end with the pattern
     :rtype: bool
     """
+    pattern, case = _pattern_string(pattern, case)
     end_pattern = pattern + _STRING_END
     return has_match(end_pattern, string, case=case)
 
@@ -168,6 +216,56 @@ def last_capture(pattern, string, case=True):
     return caps_lst[-1] if caps_lst else None
 
 
+def last_capture_from_end(pattern, string, anchor_ptt=None, case=True):
+    """ capture(s) from last match for a capturing pattern, found by
+        scanning backwards from the end of the string
+
+    Each match must start with the anchor pattern (such as a block header)
+    and anchors must not occur inside matches. The last anchor is located
+    in windows that double in size from the end of the string and the
+    full pattern is only matched from there, so only the tail of the
+    string is read when the last match is near the end. Captures are
+    returned in the same form as `last_capture`.
+
+    Without an anchor, a window starting part-way through a match (e.g.
+    inside a block of repeated lines) cannot be told apart from a real
+    match, so the string is scanned forward and only the last match is
+    kept.
+
+    :param pattern: pattern to search for
+    :type pattern: str
+    :param string: string to search
+    :type string: str
+    :param anchor_ptt: pattern at the start of every match
+    :type anchor_ptt: str
+    :param case: if capitalization matters
+    :type case: bool
+    :return: last instance of this pattern
+    :rtype: str
+    """
+    if not pattern or string is None:
+        return None
+
+    ptt = compile(pattern, case=case)
+    if not anchor_ptt:
+        match = _last_match(ptt, string)
+    else:
+        match = _last_anchored_match_from_end(
+            ptt, compile(anchor_ptt, case=case), string)
+
+    # Mimic the re.findall captures used by last_capture
+    if match is None:
+        cap = None
+    elif ptt.groups == 0:
+        cap = match.group(0)
+    elif ptt.groups == 1:
+        cap = match.groups('')[0]
+    else:
+        cap = match.groups('')
+
+    return cap
+
+
 def first_named_capture(pattern, string, case=True):
     """ capture dictionary from first match for a pattern with named captures
     """
@@ -264,14 +362,12 @@ def first_matching_pattern_last_capture(patterns, string, case=True):
 
 
 def _re_search(pattern, string, case=True):
-    flags = _re_flags(case=case)
-    return re.search(pattern, string, flags=flags)
+    return compile(pattern, case=case).search(string)
 
 
 def _re_findall(pattern, string, case=True):
     if pattern and string is not None:
-        flags = _re_flags(case=case)
-        ptt = re.findall(pattern, string, flags=flags)
+        ptt = compile(pattern, case=case).findall(string)
         if ptt:
             ret = ptt
         else:
@@ -283,21 +379,65 @@ def _re_findall(pattern, string, case=True):
 
 def _re_finditer(pattern, string, case=True):
     if pattern and string is not None:
-        flags = _re_flags(case=case)
-        match_iter = re.finditer(pattern, string, flags=flags)
+        match_iter = compile(pattern, case=case).finditer(string)
     else:
         match_iter = iter([])
     return match_iter
 
 
 def _re_split(pattern, string, case=True):
-    flags = _re_flags(case=case)
-    return re.split(pattern, string, maxsplit=0, flags=flags)
+    return compile(pattern, case=case).split(string, maxsplit=0)
 
 
 def _re_sub(pattern, repl, string, case=True):
-    flags = _re_flags(case=case)
-    return re.sub(pattern, repl, string, count=0, flags=flags)
+    return compile(pattern, case=case).sub(repl, string, count=0)
+
+
+def _last_match(ptt, string):
+    """ last match of a compiled pattern in a forward scan of the string,
+        without keeping the earlier matches
+    """
+    match = None
+    for match in ptt.finditer(string):
+        pass
+    return match
+
+
+def _last_anchored_match_from_end(ptt, anchor_ptt, string):
+    """ last match of a compiled pattern, tried at each anchor from the end
+        of the string backwards
+    """
+    size = REVERSE_SCAN_CHUNK
+    end = len(string) + 1
+    while end > 0:
+        pos = max(0, len(string) - size)
+        # Anchors may overlap (e.g. a header pattern spanning several lines
+        # that contains a later header), so step one character at a time
+        starts = []
+        anchor = anchor_ptt.search(string, pos)
+        while anchor is not None and anchor.start() < end:
+            starts.append(anchor.start())
+            if anchor.start() >= len(string):
+                break
+            anchor = anchor_ptt.search(string, anchor.start() + 1)
+        for start in reversed(starts):
+            match = ptt.match(string, start)
+            if match is not None:
+                return match
+        end = pos
+        size *= 2
+
+    return None
+
+
+def _pattern_string(pattern, case=True):
+    """ the raw string and case-sensitivity of a (possibly compiled) pattern,
+        for building a new pattern around it
+    """
+    if isinstance(pattern, re.Pattern):
+        case = not pattern.flags & re.IGNORECASE
+        pattern = pattern.pattern
+    return pattern, case
 
 
 def _re_flags(case=True):
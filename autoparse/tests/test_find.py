@@ -56,6 +56,52 @@ def test__first_capture():
     assert cap == 'Cl'
 
 
+def test__compile():
+    """ test autoparse.compile
+        test autoparse.find.pattern_cache_info
+    """
+    cl_ptt = autoparse.compile('(cl)', case=False)
+    assert autoparse.find.first_capture(cl_ptt, XYZ_STRING) == 'Cl'
+    assert autoparse.find.first_capture(cl_ptt, XYZ_STRING, case=True) == 'Cl'
+    assert autoparse.find.full_match(
+        autoparse.compile('cl', case=False), 'Cl')
+    assert autoparse.compile(cl_ptt) is cl_ptt
+
+    xyz_ptt = autoparse.compile(XYZ_LINE_PATTERN)
+    assert (autoparse.find.all_captures(xyz_ptt, XYZ_STRING) ==
+            autoparse.find.all_captures(XYZ_LINE_PATTERN, XYZ_STRING))
+
+    autoparse.find.clear_pattern_cache()
+    autoparse.find.first_capture(XYZ_LINE_PATTERN, XYZ_STRING)
+    autoparse.find.first_capture(XYZ_LINE_PATTERN, XYZ_STRING)
+    info = autoparse.find.pattern_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test__last_capture_from_end():
+    """ test autoparse.find.last_capture_from_end
+    """
+    pattern = (
+        autoparse.pattern.escape('charge:') +
+        autoparse.pattern.LINESPACES +
+        autoparse.pattern.capturing(autoparse.pattern.NUMBER))
+    string = '\n'.join(
+        [XYZ_STRING.replace('charge: 0', f'charge: {idx}')
+         for idx in range(5)])
+    assert autoparse.find.last_capture_from_end(
+        pattern, string, anchor_ptt=autoparse.pattern.escape('charge:')
+    ) == autoparse.find.last_capture(pattern, string) == '4'
+    assert autoparse.find.last_capture_from_end(pattern, string) == '4'
+    assert autoparse.find.last_capture_from_end(
+        pattern, XYZ_STRING.replace('charge', 'c'),
+        anchor_ptt=autoparse.pattern.escape('charge:')) is None
+
+    assert autoparse.find.last_capture_from_end(
+        XYZ_LINE_PATTERN, XYZ_STRING,
+        anchor_ptt=autoparse.pattern.LINE_START
+    ) == autoparse.find.last_capture(XYZ_LINE_PATTERN, XYZ_STRING)
+
+
 def test__remove_empty_lines():
     """ test autoparse.find.remove_empty_lines
     """
@@ -66,8 +66,10 @@ def read(string,
 
     block_ptt_ = block_ptt_ if start_ptt is None else start_ptt + block_ptt_
 
-    block_str = (apf.last_capture(block_ptt_, string, case=case) if last else
-                 apf.first_capture(block_ptt_, string, case=case))
+    block_str = (
+        apf.last_capture_from_end(block_ptt_, string, anchor_ptt=start_ptt,
+                                  case=case) if last else
+        apf.first_capture(block_ptt_, string, case=case))
 
     caps = apf.all_captures(entry_ptt_, block_str, case=case)
 
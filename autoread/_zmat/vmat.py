@@ -84,7 +84,8 @@ def read(string,
 
     if block_ptt_ is not None:
         if last:
-            block_str = apf.last_capture(block_ptt_, string, case=case)
+            block_str = apf.last_capture_from_end(
+                block_ptt_, string, anchor_ptt=start_ptt, case=case)
         else:
             block_str = apf.first_capture(block_ptt_, string, case=case)
     else:
@@ -100,7 +100,8 @@ def read(string,
         block_ptt_ = start_ptt + block_ptt_
 
     if last:
-        cap = apf.last_capture(block_ptt_, string, case=case)
+        cap = apf.last_capture_from_end(
+            block_ptt_, string, anchor_ptt=start_ptt, case=case)
     else:
         cap = apf.first_capture(block_ptt_, string, case=case)
 
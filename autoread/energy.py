@@ -32,8 +32,10 @@ def read(string,
     """
 
     ptt_ = pattern(start_ptt=start_ptt, val_ptt=app.capturing(val_ptt))
-    ene_str = (apf.last_capture(ptt_, string, case=case) if last else
-               apf.first_capture(ptt_, string, case=case))
+    ene_str = (
+        apf.last_capture_from_end(ptt_, string, anchor_ptt=start_ptt,
+                                  case=case) if last else
+        apf.first_capture(ptt_, string, case=case))
     if ene_str is not None:
         ene = _cast(ene_str.replace('D', 'E'))
     else:
@@ -18,18 +18,33 @@ def read(string,
          last=True,
          tril=False,
          case=False):
-    """ Read
+    """ Reads a single M x N matrix from a string; see `read_all`.
+
+        Only the selected matrix is parsed. With last=True, the string is
+        scanned from the end for the final match.
+
+        :param last: capture the last match, instead of the first?
+        :type last: bool
+        :rtype: tuple(tuple(float))
     """
 
-    mats = read_all(string,
-                    val_ptt=val_ptt,
-                    start_ptt=start_ptt,
-                    block_start_ptt=block_start_ptt,
-                    line_start_ptt=line_start_ptt,
-                    tril=tril,
-                    case=case)
-    if mats is not None:
-        mat = mats[-1] if last else mats[0]
+    blocks_ptt_ = blocks_pattern(val_ptt=val_ptt, start_ptt=start_ptt,
+                                 block_start_ptt=block_start_ptt,
+                                 line_start_ptt=line_start_ptt,
+                                 capture_blocks=True)
+
+    blocks_str = (
+        apf.last_capture_from_end(blocks_ptt_, string, anchor_ptt=start_ptt,
+                                  case=case) if last else
+        apf.first_capture(blocks_ptt_, string, case=case))
+
+    if blocks_str is not None:
+        mat = _read_blocks(blocks_str,
+                           val_ptt=val_ptt,
+                           block_start_ptt=block_start_ptt,
+                           line_start_ptt=line_start_ptt,
+                           tril=tril,
+                           case=case)
     else:
         mat = None
 
@@ -64,11 +79,6 @@ def read_all(string,
         :rtype: tuple(tuple(float))
     """
 
-    line_ptt_ = line_pattern(val_ptt=val_ptt, start_ptt=line_start_ptt,
-                             capture_values=True)
-    block_ptt_ = block_pattern(val_ptt=val_ptt, start_ptt=block_start_ptt,
-                               line_start_ptt=line_start_ptt,
-                               capture_block=True)
     blocks_ptt_ = blocks_pattern(val_ptt=val_ptt, start_ptt=start_ptt,
                                  block_start_ptt=block_start_ptt,
                                  line_start_ptt=line_start_ptt,
@@ -76,36 +86,14 @@ def read_all(string,
 
     blocks_str_lst = apf.all_captures(blocks_ptt_, string, case=case)
     blocks_str_lst = blocks_str_lst if blocks_str_lst is not None else ()
-    # blocks_str_lst = (
-    #     apf.last_capture(blocks_ptt_, string, case=case) if last else
-    #     apf.first_capture(blocks_ptt_, string, case=case))
-
-    mats = ()
-    for blocks_str in blocks_str_lst:
-        block_strs = apf.all_captures(block_ptt_, blocks_str, case=case)
-
-        if block_strs is not None:
-            if not tril:
-                rows = numpy.concatenate(
-                    [_block_rows(block_str, val_ptt, line_ptt_, case=case)
-                     for block_str in block_strs], axis=1)
-                mats += (_matrix(rows),)
-            else:
-                rows = list(_block_rows(
-                    block_strs[0], val_ptt, line_ptt_, case=case))
-                nrows = len(rows)
-                for block_str in block_strs[1:]:
-                    block_rows = _block_rows(
-                        block_str, val_ptt, line_ptt_, case=case)
-                    nblock_rows = len(block_rows)
-                    for block_row_idx, row_idx in enumerate(
-                            range(nrows-nblock_rows, nrows)):
-                        rows[row_idx] += block_rows[block_row_idx]
-
-                mats += (_symmetric_matrix_from_lower_triangle(rows),)
 
-        else:
-            mats += (None,)
+    mats = tuple(_read_blocks(blocks_str,
+                              val_ptt=val_ptt,
+                              block_start_ptt=block_start_ptt,
+                              line_start_ptt=line_start_ptt,
+                              tril=tril,
+                              case=case)
+                 for blocks_str in blocks_str_lst)
 
     if not mats:
         mats = None
@@ -113,6 +101,53 @@ def read_all(string,
     return mats
 
 
+def _read_blocks(blocks_str,
+                 val_ptt=VALUE_PATTERN,
+                 block_start_ptt=None,
+                 line_start_ptt=None,
+                 tril=False,
+                 case=False):
+    """ Reads a single matrix from the string of its (possibly multiple)
+        blocks.
+
+        :param blocks_str: string with all the blocks of one matrix
+        :type blocks_str: str
+        :rtype: tuple(tuple(float))
+    """
+
+    line_ptt_ = line_pattern(val_ptt=val_ptt, start_ptt=line_start_ptt,
+                             capture_values=True)
+    block_ptt_ = block_pattern(val_ptt=val_ptt, start_ptt=block_start_ptt,
+                               line_start_ptt=line_start_ptt,
+                               capture_block=True)
+
+    block_strs = apf.all_captures(block_ptt_, blocks_str, case=case)
+
+    if block_strs is not None:
+        if not tril:
+            rows = numpy.concatenate(
+                [_block_rows(block_str, val_ptt, line_ptt_, case=case)
+                 for block_str in block_strs], axis=1)
+            mat = _matrix(rows)
+        else:
+            rows = list(_block_rows(
+                block_strs[0], val_ptt, line_ptt_, case=case))
+            nrows = len(rows)
+            for block_str in block_strs[1:]:
+                block_rows = _block_rows(
+                    block_str, val_ptt, line_ptt_, case=case)
+                nblock_rows = len(block_rows)
+                for block_row_idx, row_idx in enumerate(
+                        range(nrows-nblock_rows, nrows)):
+                    rows[row_idx] += block_rows[block_row_idx]
+
+            mat = _symmetric_matrix_from_lower_triangle(rows)
+    else:
+        mat = None
+
+    return mat
+
+
 def _matrix(rows):
     """ Format the values of matrix read from a string into a tuple-of-tuples.
 
@@ -8,9 +8,16 @@ from autorun._run import from_input_string
 from autorun._run import run_script
 from autorun._run import write_input
 from autorun._run import read_output
+from autorun import aio
+from autorun._cache import ResultCache
+from autorun._cache import enable_cache
+from autorun._cache import disable_cache
+from autorun._cache import active_cache
 from autorun._host import host_node
 from autorun._host import process_id
 from autorun._proc import execute_function_in_parallel
+from autorun._proc import parallel_map
+from autorun._proc import WorkerPool
 from autorun._proc import timeout
 
 # Single Program Runners
@@ -36,9 +43,16 @@ __all__ = [
     'from_input_string',
     'write_input',
     'read_output',
+    'aio',
+    'ResultCache',
+    'enable_cache',
+    'disable_cache',
+    'active_cache',
     'host_node',
     'process_id',
     'execute_function_in_parallel',
+    'parallel_map',
+    'WorkerPool',
     'timeout',
     # Single Program Runners
     'intder',
@@ -0,0 +1,211 @@
+""" On-disk cache of the outputs of external program runs
+
+    Runs are keyed by a hash of everything that goes into the run directory
+    (the script, the input, and the auxiliary files) along with the names of
+    the files read back, so identical runs can return the stored outputs
+    instead of launching the program again.
+"""
+
+import os
+import pickle
+import tempfile
+from ioformat import hash_string
+
+
+KEY_LENGTH = 22
+MAX_SIZE = 2 ** 30
+
+
+class ResultCache():
+    """ Size-bounded cache of output strings stored as files in a directory
+
+        Entries are evicted least-recently-used first, using the file
+        modification times, once the total size passes max_size bytes.
+        The total size is read from the directory once and then kept up
+        to date by put, so the directory is only scanned again when the
+        bound is passed; entries added by other processes sharing the
+        directory are counted at that scan.
+        The hits and misses attributes count lookups made through get.
+    """
+
+    def __init__(self, cache_dir, max_size=MAX_SIZE):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+
+    @staticmethod
+    def key(script_str, input_str, aux_dct=None,
+            script_name='', input_name='', output_names=()):
+        """ Build the key for a run from its script, inputs, and file names
+
+            :param script_str: string of bash script
+            :type script_str: str
+            :param input_str: string of the input file
+            :type input_str: str
+            :param aux_dct: auxiliary file names and strings
+            :type aux_dct: dict[str: str]
+            :rtype: str
+        """
+        aux_items = tuple(sorted((aux_dct or {}).items()))
+        return hash_string(
+            (script_str, input_str, aux_items,
+             script_name, input_name, tuple(output_names)),
+            KEY_LENGTH, remove_char_lst=('=',))
+
+    def get(self, key):
+        """ Get the output strings stored for a key, if there are any
+
+            :param key: key of the run
+            :type key: str
+            :returns: the output strings, or None if not stored
+            :rtype: tuple(str)
+        """
+
+        path = self._path(key)
+        try:
+            with open(path, mode='rb') as cache_obj:
+                output_strs = pickle.load(cache_obj)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            output_strs = None
+
+        if output_strs is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # Mark the entry as recently used
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        return output_strs
+
+    def put(self, key, output_strs):
+        """ Store the output strings for a key and evict old entries
+
+            :param key: key of the run
+            :type key: str
+            :param output_strs: output strings of the run
+            :type output_strs: tuple(str)
+        """
+
+        # Write to a temporary file and move it into place, so that other
+        # processes sharing the directory never read a partial entry
+        path = self._path(key)
+        fdesc, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fdesc, mode='wb') as cache_obj:
+            pickle.dump(tuple(output_strs), cache_obj)
+            entry_size = cache_obj.tell()
+        replaced_size = _file_size(path)
+        os.replace(tmp_path, path)
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += entry_size - replaced_size
+
+        if self._size > self.max_size:
+            self._evict()
+
+    def clear(self):
+        """ Remove all stored entries and reset the counters
+        """
+        for path, _, _ in self._entries():
+            _remove(path)
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+
+    def size(self):
+        """ Total size of the stored entries, in bytes
+
+            :rtype: int
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def _path(self, key):
+        """ Path to the file storing a key
+        """
+        return os.path.join(self.cache_dir, f'{key}.pkl')
+
+    def _entries(self):
+        """ Path, size, and modification time of each stored entry
+        """
+        entries = ()
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries += ((path, stat.st_size, stat.st_mtime),)
+
+        return entries
+
+    def _evict(self):
+        """ Remove least-recently-used entries until under the size bound
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(size for _, size, _ in entries)
+        for path, entry_size, _ in entries:
+            if size <= self.max_size:
+                break
+            _remove(path)
+            size -= entry_size
+        self._size = size
+
+
+def _file_size(path):
+    """ Size of a file, or 0 if there is none
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    return size
+
+
+def _remove(path):
+    """ Remove a file that another process may have removed already
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# Cache consulted by autorun._run.from_input_string, off unless enabled
+_CACHE = None
+
+
+def enable_cache(cache_dir, max_size=MAX_SIZE):
+    """ Have all runs through from_input_string use a result cache
+
+        :param cache_dir: directory to store the outputs in
+        :type cache_dir: str
+        :param max_size: maximum total size of the stored outputs, in bytes
+        :type max_size: int
+        :rtype: ResultCache
+    """
+    global _CACHE  # pylint: disable=global-statement
+    _CACHE = ResultCache(cache_dir, max_size=max_size)
+    return _CACHE
+
+
+def disable_cache():
+    """ Stop using the result cache for runs
+    """
+    global _CACHE  # pylint: disable=global-statement
+    _CACHE = None
+
+
+def active_cache():
+    """ The result cache in use, or None if caching is off
+
+        :rtype: ResultCache
+    """
+    return _CACHE
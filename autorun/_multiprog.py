@@ -2,6 +2,7 @@
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 import automol.form
 from phydat import phycon
 import mess_io.reader
@@ -22,54 +23,59 @@ def projected_frequencies(mess_script_str, projrot_script_str, run_dir,
     """ Compute the harmonic vibrational frequencies and ZPVE after projecting
         out the hindered rotors. Tests different cutoffs for defininig rotors
         and sees which reproduces the harmonic frequency result; takes that one
-    """
 
-    # Calculate the torsional frequencies using MESS
-    tors_freqs, _ = mess_torsions(
-        mess_script_str, run_dir, mess_geo, mess_hr_str)
+        The MESS and ProjRot runs are independent, so they are run at the
+        same time from threads of this process.
+    """
 
-    # Calculate the projected vibrational frequencies using ProjRot
+    # Set the rotor distance cutoffs for each of the ProjRot runs
     if dist_cutoff_dct1 is None:
         dist_cutoff_dct1 = {('H', 'O'): 2.26767, ('H', 'C'): 2.26767}
-    rotor_dist1_str = projrot_io.writer.projection_distance_aux(
-        dist_cutoff_dct=dist_cutoff_dct1)
-    aux_dct1 = {'dist_rotpr.dat': rotor_dist1_str}
-
-    print('running projrot the first time:')
-    run_dir_1 = os.path.join(run_dir, '1')
-    rt_freqs1, rth_freqs1, rt_imag1, _ = frequencies(
-        projrot_script_str, run_dir_1, [projrot_geo], [[]], [hess],
-        rotors_str=projrot_hr_str, aux_dct=aux_dct1)
-
     if dist_cutoff_dct2 is None:
         dist_cutoff_dct2 = {('H', 'O'): 2.83459, ('H', 'C'): 2.83459,
                             ('C', 'O'): 3.7807}
-    rotor_dist2_str = projrot_io.writer.projection_distance_aux(
-        dist_cutoff_dct=dist_cutoff_dct2)
-    aux_dct2 = {'dist_rotpr.dat': rotor_dist2_str}
-
-    print('running projrot the second time:')
-    run_dir_2 = os.path.join(run_dir, '2')
-    _, rth_freqs2, rt_imag2, _ = frequencies(
-        projrot_script_str, run_dir_2, [projrot_geo], [[]], [hess],
-        rotors_str=projrot_hr_str, aux_dct=aux_dct2)
-
-    if not rth_freqs2:
-        dist_cutoff_dct3 = {('H', 'O'): 3.401506, ('H', 'C'): 3.779451,
-                                ('C', 'O'): 4.53534}
-        rotor_dist3_str = projrot_io.writer.projection_distance_aux(
-            dist_cutoff_dct=dist_cutoff_dct3)
-        aux_dct3 = {'dist_rotpr.dat': rotor_dist3_str}
-
-        print('running projrot a third time:')
-        run_dir_3 = os.path.join(run_dir, '3')
-        _, rth_freqs2, rt_imag2, _ = frequencies(
-            projrot_script_str, run_dir_3, [projrot_geo], [[]], [hess],
-            rotors_str=projrot_hr_str, aux_dct=aux_dct3)
-        if rth_freqs2:
-            print(
-                'it did work, make sure these frequencies look alright:',
-                rth_freqs2)
+    dist_cutoff_dct3 = {('H', 'O'): 3.401506, ('H', 'C'): 3.779451,
+                        ('C', 'O'): 4.53534}
+    aux_dcts = tuple(
+        {'dist_rotpr.dat': projrot_io.writer.projection_distance_aux(
+            dist_cutoff_dct=dist_cutoff_dct)}
+        for dist_cutoff_dct in (dist_cutoff_dct1, dist_cutoff_dct2,
+                                dist_cutoff_dct3))
+
+    # Run MESS and each ProjRot version at the same time, each in its own
+    # directory; the third ProjRot run is only used if the second one
+    # finds no frequencies, but is started with the others so it does not
+    # add to the wall time when it is needed
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Calculate the torsional frequencies using MESS
+        tors_future = executor.submit(
+            mess_torsions, mess_script_str, run_dir, mess_geo, mess_hr_str)
+
+        # Calculate the projected vibrational frequencies using ProjRot
+        print('running projrot three times at once, with different rotor '
+              'distance cutoffs:')
+        projrot_futures = tuple(
+            executor.submit(
+                frequencies, projrot_script_str,
+                os.path.join(run_dir, str(run_idx+1)),
+                [projrot_geo], [[]], [hess],
+                rotors_str=projrot_hr_str, aux_dct=aux_dct)
+            for run_idx, aux_dct in enumerate(aux_dcts))
+
+        tors_freqs, _ = tors_future.result()
+
+        rt_freqs1, rth_freqs1, rt_imag1, _ = projrot_futures[0].result()
+        _, rth_freqs2, rt_imag2, _ = projrot_futures[1].result()
+
+        if not rth_freqs2:
+            print('no frequencies from the second projrot run, '
+                  'using the third:')
+            _, rth_freqs2, rt_imag2, _ = projrot_futures[2].result()
+            if rth_freqs2:
+                print(
+                    'it did work, make sure these frequencies look alright:',
+                    rth_freqs2)
+
     # Calculate ZPVEs from all harmonic freqs and torsional freqs
     tors_zpe = (sum(tors_freqs) / 2.0) * phycon.WAVEN2EH
     harm_zpe = (sum(rt_freqs1) / 2.0) * phycon.WAVEN2EH
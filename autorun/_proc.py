@@ -2,13 +2,12 @@
 """
 
 import os
-import random
 import errno
+import itertools
 import datetime
 import signal
 import multiprocessing
 from functools import wraps
-import numpy
 
 
 def utc_time():
@@ -33,11 +32,132 @@ def set_nprocs(nobjs, nprocs='auto'):
         raise NotImplementedError
 
     # Set number of processors equal to obj number if more available
-    _nprocs = min(_nprocs, nobjs)
+    _nprocs = max(min(_nprocs, nobjs), 1)
 
     return _nprocs
 
 
+def set_chunksize(nobjs, nprocs):
+    """ Set the number of objects handed to a worker at a time
+
+        Objects are sent in chunks of about a quarter of an even share, so
+        that workers which finish early pick up the remaining chunks
+        rather than waiting on a slow one.
+
+        :param nobjs: number of objects to process
+        :type nobjs: int
+        :param nprocs: number of worker processes
+        :type nprocs: int
+        :rtype: int
+    """
+    chunksize, extra = divmod(nobjs, 4 * nprocs)
+    if extra:
+        chunksize += 1
+
+    return max(chunksize, 1)
+
+
+class WorkerPool():
+    """ Persistent pool of worker processes that apply one function,
+        fxn(obj, *args), to the objects passed to them.
+
+        The workers are forked once when the pool is built and are reused
+        by every call to map, so the function and arguments need not be
+        picklable; only the objects and results are sent between processes.
+        Workers pull chunks of objects as they become free, results are
+        returned in the order of the objects, and an exception raised by
+        the function is raised again in the calling process.
+
+        The pool may be used as a context manager, which closes it on exit.
+    """
+
+    def __init__(self, fxn, args=(), nprocs='auto'):
+        self.fxn = fxn
+        self.args = tuple(args)
+        self.nprocs = set_nprocs(float('inf'), nprocs=nprocs)
+        self._pool = None
+        if self.nprocs > 1:
+            ctx = multiprocessing.get_context('fork')
+            self._pool = ctx.Pool(
+                self.nprocs,
+                initializer=_init_worker,
+                initargs=(fxn, self.args))
+
+    def imap(self, objs, chunksize=None):
+        """ Lazily apply the function to each object, in order
+
+            :param objs: objects to apply the function to
+            :type objs: list
+            :param chunksize: number of objects sent to a worker at a time
+            :type chunksize: int
+        """
+        objs = tuple(objs)
+        if self._pool is None:
+            return (self.fxn(obj, *self.args) for obj in objs)
+
+        if chunksize is None:
+            chunksize = set_chunksize(len(objs), self.nprocs)
+
+        return self._pool.imap(_call_worker, objs, chunksize=chunksize)
+
+    def map(self, objs, chunksize=None):
+        """ Apply the function to each object
+
+            :param objs: objects to apply the function to
+            :type objs: list
+            :param chunksize: number of objects sent to a worker at a time
+            :type chunksize: int
+            :returns: the results for each object, in order
+            :rtype: tuple
+        """
+        return tuple(self.imap(objs, chunksize=chunksize))
+
+    def close(self):
+        """ Shut down the worker processes
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _exc_tb):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+
+def parallel_map(fxn, objs, args=(), nprocs='auto', chunksize=None):
+    """ Apply a function, fxn(obj, *args), to each of a list of objects
+        across multiple processors, using a pool built for this call.
+
+        Use a WorkerPool directly to reuse the workers across calls.
+
+        :param fxn: function to apply
+        :type fxn: function
+        :param objs: objects to apply the function to
+        :type objs: list
+        :param args: additional arguments passed to the function
+        :type args: tuple
+        :param nprocs: number of processors
+        :type nprocs: int, str, or None
+        :param chunksize: number of objects sent to a worker at a time
+        :type chunksize: int
+        :returns: the results for each object, in order
+        :rtype: tuple
+    """
+
+    objs = tuple(objs)
+    nprocs = set_nprocs(len(objs), nprocs=nprocs)
+    with WorkerPool(fxn, args=args, nprocs=nprocs) as pool:
+        results = pool.map(objs, chunksize=chunksize)
+
+    return results
+
+
 def execute_function_in_parallel(fxn, objs, args, nprocs='auto'):
     """ MultiProcessing wrapper function that can execute some
         function using a set of arguments across multiple processors.
@@ -51,54 +171,66 @@ def execute_function_in_parallel(fxn, objs, args, nprocs='auto'):
         where:
         objs is a list of objects that the task will execute over
         output_queue is a variable for a multiprocessing.Queue()
-    """
 
-    # Allot number of objects for each processor
-    num_obj = len(objs)
-    rand_objs = numpy.empty((num_obj,), dtype=object)
+        The objects are handed out in small chunks through a WorkerPool,
+        and the outputs are returned in the order of the objects.
+    """
 
-    nprocs = set_nprocs(num_obj, nprocs=nprocs)
-    # Randomize objects the objects (for distributing workload?)
-    # This function may it very hard to debug - removed for now
-    # obj_per_proc = math.ceiling(num_obj / nprocs)
+    objs = tuple(objs)
+    nprocs = set_nprocs(len(objs), nprocs=nprocs)
     if nprocs > 1:
-        rand_objs[:] = random.sample(objs, num_obj)
         print('Begin parallel job array on {:g} processors'.format(nprocs))
-    else:
-        # rand_objs[:] = objs
-        rand_objs = objs
-    rand_objs = numpy.array(rand_objs, dtype=object)
-    rand_objs_splt = numpy.array_split(rand_objs, nprocs)
-
-    # Loop over each processor and launch the process
-    output_queue = multiprocessing.Queue()
-    procs = []
-    for proc_n in range(nprocs):
-
-        # Generate list of objects to work with for each processor
-        # obj_start = proc_n * obj_per_proc
-        # obj_end = (proc_n+1) * obj_per_proc
-        # if proc_n != nprocs-1 else num_obj
-        # obj_lst = rand_objs[obj_start:obj_end]
-        obj_lst = rand_objs_splt[proc_n]
-        # Create full args to pass to function including
-        fxn_args = tuple(args) + (obj_lst, output_queue)
-
-        # Create a process object for each processor; Launch associated process
-        proc = multiprocessing.Process(target=fxn, args=fxn_args)
-        procs.append(proc)
-        proc.start()
-
-    # Collect the results of each process together
-    output_lst = ()
-    for _ in procs:
-        output_lst += output_queue.get()
-
-    # Wait for all processes to finish
-    for proc in procs:
-        proc.join()
-
-    return output_lst
+
+    chunksize = set_chunksize(len(objs), nprocs)
+    obj_lsts = tuple(objs[idx:idx+chunksize]
+                     for idx in range(0, len(objs), chunksize))
+    outputs = parallel_map(
+        _call_with_queue, obj_lsts, args=(fxn, tuple(args)), nprocs=nprocs,
+        chunksize=1)
+
+    return tuple(itertools.chain.from_iterable(outputs))
+
+
+class _OutputQueue():
+    """ Stand-in for the multiprocessing.Queue passed to functions run by
+        execute_function_in_parallel, collecting what they put to it
+    """
+
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        """ Collect an item
+        """
+        self.items.append(item)
+
+
+def _call_with_queue(obj_lst, fxn, args):
+    """ Call a function written for execute_function_in_parallel on a list
+        of objects and return everything it put to its output queue
+    """
+    output_queue = _OutputQueue()
+    fxn(*args, obj_lst, output_queue)
+
+    return tuple(itertools.chain.from_iterable(output_queue.items))
+
+
+_WORKER_FXN = None
+_WORKER_ARGS = ()
+
+
+def _init_worker(fxn, args):
+    """ Bind the function and its arguments in a worker process
+    """
+    global _WORKER_FXN, _WORKER_ARGS  # pylint: disable=global-statement
+    _WORKER_FXN = fxn
+    _WORKER_ARGS = args
+
+
+def _call_worker(obj):
+    """ Apply the function bound in this worker process to an object
+    """
+    return _WORKER_FXN(obj, *_WORKER_ARGS)
 
 
 def timeout(seconds=10, error_message=os.strerror(errno.ETIME)):
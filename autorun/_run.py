@@ -5,6 +5,7 @@ import os
 import subprocess
 import warnings
 import stat
+from autorun import _cache
 
 
 SCRIPT_NAME = 'run.sh'
@@ -19,6 +20,11 @@ def from_input_string(script_str, run_dir, input_str,
                       output_names=(OUTPUT_NAME,)):
     """ run the program in a temporary directory and return the output
 
+        If a result cache has been turned on with autorun.enable_cache, the
+        outputs of an identical earlier run are returned without running
+        the program (or writing to run_dir), and the outputs of runs that
+        finish successfully are stored.
+
         :param script_str: string of bash script that contains
             execution instructions electronic structure job
         :type script_str: str
@@ -30,10 +36,22 @@ def from_input_string(script_str, run_dir, input_str,
         :rtype: str
     """
 
+    cache = _cache.active_cache()
+    if cache is not None:
+        key = cache.key(script_str, input_str, aux_dct=aux_dct,
+                        script_name=script_name, input_name=input_name,
+                        output_names=output_names)
+        output_strs = cache.get(key)
+        if output_strs is not None:
+            return output_strs
+
     write_input(run_dir, input_str, aux_dct=aux_dct, input_name=input_name)
-    run_script(script_str, run_dir, script_name=script_name)
+    exit_code = run_script(script_str, run_dir, script_name=script_name)
     output_strs = read_output(run_dir, output_names=output_names)
 
+    if cache is not None and exit_code == 0:
+        cache.put(key, output_strs)
+
     return output_strs
 
 
@@ -101,76 +119,117 @@ def write_input(run_dir, input_str,
                 aux_dct=None,
                 input_name=INPUT_NAME):
     """ write the input
+
+        Files are written with paths joined to the run directory, rather than
+        by changing the working directory of the process, so that several
+        jobs may be set up at once from threads of the same process.
     """
 
     if not os.path.exists(run_dir):
-        os.makedirs(run_dir)
-
-    with EnterDirectory(run_dir):
+        os.makedirs(run_dir, exist_ok=True)
 
-        # Write the main input file
-        with open(input_name, mode='w', encoding='utf-8') as input_obj:
-            input_obj.write(input_str)
+    # Write the main input file
+    input_path = os.path.join(run_dir, input_name)
+    with open(input_path, mode='w', encoding='utf-8') as input_obj:
+        input_obj.write(input_str)
 
-        # Write all auxiliary input files
-        if aux_dct is not None:
-            for fname, fstring in aux_dct.items():
-                if fstring:
-                    with open(fname, mode='w', encoding='utf-8') as aux_obj:
-                        aux_obj.write(fstring)
+    # Write all auxiliary input files
+    if aux_dct is not None:
+        for fname, fstring in aux_dct.items():
+            if fstring:
+                aux_path = os.path.join(run_dir, fname)
+                with open(aux_path, mode='w', encoding='utf-8') as aux_obj:
+                    aux_obj.write(fstring)
 
 
 def read_output(run_dir, output_names=(OUTPUT_NAME,)):
     """ Read the output string from the run directory
     """
 
-    with EnterDirectory(run_dir):
+    _assert_is_directory(run_dir)
 
-        output_strs = ()
-        for out_name in output_names:
-            if os.path.exists(out_name):
-                if os.path.isfile(out_name):
-                    with open(out_name, mode='r', encoding='utf-8') as out_obj:
-                        output_str = out_obj.read()
-                else:
-                    output_str = None
+    output_strs = ()
+    for out_name in output_names:
+        out_path = os.path.join(run_dir, out_name)
+        if os.path.exists(out_path):
+            if os.path.isfile(out_path):
+                with open(out_path, mode='r', encoding='utf-8') as out_obj:
+                    output_str = out_obj.read()
             else:
                 output_str = None
-            output_strs += (output_str,)
+        else:
+            output_str = None
+        output_strs += (output_str,)
 
     return output_strs
 
 
 def run_script(script_str, run_dir, script_name=SCRIPT_NAME):
     """ run a program from a script
+
+        The script is run with the run directory as its working directory,
+        set for the subprocess only, so the calling process never changes
+        its own working directory.
+
+        :returns: exit code of the script
+        :rtype: int
     """
 
-    with EnterDirectory(run_dir):
-
-        # Write the submit script to the run directory
-        with open(script_name, mode='w', encoding='utf-8') as script_obj:
-            script_obj.write(script_str)
-
-        # Make the script executable
-        os.chmod(
-            script_name,
-            mode=(os.stat(script_name).st_mode |
-                  stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
-
-        # Call the program
-        # print('run test',run_dir,script_name)
-        # print('script',script_str)
-        try:
-            subprocess.check_call(f'./{script_name:s}')
-        except subprocess.CalledProcessError:
-            msg = f'Program run failed in {run_dir}'
-            warnings.warn(msg)
-        # except subprocess.CalledProcessError as err:
-            # As long as the program wrote an output, continue with a warning
-            # if all(os.path.isfile(name) for name in output_names):
-            #     warnings.warn("Program run failed in {}".format(run_dir))
-            # else:
-            #     raise err
+    script_path = write_script(script_str, run_dir, script_name=script_name)
+
+    # Call the program
+    exit_code = 0
+    try:
+        subprocess.check_call(script_path, cwd=run_dir)
+    except subprocess.CalledProcessError as err:
+        exit_code = err.returncode
+        msg = f'Program run failed in {run_dir}'
+        warnings.warn(msg)
+    # except subprocess.CalledProcessError as err:
+        # As long as the program wrote an output, continue with a warning
+        # if all(os.path.isfile(name) for name in output_names):
+        #     warnings.warn("Program run failed in {}".format(run_dir))
+        # else:
+        #     raise err
+
+    return exit_code
+
+
+def write_script(script_str, run_dir, script_name=SCRIPT_NAME):
+    """ Write an executable script to the run directory
+
+        :param script_str: string of bash script
+        :type script_str: str
+        :param run_dir: directory to write the script to
+        :type run_dir: str
+        :param script_name: name of the script file
+        :type script_name: str
+        :returns: absolute path to the script
+        :rtype: str
+    """
+
+    _assert_is_directory(run_dir)
+
+    # Write the submit script to the run directory
+    script_path = os.path.abspath(os.path.join(run_dir, script_name))
+    with open(script_path, mode='w', encoding='utf-8') as script_obj:
+        script_obj.write(script_str)
+
+    # Make the script executable
+    os.chmod(
+        script_path,
+        mode=(os.stat(script_path).st_mode |
+              stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
+
+    return script_path
+
+
+def _assert_is_directory(run_dir):
+    """ Check that the run directory exists
+    """
+    assert os.path.isdir(run_dir), (
+        f'{run_dir} is not a directory'
+    )
 
 
 class EnterDirectory():
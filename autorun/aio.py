@@ -0,0 +1,210 @@
+""" Asynchronous counterparts of the script runners in autorun._run
+
+    Jobs are launched with asyncio subprocesses so that many short runs of
+    an external program can be kept in flight from a single process, with
+    the number running at once bounded by a semaphore.
+
+    Each runner returns the exit code of the script alongside its outputs;
+    a script that is killed for running past its timeout returns the
+    negative number of the signal used to stop it, as in subprocess.
+"""
+
+import os
+import signal
+import asyncio
+import warnings
+from autorun._run import SCRIPT_NAME
+from autorun._run import INPUT_NAME
+from autorun._run import OUTPUT_NAME
+from autorun._run import write_input
+from autorun._run import write_script
+from autorun._run import read_output
+from autorun._proc import set_nprocs
+from autorun import _cache
+
+
+def semaphore(nprocs='auto'):
+    """ Build a semaphore limiting the number of jobs run at once
+
+        :param nprocs: number of concurrent jobs; 'auto' for all but one
+            of the available cores, None for one job at a time
+        :type nprocs: int, str, or None
+        :rtype: asyncio.Semaphore
+    """
+
+    return asyncio.Semaphore(set_nprocs(float('inf'), nprocs=nprocs))
+
+
+async def run_script(script_str, run_dir,
+                     script_name=SCRIPT_NAME,
+                     timeout=None,
+                     sem=None):
+    """ run a program from a script without blocking the event loop
+
+        If the task is cancelled, or the timeout runs out, the script
+        process is killed before returning.
+
+        :param script_str: string of bash script
+        :type script_str: str
+        :param run_dir: directory to run the script in
+        :type run_dir: str
+        :param timeout: seconds to wait on the script before killing it
+        :type timeout: float
+        :param sem: semaphore bounding the number of running scripts
+        :type sem: asyncio.Semaphore
+        :returns: exit code of the script
+        :rtype: int
+    """
+
+    script_path = write_script(script_str, run_dir, script_name=script_name)
+
+    if sem is None:
+        exit_code = await _run_process(script_path, run_dir, timeout)
+    else:
+        async with sem:
+            exit_code = await _run_process(script_path, run_dir, timeout)
+
+    return exit_code
+
+
+async def from_input_string(script_str, run_dir, input_str,
+                            aux_dct=None,
+                            script_name=SCRIPT_NAME,
+                            input_name=INPUT_NAME,
+                            output_names=(OUTPUT_NAME,),
+                            timeout=None,
+                            sem=None):
+    """ run the program in a directory and return the output
+
+        If a result cache has been turned on with autorun.enable_cache, the
+        outputs of an identical earlier run are returned with an exit code
+        of 0 without running the program (or writing to run_dir), and the
+        outputs of runs that finish successfully are stored, as in
+        autorun.from_input_string.
+
+        :param script_str: string of bash script that contains
+            execution instructions electronic structure job
+        :type script_str: str
+        :param run_dir: name of directory to run electronic structure job
+        :type run_dir: str
+        :param input_str: string of input file for electronic structure job
+        :type input_str: str
+        :param timeout: seconds to wait on the script before killing it
+        :type timeout: float
+        :param sem: semaphore bounding the number of running scripts
+        :type sem: asyncio.Semaphore
+        :returns: the output strings and the exit code of the script
+        :rtype: (tuple(str), int)
+    """
+
+    cache = _cache.active_cache()
+    if cache is not None:
+        key = cache.key(script_str, input_str, aux_dct=aux_dct,
+                        script_name=script_name, input_name=input_name,
+                        output_names=output_names)
+        output_strs = cache.get(key)
+        if output_strs is not None:
+            return output_strs, 0
+
+    write_input(run_dir, input_str, aux_dct=aux_dct, input_name=input_name)
+    exit_code = await run_script(
+        script_str, run_dir,
+        script_name=script_name, timeout=timeout, sem=sem)
+    output_strs = read_output(run_dir, output_names=output_names)
+
+    if cache is not None and exit_code == 0:
+        cache.put(key, output_strs)
+
+    return output_strs, exit_code
+
+
+async def from_parallel_input_strings(script_str, run_dir, input_strs,
+                                      aux_dct=None,
+                                      script_name=SCRIPT_NAME,
+                                      input_name=INPUT_NAME,
+                                      output_names=(OUTPUT_NAME,),
+                                      timeout=None,
+                                      nprocs='auto',
+                                      sem=None):
+    """ Runs a bunch of processes concurrently with following structure
+            run_dir/run1
+                    run2
+                    run3
+
+        where run[n] contains the input files for one instance of the
+        program (assuming aux_dct files same for each run). Unlike the
+        blocking version, script_str runs a single instance and is
+        launched in each of the run[n] directories, with at most nprocs
+        instances running at once.
+
+        :param script_str: string of bash script that contains
+            execution instructions for a single job
+        :type script_str: str
+        :param run_dir: name of directory to run the jobs in
+        :type run_dir: str
+        :param input_strs: strings of input files for each job
+        :type input_strs: tuple(str)
+        :param timeout: seconds to wait on each script before killing it
+        :type timeout: float
+        :param nprocs: number of jobs to run at once, if sem is not given
+        :type nprocs: int, str, or None
+        :param sem: semaphore bounding the number of running scripts
+        :type sem: asyncio.Semaphore
+        :returns: the output strings and exit code of each job, in order
+        :rtype: tuple((tuple(str), int))
+    """
+
+    if sem is None:
+        sem = semaphore(nprocs=nprocs)
+
+    tasks = ()
+    for run_idx, input_str in enumerate(input_strs):
+        sub_run_dir = os.path.join(run_dir, f'run{run_idx+1}')
+        tasks += (from_input_string(
+            script_str, sub_run_dir, input_str,
+            aux_dct=aux_dct,
+            script_name=script_name,
+            input_name=input_name,
+            output_names=output_names,
+            timeout=timeout,
+            sem=sem),)
+
+    return tuple(await asyncio.gather(*tasks))
+
+
+async def _run_process(script_path, run_dir, timeout):
+    """ Run the script as a subprocess and wait on it, killing it if the
+        waiting task is cancelled or the timeout runs out
+    """
+
+    # Start the script in its own session so that killing it also
+    # stops any programs it has launched
+    proc = await asyncio.create_subprocess_exec(
+        script_path, cwd=run_dir, start_new_session=True)
+    try:
+        exit_code = await asyncio.wait_for(proc.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        exit_code = await _kill(proc)
+        warnings.warn(f'Program run timed out in {run_dir}')
+    except asyncio.CancelledError:
+        await _kill(proc)
+        raise
+    else:
+        if exit_code != 0:
+            warnings.warn(f'Program run failed in {run_dir}')
+
+    return exit_code
+
+
+async def _kill(proc):
+    """ Kill a subprocess, along with its process group, and wait for it
+        to exit
+    """
+
+    if proc.returncode is None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    return await proc.wait()
@@ -0,0 +1,92 @@
+""" test autorun.aio
+"""
+
+import os
+import time
+import asyncio
+import tempfile
+import warnings
+import autorun
+
+
+SCRIPT_STR = (
+    '#!/usr/bin/env bash\n'
+    'sleep 0.5\n'
+    'cat run.inp aux.txt > run.out\n'
+)
+
+
+def test__from_input_string():
+    """ test autorun.aio.from_input_string
+    """
+
+    run_dir = tempfile.mkdtemp()
+    output_strs, exit_code = asyncio.run(autorun.aio.from_input_string(
+        SCRIPT_STR, run_dir, 'input\n', aux_dct={'aux.txt': 'aux\n'}))
+
+    assert exit_code == 0
+    assert output_strs == ('input\naux\n',)
+
+
+def test__from_parallel_input_strings():
+    """ test autorun.aio.from_parallel_input_strings
+    """
+
+    run_dir = tempfile.mkdtemp()
+    input_strs = tuple(f'input {idx}\n' for idx in range(6))
+
+    start = time.time()
+    results = asyncio.run(autorun.aio.from_parallel_input_strings(
+        SCRIPT_STR, run_dir, input_strs,
+        aux_dct={'aux.txt': 'aux\n'}, nprocs=6))
+    assert time.time() - start < 6 * 0.5
+
+    assert tuple(exit_code for _, exit_code in results) == (0,) * 6
+    assert tuple(output_strs for output_strs, _ in results) == tuple(
+        (f'{input_str}aux\n',) for input_str in input_strs)
+    assert os.path.isfile(os.path.join(run_dir, 'run6', 'run.out'))
+
+
+def test__from_input_string_cache():
+    """ test autorun.aio.from_input_string with the result cache enabled
+    """
+
+    run_dir = tempfile.mkdtemp()
+    cache = autorun.enable_cache(tempfile.mkdtemp())
+    try:
+        for idx in range(2):
+            output_strs, exit_code = asyncio.run(
+                autorun.aio.from_input_string(
+                    SCRIPT_STR, os.path.join(run_dir, str(idx)), 'input\n',
+                    aux_dct={'aux.txt': 'aux\n'}))
+            assert exit_code == 0
+            assert output_strs == ('input\naux\n',)
+    finally:
+        autorun.disable_cache()
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert not os.path.exists(os.path.join(run_dir, '1'))
+
+
+def test__timeout():
+    """ test autorun.aio.run_script timeouts and exit codes
+    """
+
+    run_dir = tempfile.mkdtemp()
+
+    with warnings.catch_warnings(record=True) as wrns:
+        warnings.simplefilter('always')
+        exit_code = asyncio.run(autorun.aio.run_script(
+            '#!/usr/bin/env bash\nsleep 10\n', run_dir, timeout=0.2))
+        assert exit_code < 0
+        exit_code = asyncio.run(autorun.aio.run_script(
+            '#!/usr/bin/env bash\nexit 3\n', run_dir))
+        assert exit_code == 3
+    assert len(wrns) == 2
+
+
+if __name__ == '__main__':
+    test__from_input_string()
+    test__from_parallel_input_strings()
+    test__from_input_string_cache()
+    test__timeout()
@@ -0,0 +1,82 @@
+""" test the autorun result cache
+"""
+
+import os
+import tempfile
+import autorun
+
+
+SCRIPT_STR = (
+    '#!/usr/bin/env bash\n'
+    'cat run.inp aux.txt > run.out\n'
+    'echo run >> ../count.txt\n'
+)
+
+
+def _run_count(run_dir):
+    """ Count the times the script was run under a directory
+    """
+    count_path = os.path.join(run_dir, 'count.txt')
+    if not os.path.exists(count_path):
+        return 0
+    with open(count_path, mode='r', encoding='utf-8') as count_obj:
+        return len(count_obj.read().splitlines())
+
+
+def test__from_input_string():
+    """ test autorun.from_input_string with the result cache enabled
+    """
+
+    run_dir = tempfile.mkdtemp()
+    cache = autorun.enable_cache(tempfile.mkdtemp())
+    try:
+        for idx in range(3):
+            output_strs = autorun.from_input_string(
+                SCRIPT_STR, os.path.join(run_dir, str(idx)), 'input\n',
+                aux_dct={'aux.txt': 'aux\n'})
+            assert output_strs == ('input\naux\n',)
+        assert _run_count(run_dir) == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        # A change to any input file is a new run
+        output_strs = autorun.from_input_string(
+            SCRIPT_STR, os.path.join(run_dir, '3'), 'input\n',
+            aux_dct={'aux.txt': 'other aux\n'})
+        assert output_strs == ('input\nother aux\n',)
+        assert _run_count(run_dir) == 2
+    finally:
+        autorun.disable_cache()
+
+    # With the cache off, the program is run again
+    autorun.from_input_string(
+        SCRIPT_STR, os.path.join(run_dir, '4'), 'input\n',
+        aux_dct={'aux.txt': 'aux\n'})
+    assert _run_count(run_dir) == 3
+
+
+def test__eviction():
+    """ test the size bound of autorun.ResultCache
+    """
+
+    cache = autorun.ResultCache(tempfile.mkdtemp(), max_size=2000)
+    keys = tuple(cache.key('script', f'input {idx}') for idx in range(10))
+    for key in keys:
+        cache.put(key, ('x' * 500,))
+        assert cache.size() <= 2000
+
+    assert cache.get(keys[-1]) == ('x' * 500,)
+    assert cache.get(keys[0]) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Storing a key again replaces its entry, leaving the others
+    for _ in range(5):
+        cache.put(keys[-1], ('x' * 500,))
+    assert cache.get(keys[-2]) == ('x' * 500,)
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+if __name__ == '__main__':
+    test__from_input_string()
+    test__eviction()
@@ -34,7 +34,41 @@ def test__():
     results2 = autorun.execute_function_in_parallel(
         _adder, adder_input, adder_args, nprocs=1)
     assert set(results1) == set(results2) == {29, 33, 38}
+    assert results1 == results2 == (29, 33, 38)
+
+
+def test__pool():
+    """ test autorun.parallel_map and autorun.WorkerPool
+    """
+
+    offset = 3
+
+    def _scale(num, factor):
+        """ Test function using a closure, so it cannot be pickled
+        """
+        if num < 0:
+            raise ValueError(f'negative number {num}')
+        return factor * num + offset
+
+    nums = tuple(range(50))
+    ref_results = tuple(2 * num + 3 for num in nums)
+
+    assert autorun.parallel_map(_scale, nums, args=(2,), nprocs=1) == (
+        ref_results)
+    assert autorun.parallel_map(_scale, nums, args=(2,), nprocs=3) == (
+        ref_results)
+
+    with autorun.WorkerPool(_scale, args=(2,), nprocs=3) as pool:
+        assert pool.map(nums) == ref_results
+        assert pool.map(nums[::-1], chunksize=1) == ref_results[::-1]
+        try:
+            pool.map((1, -1, 2))
+            raised = False
+        except ValueError:
+            raised = True
+        assert raised
 
 
 if __name__ == '__main__':
     test__()
+    test__pool()
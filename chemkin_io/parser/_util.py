@@ -0,0 +1,69 @@
+""" Utilities shared by the parsers
+"""
+
+import os
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+
+def set_nprocs(nobjs, nprocs=None):
+    """ Set the number of processes used to parse a number of objects
+
+        :param nobjs: number of objects to be parsed
+        :type nobjs: int
+        :param nprocs: number of processes; None for serial, 'auto' for
+            all of the available cores
+        :type nprocs: int, str, or None
+        :rtype: int
+    """
+
+    if nprocs is None:
+        _nprocs = 1
+    elif nprocs == 'auto':
+        _nprocs = os.cpu_count() or 1
+    elif isinstance(nprocs, int) and not isinstance(nprocs, bool):
+        _nprocs = nprocs
+    else:
+        raise ValueError(
+            f"Invalid nprocs: {nprocs}. Options: None, 'auto', or an int")
+
+    return max(min(_nprocs, nobjs), 1)
+
+
+def map_chunks(fxn, objs, args=(), nprocs=None):
+    """ Apply a function to contiguous chunks of a list of objects,
+        in a process pool if more than one process is requested,
+        and join the results back together in the original order
+
+        The function is called as fxn(chunk, *args) and must return a list;
+        it must be defined at module level so it can be sent to the pool.
+
+        :param fxn: function that parses a chunk of objects
+        :type fxn: function
+        :param objs: objects to parse
+        :type objs: list
+        :param args: additional arguments passed to fxn
+        :type args: tuple
+        :param nprocs: number of processes; None for serial, 'auto' for
+            all of the available cores
+        :type nprocs: int, str, or None
+        :rtype: list
+    """
+
+    objs = list(objs)
+    nprocs = set_nprocs(len(objs), nprocs=nprocs)
+
+    if nprocs == 1:
+        return list(fxn(objs, *args))
+
+    # Split into nearly equal contiguous chunks so the order is kept
+    nchunk, nextra = divmod(len(objs), nprocs)
+    bounds = list(itertools.accumulate(
+        [0] + [nchunk + 1] * nextra + [nchunk] * (nprocs - nextra)))
+    chunks = [objs[start:end] for start, end in zip(bounds, bounds[1:])]
+
+    with ProcessPoolExecutor(max_workers=nprocs) as executor:
+        futures = [executor.submit(fxn, chunk, *args) for chunk in chunks]
+        results = [future.result() for future in futures]
+
+    return list(itertools.chain.from_iterable(results))
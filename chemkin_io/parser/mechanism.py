@@ -30,18 +30,22 @@ def species_block(mech_str, remove_comments=True):
     return block_str
 
 
-def reactions(mech_str):
+def reactions(mech_str, nprocs=None):
     """Parses all of the chemical equations and corresponding fitting from the
     mechanism file.
 
     :param mech_str: string of mechanism input file
     :type mech_str: str
+    :param nprocs: number of processes to parse the reactions with;
+        None (default) parses them serially
+    :type nprocs: int, str, or None
     :return rxn_param_dct: dct {rxn1: params1, rxn2: ...}
     :rtype: dict
     """
     ea_units, a_units = reaction_units(mech_str)
     block_str = reaction_block(mech_str, remove_comments=True)
-    rxn_param_dct = get_rxn_param_dct(block_str, ea_units, a_units)
+    rxn_param_dct = get_rxn_param_dct(
+        block_str, ea_units, a_units, nprocs=nprocs)
 
     return rxn_param_dct
 
@@ -1,7 +1,7 @@
 """ functions operating on the reactions block string
 """
 
-import collections
+import functools
 import itertools
 import numpy as np
 import pyparsing as pp
@@ -12,6 +12,7 @@ import autoparse.find as apf
 from autoparse import cast as ap_cast
 from ioformat import headlined_sections
 from ioformat import remove_comment_lines
+from chemkin_io.parser._util import map_chunks
 
 
 # gearing up to replace autoparse with pyparsing
@@ -105,8 +106,30 @@ COMMENTS_PATTERN = app.escape("!") + app.capturing(app.one_or_more(app.WILDCARD2
 
 BAD_STRS = ["inf", "INF", "nan"]
 
+# Linear-time patterns for the usual form of the reaction equation line,
+# "RCT1 + RCT2 (+M) = PRD1 + PRD2 (+M)  A  n  Ea"; lines that do not fit
+# this form are read with the general (backtracking) patterns above
+RXN_LINE_CACHE_SIZE = 2 ** 14
+_LINE_SPECIES_NAME = r"[A-Za-z0-9#,()_*\[\]][A-Za-z0-9#,()\-_*\[\]]*"
+_LINE_PAREN_THIRD_BODY = r"\([ \t]*\+[^()+=<>\s]+\)"
+_LINE_REAGENTS = (
+    r"{0}(?:[ \t]*\+[ \t]*{0})*(?:[ \t]*{1})?".format(
+        _LINE_SPECIES_NAME, _LINE_PAREN_THIRD_BODY)
+)
+_LINE_PRODUCTS = (
+    r"\d*\.?\d*{0}(?:[ \t]*\+[ \t]*\d*\.?\d*{0})*(?:[ \t]*{1})?".format(
+        _LINE_SPECIES_NAME, _LINE_PAREN_THIRD_BODY)
+)
+RXN_EQUATION_PATTERN = (
+    app.STRING_START
+    + app.capturing(_LINE_REAGENTS)
+    + app.padded(CHEMKIN_ARROW)
+    + app.capturing(_LINE_PRODUCTS)
+    + app.STRING_END
+)
+
 
-def get_rxn_param_dct(block_str, ea_units, a_units):
+def get_rxn_param_dct(block_str, ea_units, a_units, nprocs=None):
     """Parses all of the chemical equations and corresponding fitting
     parameters in the reactions block of the mechanism input file
     and subsequently pulls all of the species names and fitting
@@ -118,6 +141,9 @@ def get_rxn_param_dct(block_str, ea_units, a_units):
     :type ea_units: str
     :param a_units: units of rate constants; either 'moles' or 'molecules'
     :type a_units: str
+    :param nprocs: number of processes to parse the reactions with;
+        None (default) parses them serially
+    :type nprocs: int, str, or None
     :return rxn_param_dct: dct {rxn1: params1, rxn2: ...}
     :rtype: dict
     """
@@ -125,14 +151,12 @@ def get_rxn_param_dct(block_str, ea_units, a_units):
     rxn_strs = get_rxn_strs(block_str)
 
     if rxn_strs is not None:
-        # Loop over each reaction string, creating a RxnParams object for each
-        rxns = []
-        params_lst = []
-        for rxn_str in rxn_strs:
-            rxn = get_rxn_name(rxn_str)
-            params = get_params(rxn_str, ea_units, a_units)
-            rxns.append(rxn)
-            params_lst.append(params)
+        # Create a RxnParams object for each reaction string, splitting the
+        # reactions into contiguous chunks if parsing in parallel
+        rxn_params = map_chunks(
+            _rxns_and_params, rxn_strs, args=(ea_units, a_units), nprocs=nprocs)
+        rxns = [rxn for rxn, _ in rxn_params]
+        params_lst = [params for _, params in rxn_params]
 
         # Fix any duplicates
         rxns, params_lst = fix_duplicates(rxns, params_lst)
@@ -148,41 +172,39 @@ def get_rxn_param_dct(block_str, ea_units, a_units):
 def get_rxn_osclass_dct(block_str):
     """returns the reaction class according to the notation
     !#[REACTIONCLASS][species type][reaction type]
-    function looks ugly but couldn't find a better way..
     :param block_str: raw string for the entire reactions block
     :type block_str: str
     :return block_dct: dct {rxn1: str, rxn2: ...}
     :rtype: dict
     """
-    block_strs_lst = np.array(block_str.split("\n"))
-    block_str_nocmt = apf.remove(COMMENTS_PATTERN, block_str)
-    rxn_strs = get_rxn_strs(block_str_nocmt)
+    block_strs_lst = block_str.split("\n")
+    rxn_strs, line_idxs_lst = _rxn_strs_with_line_idxs(block_str)
 
-    rxn_osclass_dct = {}
-    rxnclass_start = np.array(
-        [i for i, line in enumerate(block_strs_lst) if "#[REACTIONCLASS]" in line]
-    )
-    rxnclassend = np.array(
-        [i for i, line in enumerate(block_strs_lst) if "#[ENDREACTIONCLASS]" in line]
-    )
+    rxnclass_start = [
+        i for i, line in enumerate(block_strs_lst) if "#[REACTIONCLASS]" in line]
+    rxnclassend = [
+        i for i, line in enumerate(block_strs_lst) if "#[ENDREACTIONCLASS]" in line]
 
     speciestype = [
-        line.split("[")[2].split("]")[0] for line in block_strs_lst[rxnclass_start]
+        block_strs_lst[i].split("[")[2].split("]")[0] for i in rxnclass_start
     ]
     reactiontype = [
-        line.split("[")[3].split("]")[0] for line in block_strs_lst[rxnclass_start]
+        block_strs_lst[i].split("[")[3].split("]")[0] for i in rxnclass_start
     ]
 
-    for rxn_str in rxn_strs:
-        rxn = get_rxn_name(rxn_str)
-        rxn_str0 = rxn_str.split("\n")[0]
-        idx = [i for i, line in enumerate(block_strs_lst) if rxn_str0 in line][0]
-        idx_match = np.intersect1d(
-            np.where(idx > rxnclass_start)[0], np.where(idx < rxnclassend)[0]
-        )
+    # label each line with the first class block that encloses it
+    line_class_idxs = [None] * len(block_strs_lst)
+    for cls_idx, (start, end) in enumerate(zip(rxnclass_start, rxnclassend)):
+        for idx in range(start + 1, end):
+            if line_class_idxs[idx] is None:
+                line_class_idxs[idx] = cls_idx
 
-        if len(idx_match) > 0:
-            sptype, rxntype = [speciestype[idx_match[0]], reactiontype[idx_match[0]]]
+    rxn_osclass_dct = {}
+    for rxn_str, line_idxs in zip(rxn_strs, line_idxs_lst):
+        rxn = get_rxn_name(rxn_str)
+        cls_idx = line_class_idxs[line_idxs[0]] if line_idxs else None
+        if cls_idx is not None:
+            sptype, rxntype = [speciestype[cls_idx], reactiontype[cls_idx]]
         else:
             sptype, rxntype = ["", ""]
         rxn_osclass_dct[rxn] = {
@@ -195,38 +217,57 @@ def get_rxn_osclass_dct(block_str):
 
 def get_rxn_strs_dct(block_str):
     """returns the reaction strings
-    function looks ugly but couldn't find a better way..
     :param block_str: raw string for the entire reactions block
     :type block_str: str
     :return block_dct: dct {rxn1: str, rxn2: ...}
     :rtype: dict
     """
     block_strs_lst = block_str.split("\n")
-    block_str_nocmt = apf.remove(COMMENTS_PATTERN, block_str)
-    rxn_strs = get_rxn_strs(block_str_nocmt)
+    rxn_strs, line_idxs_lst = _rxn_strs_with_line_idxs(block_str)
 
     rxn_strs_dct = {}
-    used_indices = [False] * len(block_strs_lst)  # check matched lines
-    for rxn_str in rxn_strs:
+    for rxn_str, line_idxs in zip(rxn_strs, line_idxs_lst):
         rxn = get_rxn_name(rxn_str)
-        rxn_str_orig = []
+        rxn_str_orig = "\n".join(block_strs_lst[idx] for idx in line_idxs)
+        rxn_strs_dct.setdefault(rxn, []).append(rxn_str_orig)
+
+    return rxn_strs_dct
+
+
+def _rxn_strs_with_line_idxs(block_str):
+    """ Get the comment-free reaction strings of a block along with the
+        indices of the lines of the original block each one was read from
+
+        The comments are removed line by line, so that every cleaned line
+        keeps the index of its original line; the reaction lines are then
+        matched to them in a single forward pass.
+
+        :param block_str: raw string for the entire reactions block
+        :type block_str: str
+        :return: reaction strings and original line indices of each
+        :rtype: (tuple(str), tuple(tuple(int)))
+    """
+
+    nocmt_lines = [apf.remove(COMMENTS_PATTERN, line)
+                   for line in block_str.split("\n")]
+    rxn_strs = get_rxn_strs("\n".join(nocmt_lines)) or ()
+
+    line_idxs_lst = []
+    ptr = 0
+    for rxn_str in rxn_strs:
+        line_idxs = []
         for line in rxn_str.split("\n"):
             # skip empty lines
             if line.strip() in ['', 'REACTIONS', 'END']:
                 continue
-            # skip lines 
-            for idx, str_orig in enumerate(block_strs_lst):
-                if line in str_orig and not used_indices[idx]:
-                    rxn_str_orig.append(str_orig)  # add to original list
-                    used_indices[idx] = True  # mark as used
+            for idx in range(ptr, len(nocmt_lines)):
+                if line in nocmt_lines[idx]:
+                    line_idxs.append(idx)
+                    ptr = idx + 1
                     break
+        line_idxs_lst.append(tuple(line_idxs))
 
-        if rxn not in rxn_strs_dct.keys():
-            rxn_strs_dct[rxn] = ["\n".join(rxn_str_orig)]
-        else:
-            rxn_strs_dct[rxn] = rxn_strs_dct[rxn] + ["\n".join(rxn_str_orig)]
-
-    return rxn_strs_dct
+    return tuple(rxn_strs), tuple(line_idxs_lst)
 
 
 def get_rxn_cmt_dct(block_str):
@@ -314,6 +355,19 @@ def get_pes_dct(block_str):
     return pes_dct
 
 
+def _rxns_and_params(rxn_strs, ea_units, a_units):
+    """Parses the reaction key and RxnParams object of each of a list of
+    reaction strings
+
+    :param rxn_strs: raw Chemkin strings for several reactions
+    :type rxn_strs: list(str)
+    :return rxn_params: (rxn, params) for each reaction string
+    :rtype: list(tuple)
+    """
+    return [(get_rxn_name(rxn_str), get_params(rxn_str, ea_units, a_units))
+            for rxn_str in rxn_strs]
+
+
 def get_rxn_name(rxn_str):
     """Parses a rxn_str to get the reaction key
 
@@ -324,6 +378,19 @@ def get_rxn_name(rxn_str):
     """
     # split line; remove last 3 items (always rxn params) and re-join
     rxn_str = ' '.join(rxn_str.split('\n')[0].split()[:-3])
+    return _rxn_name_from_equation(rxn_str)
+
+
+@functools.lru_cache(maxsize=RXN_LINE_CACHE_SIZE)
+def _rxn_name_from_equation(rxn_str):
+    """Parses a reaction equation string to get the reaction key; the
+    results are cached since mechanisms repeat equations (duplicates,
+    and the several readers that each need the key)
+
+    :param rxn_str: chemical equation, without the rate parameters
+    :type rxn_str: str
+    :rtype: tuple ((rct1, rct2, ...), (prd1, prd2, ...), (third_bod1, ...))
+    """
     parse_dct = PP_REACTION_EQUATION.parseString(rxn_str).asDict()
     rcts = list(
         itertools.chain(
@@ -493,40 +560,24 @@ def fix_duplicates(rxns, params_lst):
     :type rxns: list
     :param params: all reaction parameters
     :type params: list
-    :return unique_rxns: unique reaction keys
+    :return unique_rxns: unique reaction keys, in order of first occurrence
     :rtype: list
     :return unique_params: combined reaction params to match unique_rxns
     :rtype: list
     """
 
-    # Get the unique rxns and number of occurrences
-    unique_rxns = list(set(rxns))
-    dup_counts = collections.Counter(rxns)
-    unique_params = []
-
-    # Loop through each unique item, looking for duplicates
-    for unique_rxn in unique_rxns:
-        # Get the index of the first occurrence in the original list
-        prev_match_idx = rxns.index(unique_rxn)
-        # Get the params for the first occurence
-        params = params_lst[prev_match_idx]
-        # Get the number of occurrences of the rxn
-        dup_count = dup_counts[unique_rxn]
-
-        # Loop over each duplicate of the reaction; the 1 in range skips the
-        # first loop and thus won't do any loops if dup_count == 1
-        for _ in range(1, dup_count):
-            # Get the current match index by looking just past the previous one
-            match_idx = rxns.index(unique_rxn, prev_match_idx + 1)
-            # Get the new params to be added to the existing ones
-            new_params = params_lst[match_idx]
-            # Combine the params with the existing ones
-            params.combine_objects(new_params)
-            # Update the search index
-            prev_match_idx = match_idx
-
-        # Append the combined params to the unique params
-        unique_params.append(params)
+    # Group the params by reaction in a single pass, keeping the order of the
+    # first occurrence of each reaction; each duplicate is combined into the
+    # params of the first occurrence
+    rxn_params_dct = {}
+    for rxn, params in zip(rxns, params_lst):
+        if rxn in rxn_params_dct:
+            rxn_params_dct[rxn].combine_objects(params)
+        else:
+            rxn_params_dct[rxn] = params
+
+    unique_rxns = list(rxn_params_dct.keys())
+    unique_params = list(rxn_params_dct.values())
 
     return unique_rxns, unique_params
 
@@ -542,12 +593,16 @@ def rct_names(rxn_str):
     :rtype: tuple(str)
     """
 
-    pattern = _first_line_pattern(
-        rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
-        prd_ptt=SPECIES_NAME_PATTERN_WCOEFFS,
-        param_ptt=COEFF_PATTERN,
-    )
-    string = apf.first_capture(pattern, rxn_str)
+    rxn_line = _split_rxn_line(rxn_str.split("\n")[0])
+    if rxn_line is not None:
+        string = rxn_line[0]
+    else:
+        pattern = _first_line_pattern(
+            rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
+            prd_ptt=SPECIES_NAME_PATTERN_WCOEFFS,
+            param_ptt=COEFF_PATTERN,
+        )
+        string = apf.first_capture(pattern, rxn_str)
     try:
         names = _split_reagent_string(string)
     except TypeError as exc:
@@ -600,12 +655,16 @@ def third_body(rxn_str):
     :rtype: tuple(str)
     """
 
-    pattern = _first_line_pattern(
-        rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
-        prd_ptt=SPECIES_NAME_PATTERN_WCOEFFS,
-        param_ptt=app.maybe(COEFF_PATTERN),
-    )
-    rgt_str = apf.first_capture(pattern, rxn_str)
+    rxn_line = _split_rxn_line(rxn_str.split("\n")[0])
+    if rxn_line is not None:
+        rgt_str = rxn_line[0]
+    else:
+        pattern = _first_line_pattern(
+            rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
+            prd_ptt=SPECIES_NAME_PATTERN_WCOEFFS,
+            param_ptt=app.maybe(COEFF_PATTERN),
+        )
+        rgt_str = apf.first_capture(pattern, rxn_str)
     rgt_str = apf.remove(app.LINESPACES, rgt_str)
     rgt_split_paren = apf.split(CHEMKIN_PAREN_PLUS, rgt_str)
     rgt_split_plus = apf.split(app.PLUS, rgt_str)
@@ -639,12 +698,16 @@ def high_p(rxn_str, ea_units, a_units):
     :rtype: list(list(float))
     """
 
-    pattern = _first_line_pattern(
-        rct_ptt=SPECIES_NAMES_PATTERN,
-        prd_ptt=SPECIES_NAME_PATTERN_WCOEFFS,
-        param_ptt=app.capturing(COEFF_PATTERN),
-    )
-    string_lst = apf.all_captures(pattern, rxn_str)
+    rxn_line = _split_rxn_line(rxn_str.split("\n")[0])
+    if rxn_line is not None:
+        string_lst = [" ".join(rxn_line[2])]
+    else:
+        pattern = _first_line_pattern(
+            rct_ptt=SPECIES_NAMES_PATTERN,
+            prd_ptt=SPECIES_NAME_PATTERN_WCOEFFS,
+            param_ptt=app.capturing(COEFF_PATTERN),
+        )
+        string_lst = apf.all_captures(pattern, rxn_str)
     if string_lst:
         fake_params = []
         for string in string_lst:
@@ -951,6 +1014,34 @@ def colliders(rxn_str):
     return params
 
 
+@functools.lru_cache(maxsize=RXN_LINE_CACHE_SIZE)
+def _split_rxn_line(line):
+    """Splits the line containing the chemical equation into the reactant
+    and product strings and the three high-pressure fitting parameters.
+
+    This tokenizes the line in linear time, rather than matching the whole
+    line against the general first-line pattern, and is cached on the line.
+
+    :param line: first line of a reaction data string
+    :type line: str
+    :return: reactant string, product string, and parameter strings; None
+        if the line is not in the usual form and needs the general patterns
+    :rtype: (str, str, tuple(str))
+    """
+
+    # take the last three numbers that follow a complete equation, as the
+    # general pattern does by reading as many products as it can
+    tokens = line.split()
+    for idx in range(len(tokens) - 3, 0, -1):
+        param_strs = tuple(tokens[idx:idx+3])
+        if all(apf.full_match(app.NUMBER, tok) for tok in param_strs):
+            caps = apf.first_capture(RXN_EQUATION_PATTERN, " ".join(tokens[:idx]))
+            if caps is not None:
+                return caps[0], caps[1], param_strs
+
+    return None
+
+
 def _first_line_pattern(rct_ptt, prd_ptt, param_ptt):
     """Defines the pattern for the first line in a reaction data
     string that contains the chemical equation and high-pressure
@@ -2,19 +2,25 @@
 """
 
 import itertools
+import collections
 import numpy as np
 import autoparse.pattern as app
 import autoparse.find as apf
+from chemkin_io.parser._util import map_chunks
 
 
 COMMENTS_PATTERN = app.escape('!') + app.capturing(
     app.one_or_more(app.WILDCARD2))
 
 
-def create_spc_nasa7_dct(block_str):
+def create_spc_nasa7_dct(block_str, nprocs=None):
     """ Creates a spc_nasa7_dct
 
-
+        :param block_str: string for thermo block
+        :type block_str: str
+        :param nprocs: number of processes to parse the entries with;
+            None (default) parses them serially
+        :type nprocs: int, str, or None
         :return spc_nasa7_dct: dictionary with spc names
                 as keys and NASA-7 info as values
 
@@ -25,14 +31,31 @@ def create_spc_nasa7_dct(block_str):
     # Get the default midpoint temp
     default_temp_limits = get_default_temp_limits(block_str)
     default_midpoint = default_temp_limits[1]
+
+    # Get the spc names, which will be the keys of the dictionary, and the
+    # NASA-7 parameters, which will be the values of the dictionary
+    spc_nasa7_lst = map_chunks(
+        _spc_nasa7_entries, entry_lst, args=(default_midpoint,), nprocs=nprocs)
+    spc_nasa7_dct = dict(spc_nasa7_lst)
+
+    return spc_nasa7_dct
+
+
+def _spc_nasa7_entries(entry_lst, default_midpoint):
+    """ Reads the spc name and NASA-7 parameters of each of a list of entries
+
+        :param entry_lst: the 4 or more lines making up each thermo entry
+        :type entry_lst: list(list(str))
+        :param default_midpoint: midpoint temp for entries missing one
+        :type default_midpoint: float
+        :return: (spc name, NASA-7 parameters) for each entry
+        :rtype: list(tuple)
+    """
     many_default_midpoints = list(
         itertools.repeat(default_midpoint, times=len(entry_lst)))
     # creates an iterator
 
-    # Get the spc names, which will be the keys of the dictionary
     spc_names = list(map(get_spc_name, entry_lst))
-
-    # Get the NASA-7 parameters, which will be the values of the dictionary
     nasa7_params = list(
         zip(
             map(get_notes, entry_lst),
@@ -43,11 +66,168 @@ def create_spc_nasa7_dct(block_str):
         )
     )
 
-    spc_nasa7_dct = dict(zip(spc_names, nasa7_params))
+    return list(zip(spc_names, nasa7_params))
+
+
+# Columnar form of a spc_nasa7_dct: one row per species
+Nasa7Table = collections.namedtuple(
+    'Nasa7Table',
+    ['names', 'notes', 'compositions', 'phases',
+     'temp_limits', 'high_coeffs', 'low_coeffs'])
+
+
+def create_spc_nasa7_table(block_str, nprocs=None):
+    """ Creates the columnar form of the spc_nasa7_dct for a thermo block
+
+        :param block_str: string for thermo block
+        :type block_str: str
+        :param nprocs: number of processes to parse the entries with
+        :type nprocs: int, str, or None
+        :rtype: Nasa7Table
+    """
+    return nasa7_table(create_spc_nasa7_dct(block_str, nprocs=nprocs))
+
+
+def nasa7_table(spc_nasa7_dct):
+    """ Converts a spc_nasa7_dct into a table with the temperature limits
+        and the coefficients of all the species stacked into arrays
+
+        :param spc_nasa7_dct: dictionary with spc names
+                as keys and NASA-7 info as values
+        :type spc_nasa7_dct: dict
+        :return: table with names, notes, compositions, and phases tuples,
+            temp_limits as an (N, 3) array [low_limit, high_limit, midpoint],
+            and high_coeffs and low_coeffs as (N, 7) arrays
+        :rtype: Nasa7Table
+    """
+    names = tuple(spc_nasa7_dct.keys())
+    params_lst = tuple(spc_nasa7_dct.values())
+
+    table = Nasa7Table(
+        names=names,
+        notes=tuple(params[0] for params in params_lst),
+        compositions=tuple(params[1] for params in params_lst),
+        phases=tuple(params[2] for params in params_lst),
+        temp_limits=np.array(
+            [params[3] for params in params_lst], dtype=float).reshape(-1, 3),
+        high_coeffs=np.array(
+            [params[4][0] for params in params_lst], dtype=float).reshape(-1, 7),
+        low_coeffs=np.array(
+            [params[4][1] for params in params_lst], dtype=float).reshape(-1, 7),
+    )
+
+    return table
+
+
+def nasa7_dct(table):
+    """ Converts a Nasa7Table back into a spc_nasa7_dct, whose values can
+        be written with chemkin_io.writer.thermo.thermo_entry
+
+        :param table: columnar NASA-7 data
+        :type table: Nasa7Table
+        :rtype: dict
+    """
+    spc_nasa7_dct = {}
+    for idx, name in enumerate(table.names):
+        spc_nasa7_dct[name] = (
+            table.notes[idx],
+            table.compositions[idx],
+            table.phases[idx],
+            table.temp_limits[idx].tolist(),
+            (table.high_coeffs[idx].tolist(), table.low_coeffs[idx].tolist()),
+        )
 
     return spc_nasa7_dct
 
 
+def cp(table, temps, r_gas=1.0):
+    """ Evaluates the heat capacities of all species in a table
+
+        :param table: columnar NASA-7 data
+        :type table: Nasa7Table
+        :param temps: temperatures (K)
+        :type temps: float or numpy.ndarray
+        :param r_gas: gas constant in the desired units; 1.0 returns cp/R
+        :type r_gas: float
+        :return: heat capacities with shape (N,) + numpy.shape(temps)
+        :rtype: numpy.ndarray
+    """
+    temps, coeffs = _nasa7_coeffs(table, temps)
+    cp_r = coeffs[0] + temps * (
+        coeffs[1] + temps * (
+            coeffs[2] + temps * (coeffs[3] + temps * coeffs[4])))
+
+    return r_gas * cp_r
+
+
+def h(table, temps, r_gas=1.0):
+    """ Evaluates the enthalpies of all species in a table
+
+        :param table: columnar NASA-7 data
+        :type table: Nasa7Table
+        :param temps: temperatures (K)
+        :type temps: float or numpy.ndarray
+        :param r_gas: gas constant in the desired units; 1.0 returns H/R (K)
+        :type r_gas: float
+        :return: enthalpies with shape (N,) + numpy.shape(temps)
+        :rtype: numpy.ndarray
+    """
+    temps, coeffs = _nasa7_coeffs(table, temps)
+    h_r = coeffs[5] + temps * (
+        coeffs[0] + temps * (
+            coeffs[1] / 2. + temps * (
+                coeffs[2] / 3. + temps * (
+                    coeffs[3] / 4. + temps * coeffs[4] / 5.))))
+
+    return r_gas * h_r
+
+
+def s(table, temps, r_gas=1.0):
+    """ Evaluates the entropies of all species in a table
+
+        :param table: columnar NASA-7 data
+        :type table: Nasa7Table
+        :param temps: temperatures (K)
+        :type temps: float or numpy.ndarray
+        :param r_gas: gas constant in the desired units; 1.0 returns S/R
+        :type r_gas: float
+        :return: entropies with shape (N,) + numpy.shape(temps)
+        :rtype: numpy.ndarray
+    """
+    temps, coeffs = _nasa7_coeffs(table, temps)
+    s_r = coeffs[0] * np.log(temps) + coeffs[6] + temps * (
+        coeffs[1] + temps * (
+            coeffs[2] / 2. + temps * (
+                coeffs[3] / 3. + temps * coeffs[4] / 4.)))
+
+    return r_gas * s_r
+
+
+def _nasa7_coeffs(table, temps):
+    """ Broadcasts the temperatures against the species of a table and picks
+        the low- or high-temperature coefficients of each species at each
+        temperature, splitting at the midpoint temperature of the species
+
+        :return: temps with shape (1,) + shape(temps), and the seven
+            coefficients, each with shape (N,) + shape(temps)
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+    temps = np.asarray(temps, dtype=float)
+    temps = temps.reshape((1,) + temps.shape)
+
+    nspc = len(table.names)
+    tshape = (nspc,) + (1,) * (temps.ndim - 1)
+    midpoints = table.temp_limits[:, 2].reshape(tshape)
+    is_low = temps <= midpoints
+
+    coeffs = np.where(
+        is_low[np.newaxis],
+        table.low_coeffs.T.reshape((7,) + tshape),
+        table.high_coeffs.T.reshape((7,) + tshape))
+
+    return temps, coeffs
+
+
 # def create_entry_list(block_str, add_spaces=True):
 def create_entry_list(block_str):
     """ Creates a list with each line of the thermo block_str as an
@@ -8,6 +8,7 @@ from chemkin_io.parser.reaction import get_rxn_param_dct
 from chemkin_io.parser.reaction import get_pes_dct
 from chemkin_io.parser.reaction import get_rxn_osclass_dct
 from chemkin_io.parser.reaction import get_rxn_cmt_dct, get_rxn_strs_dct
+from chemkin_io.parser.reaction import get_rxn_strs, get_rxn_name
 
 PATH = os.path.dirname(os.path.realpath(__file__))
 DAT_PATH = os.path.join(PATH, 'data')
@@ -536,6 +537,28 @@ def test_rxn_names():
     rxn_param_dct = get_rxn_param_dct(ckin_str, 'cal/mole', 'moles')
     assert all(name in rxn_param_dct.keys() for name in NAMES_FROMDATA)
 
+
+def test_rxn_order():
+    """ test mechanalyzer.parser.reaction.get_rxn_param_dct
+        keeps the order in which the reactions first appear in the block
+    """
+    ckin_str = ioformat.pathtools.read_file(DAT_PATH, 'rxn_block.dat')
+    rxns = [get_rxn_name(rxn_str) for rxn_str in get_rxn_strs(ckin_str)]
+    rxn_param_dct = get_rxn_param_dct(ckin_str, 'cal/mole', 'moles')
+    assert list(rxn_param_dct.keys()) == list(dict.fromkeys(rxns))
+
+
+def test_rxn_names_parallel():
+    """ test mechanalyzer.parser.reaction.get_rxn_param_dct
+        with the reactions parsed over several processes
+    """
+    ckin_str = ioformat.pathtools.read_file(DAT_PATH, 'rxn_block.dat')
+    rxn_param_dct = get_rxn_param_dct(ckin_str, 'cal/mole', 'moles')
+    rxn_param_dct_par = get_rxn_param_dct(
+        ckin_str, 'cal/mole', 'moles', nprocs=2)
+    assert list(rxn_param_dct_par.keys()) == list(rxn_param_dct.keys())
+
+
 def test_pes_dct():
     """ test mechanalyzer.parser.reaction.get_pes_dct with and w/o comments
         calls also
@@ -589,4 +612,6 @@ if __name__ == '__main__':
     test_troe()
     test_lind()
     test_rxn_names()
+    test_rxn_order()
+    test_rxn_names_parallel()
     test_pes_dct()
@@ -1,9 +1,12 @@
 """ reaction read write testing
 """
 
+import io
 import numpy as np
 from autoreact.params import RxnParams
 from chemkin_io.writer.mechanism import reactions_block as writer
+from chemkin_io.writer.mechanism import write_chemkin_file
+from chemkin_io.writer.mechanism import stream_chemkin_file
 
 
 # Define miscellaneous stuff
@@ -123,6 +126,18 @@ def test_headersymbol():
     ckin_str = writer(RXN_ALL_DCT)
     assert ckin_str == ref_ckin_str
 
+def test_stream():
+    """ Test that streaming the reactions to a file handle writes the
+        same text as the string writer
+    """
+    ckin_str = write_chemkin_file(
+        rxn_param_dct=RXN_ALL_DCT, rxn_cmts_dct=RXN_CMTS_DCT1)
+    stream = io.StringIO()
+    stream_chemkin_file(
+        stream, rxn_param_dct=RXN_ALL_DCT, rxn_cmts_dct=RXN_CMTS_DCT1)
+    assert stream.getvalue() == ckin_str
+    assert ckin_str == writer(RXN_ALL_DCT, rxn_cmts_dct=RXN_CMTS_DCT1)
+
 def test_arr():
     """ Tests the Arrhenius writer
     """
@@ -324,6 +339,7 @@ def test_dups():
 if __name__ == '__main__':
     test_headersymbol()
     test_orderalphabetically()
+    test_stream()
     test_arr()
     test_plog()
     test_cheb()
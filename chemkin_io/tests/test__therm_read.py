@@ -2,7 +2,10 @@
 """
 
 import numpy
+import pytest
+from chemkin_io.parser import thermo
 from chemkin_io.parser.thermo import create_spc_nasa7_dct as parser
+from chemkin_io.writer.thermo import thermo_entry
 
 THERM_STR = ( 
     'THERMO\n'
@@ -35,5 +38,60 @@ def test_read():
     assert numpy.allclose(lowt, ref_lowt)
 
 
+def test_read_parallel():
+    """ Tests the chemkin_io parsing for thermo split over several processes
+    """
+
+    entry_str = THERM_STR.split('\n\n')[1].split('END')[0]
+    therm_str = 'THERMO\n200.00    1000.00   5000.000\n\n'
+    for idx in range(5):
+        therm_str += entry_str.replace('O2      ', f'O2_{idx}    ', 1)
+    therm_str += 'END\n\n\n'
+
+    spc_nasa7_dct = parser(therm_str)
+    spc_nasa7_dct_par = parser(therm_str, nprocs=2)
+    assert list(spc_nasa7_dct_par) == [f'O2_{idx}' for idx in range(5)]
+    assert spc_nasa7_dct_par == spc_nasa7_dct
+    assert parser(therm_str, nprocs='auto') == spc_nasa7_dct
+
+    with pytest.raises(ValueError):
+        parser(therm_str, nprocs='all')
+
+
+def test_table():
+    """ Tests the columnar NASA-7 table and its thermo evaluation
+    """
+
+    spc_nasa7_dct = parser(THERM_STR)
+    table = thermo.nasa7_table(spc_nasa7_dct)
+    assert table.names == ('O2',)
+    assert table.temp_limits.shape == (1, 3)
+    assert table.high_coeffs.shape == table.low_coeffs.shape == (1, 7)
+
+    # Check against the polynomials evaluated one temperature at a time
+    temps = numpy.array([300.0, 1000.0, 2500.0])
+    high_coeffs, low_coeffs = spc_nasa7_dct['O2'][4]
+    ref_cp, ref_h, ref_s = [], [], []
+    for temp in temps:
+        coe = low_coeffs if temp <= 1000.0 else high_coeffs
+        ref_cp.append(sum(coe[i] * temp**i for i in range(5)))
+        ref_h.append(sum(coe[i] * temp**(i+1) / (i+1) for i in range(5))
+                     + coe[5])
+        ref_s.append(coe[0] * numpy.log(temp)
+                     + sum(coe[i] * temp**i / i for i in range(1, 5))
+                     + coe[6])
+    assert numpy.allclose(thermo.cp(table, temps), [ref_cp])
+    assert numpy.allclose(thermo.h(table, temps), [ref_h])
+    assert numpy.allclose(thermo.s(table, temps), [ref_s])
+    assert thermo.cp(table, 500.0).shape == (1,)
+
+    # Round trip back to the dictionary and the writer
+    spc_nasa7_dct2 = thermo.nasa7_dct(table)
+    assert (thermo_entry('O2', spc_nasa7_dct2['O2']) ==
+            thermo_entry('O2', spc_nasa7_dct['O2']))
+
+
 if __name__ == '__main__':
     test_read()
+    test_read_parallel()
+    test_table()
@@ -54,23 +54,43 @@ def name_column_length(names):
     return names_len
 
 
+def sort_rxnkeys(rxnkeys):
+    """ Orders the reactant and product names of a set of reaction keys,
+        for a consistent search of the reverse reactions
+
+        Passing the result as rxnkeys to the writers avoids re-sorting the
+        whole set of keys for every reaction that is written.
+
+        :param rxnkeys: full set of reaction keys
+        :type rxnkeys: list of rxns
+        :return rxnkeys_sorted: reaction keys with ordered names
+        :rtype: frozenset
+    """
+    if isinstance(rxnkeys, frozenset):  # already sorted
+        return rxnkeys
+
+    rxnkeys_sorted = frozenset(
+        tuple([tuple(sorted(rxnk[0])), tuple(sorted(rxnk[1])), rxnk[2]])
+        for rxnk in rxnkeys
+    )
+
+    return rxnkeys_sorted
+
+
 def format_rxn_name(rxn, pdep=False, rxnkeys = []):
     """ Receives a rxn and creates an appropriate string
         to be written in a Chemkin mech. Adds third body if applicable
 
         :param rxn: reaction names and third body
         :type rxn: tuple ((rct1, rct2), (prd1, prd2), (third_bod1,))
-        :param rxnkeys: full set of reaction keys
+        :param rxnkeys: full set of reaction keys, or the output of
+            sort_rxnkeys for them
         :type rxnkeys: list of rxns
         :return rxn_name: formatted reaction name for writing in the mech
         :rtype: str
     """
     # order names for consistent search
-    rxnkeys_sorted = []
-    for rxnk in rxnkeys:
-        rxnkeys_sorted.append(
-            tuple([tuple(sorted(rxnk[0])), tuple(sorted(rxnk[1])), rxnk[2]])
-        )
+    rxnkeys_sorted = sort_rxnkeys(rxnkeys)
 
     rcts = rxn[0]
     prds = rxn[1]
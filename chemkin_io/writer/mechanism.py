@@ -26,19 +26,68 @@ def write_chemkin_file(mech_spc_dct=None, spc_nasa7_dct=None,
         :type sortrxns: bool
     """
 
-    total_str = ''
+    total_str = ''.join(iter_chemkin_file(
+        mech_spc_dct=mech_spc_dct, spc_nasa7_dct=spc_nasa7_dct,
+        rxn_param_dct=rxn_param_dct, rxn_cmts_dct=rxn_cmts_dct,
+        sortrxns=sortrxns))
+
+    return total_str
+
+
+def stream_chemkin_file(stream, mech_spc_dct=None, spc_nasa7_dct=None,
+                        rxn_param_dct=None, rxn_cmts_dct=None, sortrxns=False):
+    """ Writes a Chemkin-formatted mechanism and/or thermo file to a file
+        handle, one thermo entry or reaction at a time, so that the full
+        file is never held in memory
+
+        :param stream: text file handle to write to
+        :type stream: io.TextIOBase
+        :param mech_spc_dct: species data for a mechanism
+        :type mech_spc_dct: {spc_name:data}
+        :param spc_nasa7_dct: containing NASA-7 thermo data for each species
+        :type spc_nasa7_dct: {spc_name:NASA-7 parameters}
+        :param rxn_param_dct: containing the reaction parameters
+        :type rxn_param_dct: {rxn:params}
+        :param rxn_cmts_dct: comment information for each reaction
+        :type rxn_cmts_dct: dict {rxn: cmts_dct}
+        :param sortrxns: reorder dict keys alphabetically
+        :type sortrxns: bool
+    """
+
+    for chunk in iter_chemkin_file(
+            mech_spc_dct=mech_spc_dct, spc_nasa7_dct=spc_nasa7_dct,
+            rxn_param_dct=rxn_param_dct, rxn_cmts_dct=rxn_cmts_dct,
+            sortrxns=sortrxns):
+        stream.write(chunk)
+
+
+def iter_chemkin_file(mech_spc_dct=None, spc_nasa7_dct=None,
+                      rxn_param_dct=None, rxn_cmts_dct=None, sortrxns=False):
+    """ Generates the text of a Chemkin-formatted mechanism and/or thermo
+        file in pieces: the elements and species blocks, then each thermo
+        entry and each reaction, along with the block headers and footers
+
+        :param mech_spc_dct: species data for a mechanism
+        :type mech_spc_dct: {spc_name:data}
+        :param spc_nasa7_dct: containing NASA-7 thermo data for each species
+        :type spc_nasa7_dct: {spc_name:NASA-7 parameters}
+        :param rxn_param_dct: containing the reaction parameters
+        :type rxn_param_dct: {rxn:params}
+        :param rxn_cmts_dct: comment information for each reaction
+        :type rxn_cmts_dct: dict {rxn: cmts_dct}
+        :param sortrxns: reorder dict keys alphabetically
+        :type sortrxns: bool
+        :rtype: iterator(str)
+    """
+
     if mech_spc_dct:
-        elem_str = elements_block(mech_spc_dct)
-        spc_str = species_block(mech_spc_dct)
-        total_str += elem_str + spc_str
+        yield elements_block(mech_spc_dct)
+        yield species_block(mech_spc_dct)
     if spc_nasa7_dct:
-        thermo_str = thermo_block(spc_nasa7_dct)
-        total_str += thermo_str
+        yield from _iter_thermo_block(spc_nasa7_dct)
     if rxn_param_dct:
-        rxn_str = reactions_block(rxn_param_dct, rxn_cmts_dct=rxn_cmts_dct, sortrxns=sortrxns)
-        total_str += rxn_str
-
-    return total_str
+        yield from _iter_reactions_block(
+            rxn_param_dct, rxn_cmts_dct=rxn_cmts_dct, sortrxns=sortrxns)
 
 
 def elements_block(mech_spc_dct):
@@ -76,12 +125,7 @@ def thermo_block(spc_nasa7_dct):
 
     """
 
-    thermo_str = 'THERMO\n'
-    thermo_str += '200.00    1000.00   5000.000\n\n'
-    for spc_name, params in spc_nasa7_dct.items():
-        thermo_str += thermo.thermo_entry(spc_name, params)
-
-    thermo_str += '\nEND\n\n\n'
+    thermo_str = ''.join(_iter_thermo_block(spc_nasa7_dct))
 
     return thermo_str
 
@@ -98,6 +142,29 @@ def reactions_block(rxn_param_dct, rxn_cmts_dct=None, sortrxns=False):
         :rtype: str
     """
 
+    rxn_str = ''.join(_iter_reactions_block(
+        rxn_param_dct, rxn_cmts_dct=rxn_cmts_dct, sortrxns=sortrxns))
+
+    return rxn_str
+
+
+def _iter_thermo_block(spc_nasa7_dct):
+    """ Generates the thermo block of the mechanism file, one entry at a time
+    """
+
+    yield 'THERMO\n'
+    yield '200.00    1000.00   5000.000\n\n'
+    for spc_name, params in spc_nasa7_dct.items():
+        yield thermo.thermo_entry(spc_name, params)
+
+    yield '\nEND\n\n\n'
+
+
+def _iter_reactions_block(rxn_param_dct, rxn_cmts_dct=None, sortrxns=False):
+    """ Generates the reaction block of the mechanism file, one reaction
+        at a time
+    """
+
     # Get the overall reactions block comment, if it exists
     if rxn_cmts_dct is not None:
         block_cmt = rxn_cmts_dct.get('block')
@@ -107,10 +174,8 @@ def reactions_block(rxn_param_dct, rxn_cmts_dct=None, sortrxns=False):
         block_cmt = ''
 
     # Write the reactions block
-    rxn_str = 'REACTIONS     CAL/MOLE     MOLES\n\n'
-    rxn_str += block_cmt
-    rxn_str += reaction.write_rxn_param_dct(
+    yield 'REACTIONS     CAL/MOLE     MOLES\n\n'
+    yield block_cmt
+    yield from reaction.iter_rxn_param_dct(
         rxn_param_dct, rxn_cmts_dct=rxn_cmts_dct, sortrxns=sortrxns)
-    rxn_str += '\n\nEND\n\n'
-
-    return rxn_str
+    yield '\n\nEND\n\n'
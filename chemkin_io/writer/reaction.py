@@ -23,13 +23,24 @@ def replace_rxn_in_cki(ckin_str, rxn_strs_dct, rxn_param_dct_new,
     """
     # Get the length of the longest reaction name
     max_len = util.max_rxn_length(rxn_param_dct_new)
+    rxnkeys = util.sort_rxnkeys(rxn_strs_dct.keys())
     n_of_rxns_replaced = len(rxn_param_dct_new)
 
+    # Split the file once and index the lines by content so that every
+    # reaction span can be located without rescanning the whole string
+    ckin_lines = ckin_str.split("\n")
+    line_idx_dct = {}
+    for idx, line in enumerate(ckin_lines):
+        line_idx_dct.setdefault(line, []).append(idx)
+    deleted = [False] * len(ckin_lines)
+
+    insert_dct = {}  # {line index: new reaction strings placed before it}
+    added_strs = []
     for rxn, params in rxn_param_dct_new.items():
         # ckin string of single new reaction: rxn keys must be from the whole dct
         cmts_dct = rxn_cmts_dct_new.get(rxn)
         ckin_str_rxn = single_rxn(
-            rxn, params, cmts_dct=cmts_dct, max_len=max_len, rxnkeys=rxn_strs_dct.keys()
+            rxn, params, cmts_dct=cmts_dct, max_len=max_len, rxnkeys=rxnkeys
         )
         # remove extra new lines
         ckin_str_rxn = '\n'.join([ckstr for ckstr in ckin_str_rxn.split('\n')
@@ -38,19 +49,20 @@ def replace_rxn_in_cki(ckin_str, rxn_strs_dct, rxn_param_dct_new,
         if rxn in rxn_strs_dct.keys():
             # get the position of the first occurrence of the reaction
             rxn_strs = rxn_strs_dct[rxn]
-            ckin_str_lst = ckin_str.split("\n")
             first_rxn_line = rxn_strs[0].split("\n")[0]
-            idx = ckin_str_lst.index(first_rxn_line)
+            idx = _first_line_index(line_idx_dct, deleted, first_rxn_line)
             connector = (
                 "=>" if "=>" in first_rxn_line and "<=>" not in first_rxn_line else "="
             )
             # delete strings from initial file
             for rxn_str in rxn_strs:
-                if rxn_str not in ckin_str:
+                spans = _line_spans(ckin_lines, line_idx_dct, deleted, rxn_str)
+                if not spans:
                     print('*Warning- was unable to find this string in file,' \
                     'probably wrong formatting: \n {}'.format(rxn_str))
                     print('reaction will be written twice in the final CKI, check!!!')
-                ckin_str = ckin_str.replace(rxn_str, "!DELETE")
+                for start, stop in spans:
+                    deleted[start:stop] = [True] * (stop - start)
 
             # convert connector to => if necessary and print warning
             if connector == "=>" and "=>" not in ckin_str_rxn:
@@ -63,12 +75,7 @@ def replace_rxn_in_cki(ckin_str, rxn_strs_dct, rxn_param_dct_new,
                     )
                 )
             # add new strings
-            ckin_str_lst = ckin_str.split("\n")
-            ckin_str_lst.insert(idx, ckin_str_rxn)
-            # reconstruct string
-            #ckin_str = "\n".join(ckin_str_lst)
-            ckin_str = "\n".join([ckin_str for ckin_str in ckin_str_lst
-                                  if ckin_str.strip() != "!DELETE"])
+            insert_dct.setdefault(idx, []).append(ckin_str_rxn)
 
         elif add_rxns:  # add the reaction if not present
             print(
@@ -77,7 +84,16 @@ def replace_rxn_in_cki(ckin_str, rxn_strs_dct, rxn_param_dct_new,
                     rxn
                 )
             )
-            ckin_str += "\n" + ckin_str_rxn
+            added_strs.append(ckin_str_rxn)
+
+    # reconstruct string in a single pass
+    new_lines = []
+    for idx, line in enumerate(ckin_lines):
+        new_lines.extend(insert_dct.get(idx, ()))
+        if not deleted[idx]:
+            new_lines.append(line)
+    ckin_str = "\n".join(new_lines + [''] * bool(added_strs))
+    ckin_str += "\n".join(added_strs)
 
     # replace additional '\n'
     ckin_str = ckin_str.replace("\n" * n_of_rxns_replaced, "\n")
@@ -85,6 +101,38 @@ def replace_rxn_in_cki(ckin_str, rxn_strs_dct, rxn_param_dct_new,
     return ckin_str
 
 
+def _first_line_index(line_idx_dct, deleted, line):
+    """ Get the index of the first line of the file matching `line` that
+        has not been deleted by a previous replacement
+
+        :raises ValueError: if the line is not in the file
+    """
+
+    for idx in line_idx_dct.get(line, ()):
+        if not deleted[idx]:
+            return idx
+    raise ValueError('{!r} is not in the CKI string'.format(line))
+
+
+def _line_spans(ckin_lines, line_idx_dct, deleted, rxn_str):
+    """ Get the (start, stop) line spans of every non-overlapping occurrence
+        of a (possibly multi-line) reaction string in the file
+    """
+
+    rxn_lines = rxn_str.split("\n")
+    nlines = len(rxn_lines)
+
+    spans = []
+    stop = 0
+    for start in line_idx_dct.get(rxn_lines[0], ()):
+        if start >= stop and not any(deleted[start:start+nlines]) and (
+                ckin_lines[start:start+nlines] == rxn_lines):
+            stop = start + nlines
+            spans.append((start, stop))
+
+    return spans
+
+
 def write_rxn_param_dct(rxn_param_dct, rxn_cmts_dct=None, sortrxns=False):
     """Write all reactions in a rxn_param_dct to a Chemkin string
 
@@ -96,28 +144,42 @@ def write_rxn_param_dct(rxn_param_dct, rxn_cmts_dct=None, sortrxns=False):
     (otherwise, order may change every time if other operations have been done before)
     :type sortrxns: bool
     """
+    return "".join(iter_rxn_param_dct(
+        rxn_param_dct, rxn_cmts_dct=rxn_cmts_dct, sortrxns=sortrxns))
+
+
+def iter_rxn_param_dct(rxn_param_dct, rxn_cmts_dct=None, sortrxns=False):
+    """Generate the Chemkin string of each reaction in a rxn_param_dct,
+    one reaction at a time, so a mechanism can be streamed to a file
+
+    :param rxn_param_dct: fitting parameters for all reactions
+    :type rxn_param_dct: dict {rxn: params}
+    :param rxn_cmts_dct: comments for all reactions
+    :type rxn_cmts_dct: dict {rxn: cmts_dct}
+    :param sortrxns: reorder dict keys alphabetically
+    :type sortrxns: bool
+    :rtype: iterator(str)
+    """
     if sortrxns:
         rxn_param_dct = dict(sorted(rxn_param_dct.items()))
 
     rxn_cmts_dct = rxn_cmts_dct or {}  # sets to empty dict if None
 
-    # Get the length of the longest reaction name
+    # Get the length of the longest reaction name and the sorted keys
+    # used to find reverse reactions, each in one pass over the reactions
     max_len = util.max_rxn_length(rxn_param_dct)
+    rxnkeys = util.sort_rxnkeys(rxn_param_dct.keys())
 
     # Write each reaction
-    ckin_str = ""
     for rxn, params in rxn_param_dct.items():
         cmts_dct = rxn_cmts_dct.get(rxn)
-        sing_rxn_str = single_rxn(
+        yield single_rxn(
             rxn,
             params,
             cmts_dct=cmts_dct,
             max_len=max_len,
-            rxnkeys=rxn_param_dct.keys(),
+            rxnkeys=rxnkeys,
         )
-        ckin_str += sing_rxn_str
-
-    return ckin_str
 
 
 def single_rxn(rxn, params, cmts_dct=None, max_len=45, rxnkeys=[]):
@@ -44,6 +44,9 @@ from elstruct.reader._reader import check_convergence_messages
 # version
 from elstruct.reader._reader import program_name
 from elstruct.reader._reader import program_version
+# multiple properties
+from elstruct.reader._reader import PARSE_ALL_FIELDS
+from elstruct.reader._reader import parse_all
 
 
 __all__ = [
@@ -89,5 +92,8 @@ __all__ = [
     'check_convergence_messages',
     # version
     'program_name',
-    'program_version'
+    'program_version',
+    # multiple properties
+    'PARSE_ALL_FIELDS',
+    'parse_all',
 ]
@@ -9,8 +9,11 @@
     with `prog` inserted as the first argument.
 """
 
+import re
+import itertools
 import numpy
 import automol
+from elstruct import par
 from elstruct.reader import program_modules as pm
 
 
@@ -461,3 +464,167 @@ def program_version(prog, output_str):
         prog, pm.Job.PROG_VERS,
         # *args
         output_str)
+
+
+# Multiple properties
+PARSE_ALL_FIELDS = (
+    'energy', 'opt_geometry', 'gradient', 'hessian',
+    'harmonic_frequencies', 'has_normal_exit_message')
+
+# Sections of the output read for each property, for the programs whose
+# output is indexed by parse_all. Properties found in blocks are read from
+# the start of the last marked block to the end of the output, while
+# properties found on single lines are read from the matching lines only.
+_GAUSSIAN_BLOCK_MARKERS = {
+    'opt_geometry': ('Standard orientation:', 'Z-Matrix orientation:'),
+    'gradient': ('Forces (Hartrees/Bohr)',),
+    'hessian': ('Force constants in Cartesian coordinates:',
+                'The second derivative matrix:'),
+}
+_GAUSSIAN_LINE_PATTERNS = {
+    'harmonic_frequencies': re.compile(
+        r'^.*Frequencies[ \t]*--.*$', re.MULTILINE),
+    'has_normal_exit_message': re.compile(
+        r'^.*termination.*$', re.MULTILINE | re.IGNORECASE),
+}
+SECTION_MARKER_DCT = {
+    par.Program.GAUSSIAN09: (_GAUSSIAN_BLOCK_MARKERS, _GAUSSIAN_LINE_PATTERNS),
+    par.Program.GAUSSIAN03: (_GAUSSIAN_BLOCK_MARKERS, _GAUSSIAN_LINE_PATTERNS),
+    par.Program.GAUSSIAN16: (_GAUSSIAN_BLOCK_MARKERS, _GAUSSIAN_LINE_PATTERNS),
+}
+
+
+def parse_all(prog, method, output_str, fields=PARSE_ALL_FIELDS,
+              error=None, success=None):
+    """ Reads several properties from the same output string.
+
+        The output is indexed once, locating the blocks and lines that
+        hold each property, and each reader is then run on its section
+        rather than on the whole output. Properties that are not found
+        in their section, and programs with no index, are read from the
+        full output string.
+
+        :param prog: electronic structure program to use as a backend
+        :type prog: str
+        :param method: electronic structure method
+        :type method: str
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :param fields: names of the reader functions to call
+        :type fields: tuple(str)
+        :param error: a key indicating the type of error message, used
+            for the `check_convergence_messages` field
+        :type error: str
+        :param success: a key indicating the type of success message, used
+            for the `check_convergence_messages` field
+        :type success: str
+        :returns: the value read for each field
+        :rtype: dict[str: obj]
+    """
+
+    block_dct, line_dct = _section_index(prog, output_str, fields)
+
+    val_dct = {}
+    for field in fields:
+        reader = _field_reader(field, method, error, success)
+        if field in block_dct:
+            section_reader = _SECTION_READER_DCT.get(field, reader)
+            val = section_reader(prog, output_str[block_dct[field]:])
+            if val is None:
+                val = reader(prog, output_str)
+        elif field in line_dct:
+            val = reader(prog, line_dct[field])
+        else:
+            val = reader(prog, output_str)
+        val_dct[field] = val
+
+    return val_dct
+
+
+def _section_index(prog, output_str, fields):
+    """ Locate the sections of the output holding the requested fields
+
+        :returns: the offset of the last marked block for each block field,
+            and the joined matching lines for each line field
+        :rtype: (dict[str: int], dict[str: str])
+    """
+
+    block_markers, line_patterns = SECTION_MARKER_DCT.get(prog, ({}, {}))
+
+    block_dct = {}
+    markers = set(itertools.chain(
+        *(block_markers[field] for field in fields if field in block_markers)
+    ))
+    start_dct = {}
+    for marker in markers:
+        pos = output_str.rfind(marker)
+        if pos >= 0:
+            start_dct[marker] = output_str.rfind('\n', 0, pos) + 1
+    for field in fields:
+        starts = [start_dct[marker] for marker in block_markers.get(field, ())
+                  if marker in start_dct]
+        if starts:
+            block_dct[field] = min(starts)
+
+    line_dct = {}
+    for field in fields:
+        if field in line_patterns:
+            line_dct[field] = '\n'.join(
+                line_patterns[field].findall(output_str))
+
+    return block_dct, line_dct
+
+
+def _field_reader(field, method, error, success):
+    """ Get the reader for a field, called with the program and output string
+    """
+
+    def _energy(prog, output_str):
+        return energy(prog, method, output_str)
+
+    def _check_convergence_messages(prog, output_str):
+        return check_convergence_messages(prog, error, success, output_str)
+
+    if field == 'energy':
+        reader = _energy
+    elif field == 'check_convergence_messages':
+        reader = _check_convergence_messages
+    else:
+        assert field in _FIELD_READER_DCT, (
+            f'Cannot read {field}. Options: energy, '
+            f'check_convergence_messages, {", ".join(_FIELD_READER_DCT)}')
+        reader = _FIELD_READER_DCT[field]
+
+    return reader
+
+
+def _section_opt_geometry(prog, output_str):
+    """ Reads the optimized geometry from an orientation block, returning
+        None rather than falling back on the z-matrix if it is not found
+    """
+    geo = _opt_geometry(prog, output_str)
+    if geo is not None:
+        geo = automol.geom.without_dummy_atoms(geo)
+    return geo
+
+
+_FIELD_READER_DCT = {
+    'gradient': gradient,
+    'hessian': hessian,
+    'harmonic_frequencies': harmonic_frequencies,
+    'normal_coordinates': normal_coordinates,
+    'irc_points': irc_points,
+    'irc_path': irc_path,
+    'opt_geometry': opt_geometry,
+    'opt_zmatrix': opt_zmatrix,
+    'opt_zmatrices': opt_zmatrices,
+    'vpt2': vpt2,
+    'dipole_moment': dipole_moment,
+    'polarizability': polarizability,
+    'has_normal_exit_message': has_normal_exit_message,
+    'program_name': program_name,
+    'program_version': program_version,
+}
+_SECTION_READER_DCT = {
+    'opt_geometry': _section_opt_geometry,
+}
@@ -6,7 +6,13 @@ from elstruct import par
 from elstruct import pclass
 
 
-# Functions to import and call the appropriate writer function
+# Supported programs, and tables of implementations filled on first use
+PROGRAMS = pclass.values(par.Program)
+_DISPATCH_DCT = {}
+_PROGS_DCT = {}
+
+
+# Functions to import and call the appropriate reader function
 def call_module_function(prog, function, *args, **kwargs):
     """ call the module implementation of a given function
 
@@ -16,6 +22,35 @@ def call_module_function(prog, function, *args, **kwargs):
         :type function_template: function
     """
 
+    reader = module_function(prog, function)
+
+    return reader(*args, **kwargs)
+
+
+def module_function(prog, function):
+    """ get the module implementation of a given function
+
+        The implementations are looked up on first use and stored in a
+        dispatch table, keyed by program and function, for later calls.
+
+        :param prog: the program
+        :type prog: str
+        :param function: name of the function
+        :type function: str
+        :rtype: function
+    """
+
+    key = (prog, function)
+    if key not in _DISPATCH_DCT:
+        _DISPATCH_DCT[key] = _resolve_module_function(prog, function)
+
+    return _DISPATCH_DCT[key]
+
+
+def _resolve_module_function(prog, function):
+    """ import the module for a program and get its implementation
+    """
+
     def _rename_prog(prog):
         """ Rename a program if number does not match module name """
         if prog in ('molpro2021', 'molpro2021_mppx'):
@@ -25,9 +60,9 @@ def call_module_function(prog, function, *args, **kwargs):
         return prog
 
     new_name = _rename_prog(prog)
-    assert new_name in pclass.values(par.Program), (
+    assert new_name in PROGRAMS, (
         f"The program '{new_name}' is not in the supported list of programs; "
-        f"options are {pclass.values(par.Program)}")
+        f"options are {PROGRAMS}")
     assert new_name in program_modules_with_function(function), (
         f"The function '{function}' is not in the supported list of functions"
         f" for the program '{new_name}'; programs with this function are "
@@ -35,9 +70,8 @@ def call_module_function(prog, function, *args, **kwargs):
 
     name = f'_{_rename_prog(prog)}'
     module = importlib.import_module(f'elstruct.reader.{name:s}')
-    reader = getattr(module, function)
 
-    return reader(*args, **kwargs)
+    return getattr(module, function)
 
 
 def program_modules_with_function(function):
@@ -46,12 +80,11 @@ def program_modules_with_function(function):
         :type function: function
     """
 
-    progs = []
-    for prog in pclass.values(par.Program):
-        if function in READER_MODULE_DCT[prog]:
-            progs.append(prog)
+    if function not in _PROGS_DCT:
+        _PROGS_DCT[function] = tuple(
+            prog for prog in PROGRAMS if function in READER_MODULE_DCT[prog])
 
-    return progs
+    return list(_PROGS_DCT[function])
 
 
 # Information on what writers have been implemented
@@ -2,6 +2,42 @@
 """
 
 from elstruct import reader
+from elstruct.reader import program_modules
+from elstruct.reader import _gaussian09
+
+
+G09_OUTPUT_STR = """
+ -------------------------------------------------------------------
+ Center     Atomic                   Forces (Hartrees/Bohr)
+ Number     Number              X              Y              Z
+ -------------------------------------------------------------------
+      1        8           0.000000000    0.000000000    0.010000000
+      2        1           0.000000000    0.001000000   -0.005000000
+      3        1           0.000000000   -0.001000000   -0.005000000
+ -------------------------------------------------------------------
+ SCF Done:  E(RHF) =  -76.000000000     A.U. after    9 cycles
+ -------------------------------------------------------------------
+ Center     Atomic                   Forces (Hartrees/Bohr)
+ Number     Number              X              Y              Z
+ -------------------------------------------------------------------
+      1        8           0.000000000    0.000000000    0.020000000
+      2        1           0.000000000    0.002000000   -0.010000000
+      3        1           0.000000000   -0.002000000   -0.010000000
+ -------------------------------------------------------------------
+ Force constants in Cartesian coordinates:
+                1             2             3
+      1  0.100000D+00
+      2  0.000000D+00  0.200000D+00
+      3  0.100000D-01  0.000000D+00  0.300000D+00
+ Final forces over variables, Energy=-7.600000D+01:
+ Harmonic frequencies (cm**-1), IR intensities (KM/Mole), Raman scattering
+ Low frequencies ---   -5.1234   -0.0012    0.0008
+                      1                      2                      3
+                     A1                     A1                     B2
+ Frequencies --   1600.1234              3700.5678              3800.9012
+ Red. masses --      1.0800                 1.0400                 1.0800
+ Normal termination of Gaussian 09 at Mon Jan  1 00:00:00 2024.
+"""
 
 
 def test__programs():
@@ -63,3 +99,38 @@ def test__vpt2_programs():
     """
     assert set(reader.vpt2_programs()) >= {
         'gaussian09', 'gaussian03', 'gaussian16'}
+
+
+def test__module_function():
+    """ test elstruct.reader.program_modules.module_function
+    """
+    reader_fxn = program_modules.module_function('gaussian03', 'energy')
+    assert reader_fxn is _gaussian09.energy
+    assert program_modules.module_function(
+        'gaussian03', 'energy') is reader_fxn
+
+    for prog, function in (('qchem5', 'energy'), ('other', 'energy')):
+        try:
+            program_modules.module_function(prog, function)
+            raised = False
+        except AssertionError:
+            raised = True
+        assert raised
+
+
+def test__parse_all():
+    """ test elstruct.reader.parse_all
+    """
+    fields = ('gradient', 'hessian', 'harmonic_frequencies',
+              'has_normal_exit_message')
+    val_dct = reader.parse_all(
+        'gaussian09', 'hf', G09_OUTPUT_STR, fields=fields)
+
+    assert tuple(val_dct) == fields
+    for field in fields:
+        assert (str(val_dct[field]) ==
+                str(getattr(reader, field)('gaussian09', G09_OUTPUT_STR)))
+    assert val_dct['gradient'][0][2] == -0.02
+    assert val_dct['harmonic_frequencies'] == (
+        1600.1234, 3700.5678, 3800.9012)
+    assert val_dct['has_normal_exit_message']
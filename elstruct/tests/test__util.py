@@ -0,0 +1,81 @@
+""" test elstruct.util
+"""
+
+import numpy
+import elstruct
+
+
+WATER_GEO = (('O', (0.0, 0.0, -0.110)),
+             ('H', (0.0, -1.635, 0.876)),
+             ('H', (-0.0, 1.635, 0.876)))
+CO2_GEO = (('C', (0.0, 0.0, 0.0)),
+           ('O', (0.0, 0.0, 2.196)),
+           ('O', (0.0, 0.0, -2.196)))
+
+
+def _displaced_geos(geo, npts, seed):
+    """ geometries displaced randomly from a reference geometry
+    """
+    rng = numpy.random.default_rng(seed)
+    syms, xyzs = zip(*geo)
+    geos = ()
+    for _ in range(npts):
+        disp_xyzs = numpy.array(xyzs) + 0.05 * rng.standard_normal((3, 3))
+        geos += (tuple(zip(syms, map(tuple, disp_xyzs))),)
+    return geos
+
+
+def _random_hessians(npts, dim, seed):
+    """ random symmetric Hessians
+    """
+    rng = numpy.random.default_rng(seed)
+    mats = rng.standard_normal((npts, dim, dim))
+    return 0.1 * (mats + numpy.swapaxes(mats, 1, 2))
+
+
+def _check_batch(geos, hesses):
+    """ compare the batch functions with the single-point functions
+    """
+    for project in (True, False):
+        freqs = elstruct.util.harmonic_frequencies_batch(
+            geos, hesses, project=project)
+        norm_coos = elstruct.util.normal_coordinates_batch(
+            geos, hesses, project=project)
+        assert freqs.shape == (len(geos), 9)
+        assert norm_coos.shape == (len(geos), 9, 9)
+
+        for geo, hess, freqs_i, norm_coos_i in zip(
+                geos, hesses, freqs, norm_coos):
+            ref_freqs = numpy.array(elstruct.util.harmonic_frequencies(
+                geo, hess, project=project))
+            ref_norm_coos = numpy.array(elstruct.util.normal_coordinates(
+                geo, hess, project=project))
+
+            # the projected rotations and translations are left at the
+            # round-off of the projection, so only the modes above it are
+            # compared, and up to sign
+            freq_max = numpy.max(numpy.abs(ref_freqs))
+            assert numpy.allclose(freqs_i, ref_freqs, atol=1e-6*freq_max)
+            vib = numpy.abs(ref_freqs) > 1e-4 * freq_max
+            overlaps = numpy.sum(
+                norm_coos_i[:, vib] * ref_norm_coos[:, vib], axis=0)
+            assert numpy.allclose(numpy.abs(overlaps), 1., atol=1e-7)
+
+
+def test__frequencies_batch():
+    """ test elstruct.util.harmonic_frequencies_batch
+        test elstruct.util.normal_coordinates_batch
+    """
+    # nonlinear
+    geos = _displaced_geos(WATER_GEO, 4, seed=0)
+    hesses = _random_hessians(4, 9, seed=1)
+    _check_batch(geos, hesses)
+
+    # linear, aligned to an axis, so one rotation vanishes
+    geos = (CO2_GEO,) * 3
+    hesses = _random_hessians(3, 9, seed=2)
+    _check_batch(geos, hesses)
+
+
+if __name__ == '__main__':
+    test__frequencies_batch()
@@ -2,6 +2,7 @@
 """
 
 from elstruct import writer
+from elstruct import Job
 
 
 def test__programs():
@@ -57,5 +58,33 @@ def test__optimization_programs():
         'mrcc2018', 'orca4', 'psi4'}
 
 
+def test__batch():
+    """ test writer.batch
+    """
+    geos = (
+        (('O', (0.0, 0.0, -0.110)),
+         ('H', (0.0, -1.635, 0.876)),
+         ('H', (-0.0, 1.635, 0.876))),
+        (('O', (0.0, 0.0, -0.120)),
+         ('H', (0.0, -1.645, 0.886)),
+         ('H', (-0.0, 1.645, 0.886))),
+    )
+    for prog in ('gaussian09', 'molpro2015', 'psi4'):
+        inp_strs = tuple(writer.batch(
+            Job.ENERGY, prog, geos, 0, 1, 'hf', 'sto-3g', memory=8))
+        assert inp_strs == tuple(
+            writer.energy(prog, geo, 0, 1, 'hf', 'sto-3g', memory=8)
+            for geo in geos)
+
+        inp_strs = tuple(writer.batch(
+            Job.OPTIMIZATION, prog, geos, 0, 2, 'hf', 'sto-3g',
+            job_options=('Tight',)))
+        assert inp_strs == tuple(
+            writer.optimization(prog, geo, 0, 2, 'hf', 'sto-3g',
+                                job_options=('Tight',))
+            for geo in geos)
+
+
 if __name__ == '__main__':
     test__programs()
+    test__batch()
@@ -76,6 +76,131 @@ def harmonic_frequencies(geo, hess, project=True):
     return freqs
 
 
+def normal_coordinates_batch(geos, hesses, project=True):
+    """ Calculate normal coordinates from a stack of molecular Hessians
+        (in Bohr) for geometries of the same atoms, such as the points
+        along a reaction path.
+
+        :param geos: cartesian or z-matrix geometries
+        :type geos: tuple(tuple)
+        :param hesses: Hessians corresponding to the geometries
+        :type hesses: numpy.ndarray
+        :param project: project out rotations and translations of Hessian
+        :type project: bool
+        :returns: the normal coordinates of each point, shape (npts, 3N, 3N)
+        :rtype: numpy.ndarray
+    """
+
+    norm_coos, _, _ = _frequency_analysis_batch(geos, hesses, project=project)
+
+    return norm_coos
+
+
+def harmonic_frequencies_batch(geos, hesses, project=True):
+    """ Calculate harmonic vibrational frequencies from a stack of molecular
+        Hessians for geometries of the same atoms, such as the points along
+        a reaction path (in cm-1; imaginary entries returned as negative).
+
+        :param geos: cartesian or z-matrix geometries
+        :type geos: tuple(tuple)
+        :param hesses: Hessians corresponding to the geometries
+        :type hesses: numpy.ndarray
+        :param project: project out rotations and translations of Hessian
+        :type project: bool
+        :returns: the frequencies of each point, shape (npts, 3N)
+        :rtype: numpy.ndarray
+    """
+
+    _, freqs_re, freqs_im = _frequency_analysis_batch(
+        geos, hesses, project=project)
+
+    return freqs_re - freqs_im
+
+
+def _frequency_analysis_batch(geos, hesses, project=True):
+    """ Forms the mass-weighted Hessians for a stack of geometries of the
+        same atoms and diagonalizes them all at once.
+
+        :param geos: cartesian or z-matrix geometries
+        :type geos: tuple(tuple)
+        :param hesses: Hessians corresponding to the geometries
+        :type hesses: numpy.ndarray
+        :param project: project out rotations and translations of Hessian
+        :type project: bool
+        :rtype: (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+    """
+
+    symbs = automol.geom.symbols(geos[0])
+    assert all(automol.geom.symbols(geo) == symbs for geo in geos), (
+        'Batched frequency analysis requires geometries of the same atoms')
+
+    mw_vec = mass_weighting_vector(geos[0])
+    hesses = numpy.asarray(hesses, dtype=float)
+    mw_hesses = hesses * numpy.outer((1. / mw_vec), (1. / mw_vec))
+    if project:
+        mw_hesses = _project_hessians(geos, mw_hesses, mw_vec)
+
+    fcs, mw_norm_coos = numpy.linalg.eigh(mw_hesses)
+
+    conv = qcc.conversion_factor("hartree", "wavenumber")
+    freqs = numpy.sqrt(fcs.astype(numpy.complex128)) * conv
+    freqs_im = numpy.imag(freqs)
+    freqs_re = numpy.real(freqs)
+
+    norm_coos = mw_vec * mw_norm_coos
+    norm_coos = norm_coos / numpy.linalg.norm(norm_coos, axis=1)[:, X, :]
+
+    return norm_coos, freqs_re, freqs_im
+
+
+def _project_hessians(geos, mw_hesses, mw_vec):
+    """ Project the rotations and translations out of a stack of
+        mass-weighted Hessians.
+
+        The projector P = 1 - V V^T is built from the few rotational and
+        translational vectors in V, so P^T H P is applied as a low-rank
+        update, H - V W^T - W V^T + V (V^T W) V^T with W = H V, rather than
+        as products of dense matrices.
+
+        :param geos: cartesian or z-matrix geometries
+        :type geos: tuple(tuple)
+        :param mw_hesses: mass-weighted Hessians, shape (npts, 3N, 3N)
+        :type mw_hesses: numpy.ndarray
+        :param mw_vec: mass-weighting vector of the atoms
+        :type mw_vec: numpy.ndarray
+        :rtype: numpy.ndarray
+    """
+
+    npts = len(geos)
+    trans_norm_coos = translational_normal_coordinates(
+        geos[0], mass_weighted=True)
+
+    # Rotational coordinates of every point at once, with those that vanish
+    # for linear molecules aligned to an axis zeroed rather than removed
+    xyzs = numpy.array([automol.geom.coordinates(geo) for geo in geos])
+    rot_norm_coos = numpy.cross(xyzs[:, :, X, :], numpy.eye(3)[X, X, :, :])
+    rot_norm_coos = numpy.reshape(
+        numpy.swapaxes(rot_norm_coos, 2, 3), (npts, -1, 3))
+    rot_norm_coos = mw_vec[:, X] * rot_norm_coos
+    rot_norms = numpy.linalg.norm(rot_norm_coos, axis=1)
+    rot_norm_coos = numpy.where(
+        rot_norms[:, X, :] > 1e-5, rot_norm_coos, 0.)
+
+    tr_norm_coos = numpy.concatenate(
+        [numpy.broadcast_to(trans_norm_coos, (npts,) + trans_norm_coos.shape),
+         rot_norm_coos], axis=2)
+    tr_norm_coos_t = numpy.swapaxes(tr_norm_coos, 1, 2)
+
+    hess_tr = mw_hesses @ tr_norm_coos
+    hess_tr_t = numpy.swapaxes(hess_tr, 1, 2)
+    tr_hess_tr = tr_norm_coos_t @ hess_tr
+
+    return (mw_hesses
+            - tr_norm_coos @ hess_tr_t
+            - hess_tr @ tr_norm_coos_t
+            + tr_norm_coos @ (tr_hess_tr @ tr_norm_coos_t))
+
+
 def _frequency_analysis(geo, hess, project=True):
     """ Froms the mass-weighted Hessian and diagonalizes it to obtain
         the normal coordinates and harmonic vibrational frequencies.
@@ -93,7 +218,7 @@ def _frequency_analysis(geo, hess, project=True):
     fcs, mw_norm_coos = numpy.linalg.eigh(mw_hess)
 
     conv = qcc.conversion_factor("hartree", "wavenumber")
-    freqs = numpy.sqrt(numpy.complex_(fcs)) * conv
+    freqs = numpy.sqrt(numpy.complex128(fcs)) * conv
     freqs_im = numpy.imag(freqs)
     freqs_re = numpy.real(freqs)
 
@@ -21,6 +21,8 @@ from elstruct.writer._writer import optimization
 # irc
 from elstruct.writer._writer import irc_programs
 from elstruct.writer._writer import irc
+# batches of inputs
+from elstruct.writer._writer import batch
 # mako fill utility functions
 from elstruct.writer import fill
 
@@ -47,6 +49,8 @@ __all__ = [
     # irc
     'irc_programs',
     'irc',
+    # batch
+    'batch',
     # fill
     'fill'
 ]
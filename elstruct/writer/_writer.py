@@ -571,6 +571,96 @@ def optimization(prog, geo, charge, mult, method, basis,
         saddle=saddle)
 
 
+# batch input writers
+def batch(job, prog, geos, charge, mult, method, basis,
+          # molecule options
+          mol_options=(),
+          # machine options
+          memory=1, comment='', machine_options=(),
+          # theory options
+          orb_type='RU',
+          scf_options=(), casscf_options=(), corr_options=(),
+          # generic options
+          gen_lines=None,
+          # job options
+          job_options=(), frozen_coordinates=(), saddle=False):
+    """ Writes input file strings for one type of calculation, using a
+        single theory specification, for each of a sequence of geometries.
+
+        The theory specification is processed and validated, and the
+        program writer is looked up, once for the whole batch; the input
+        strings are then generated lazily, one per geometry, in order.
+
+        :param job: job to write the input for (elstruct.Job)
+        :type job: str
+        :param prog: electronic structure program to use as a backend
+        :type prog: str
+        :param geos: cartesian or z-matrix geometries
+        :type geos: tuple(tuple)
+        :param charge: molecular charge
+        :type charge: int
+        :param mult: spin multiplicity
+        :type mult: int
+        :param method: electronic structure method
+        :type method: str
+        :param basis: basis set
+        :type basis: str
+        :param mol_options: options for the molecule block
+        :type mol_options: tuple[str]
+        ;param memory: memory in GB
+        :type memory: int
+        :param comment: a comment string to be placed at the top of the file
+        :type comment: str
+        :param machine_options: machine directives
+            (num procs, num threads, etc.)
+        :type machine_options: tuple[str]
+        :param orb_type: 'R' indicates restricted orbitals, 'U' indicates
+            unrestricted orbitals; can also be 'RR', 'RU', or 'UU'.
+            Where first (second) character sets R/U for singlets (multiplets)
+        :type orb_type: str
+        :param scf_options: scf method directives
+        :type scf_options: tuple[str]
+        :param casscf_options: casscf method directives
+        :type casscf_options: tuple[str]
+        :param corr_options: correlation method directives
+        :type corr_options: tuple[str]
+        :param gen_lines: generic lines for the input file
+        :type gen_lines: dict[idx:str]
+        :param job_options: geometry optimization routine directives
+        :type job_options: tuple[str]
+        :param frozen_coordinates: only with z-matrix geometries; list of
+            coordinate names to freeze
+        :type fozen_coordinates: tuple[str]
+        :param saddle: optimize a saddle point?
+        :type saddle: bool
+        :rtype: generator of str
+    """
+    prog, method, basis, orb_restricted = _process_theory_specifications(
+        prog, method, basis, mult, orb_type)
+    writer = pm.module_writer(prog, job)
+
+    kwargs = {
+        # molecule options
+        'mol_options': mol_options,
+        # machine options
+        'memory': memory, 'comment': comment,
+        'machine_options': machine_options,
+        # theory options
+        'scf_options': scf_options, 'casscf_options': casscf_options,
+        'corr_options': corr_options,
+        # generic options
+        'gen_lines': gen_lines,
+        # job options
+        'job_options': job_options,
+        'frozen_coordinates': frozen_coordinates,
+        'saddle': saddle,
+    }
+
+    return (writer(job, geo, charge, mult, method, basis, orb_restricted,
+                   **kwargs)
+            for geo in geos)
+
+
 def _process_theory_specifications(prog, method, basis, mult, orb_type):
     """ Process the theory method including the orbital type conversion.
 
@@ -6,6 +6,12 @@ from elstruct import par
 from elstruct import pclass
 
 
+# Supported programs, and tables of implementations filled on first use
+PROGRAMS = pclass.values(par.Program)
+_DISPATCH_DCT = {}
+_PROGS_DCT = {}
+
+
 # Functions to import and call the appropriate writer function
 def call_module_function(prog, function, *args, **kwargs):
     """ call the module implementation of a given function
@@ -16,6 +22,35 @@ def call_module_function(prog, function, *args, **kwargs):
         :type function_template: function
     """
 
+    writer = module_writer(prog, function)
+
+    return writer(function, *args, **kwargs)
+
+
+def module_writer(prog, function):
+    """ get the input writer of the module implementing a given function
+
+        The writers are looked up on first use and stored in a dispatch
+        table, keyed by program and function, for later calls.
+
+        :param prog: the program
+        :type prog: str
+        :param function: the job the writer must implement
+        :type function: str
+        :rtype: function
+    """
+
+    key = (prog, function)
+    if key not in _DISPATCH_DCT:
+        _DISPATCH_DCT[key] = _resolve_module_function(prog, function)
+
+    return _DISPATCH_DCT[key]
+
+
+def _resolve_module_function(prog, function):
+    """ import the module for a program and get its implementation
+    """
+
     def _rename_prog(prog):
         """ Rename a program if number does not match module name """
         if prog in ('molpro2021', 'molpro2021_mppx'):
@@ -25,14 +60,13 @@ def call_module_function(prog, function, *args, **kwargs):
         return prog
 
     new_name = _rename_prog(prog)
-    assert new_name in pclass.values(par.Program)
+    assert new_name in PROGRAMS
     assert new_name in program_modules_with_function(function)
 
     name = f'_{_rename_prog(prog)}'
     module = importlib.import_module(f'elstruct.writer.{name:s}')
-    writer = getattr(module, 'write_input')
 
-    return writer(function, *args, **kwargs)
+    return getattr(module, 'write_input')
 
 
 def program_modules_with_function(function):
@@ -41,12 +75,11 @@ def program_modules_with_function(function):
         :type function: function
     """
 
-    progs = []
-    for prog in pclass.values(par.Program):
-        if function in WRITER_MODULE_DCT[prog]:
-            progs.append(prog)
+    if function not in _PROGS_DCT:
+        _PROGS_DCT[function] = tuple(
+            prog for prog in PROGRAMS if function in WRITER_MODULE_DCT[prog])
 
-    return progs
+    return list(_PROGS_DCT[function])
 
 
 # Information on what writers have been implemented
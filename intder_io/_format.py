@@ -2,12 +2,12 @@
 """
 
 import os
-from itertools import chain
 import automol.geom
 import automol.zmat
 import automol.util
 from ioformat import build_mako_str
 from ioformat import indent
+from ioformat import vector_string
 
 
 # OBTAIN THE PATH TO THE DIRECTORY CONTAINING THE TEMPLATES #
@@ -95,9 +95,7 @@ def hessian_format(hess):
         :rtype: str
     """
 
-    # Flatten the Hessian out for ease of writing the string
-    hess = tuple(chain.from_iterable(hess))
-    hess_str = automol.util.vector.string(
-        hess, num_per_row=3, val_format='{0:>20.10f}')
+    # Write the Hessian flattened out, three values per row
+    hess_str = vector_string(hess, num_per_row=3, val_format='{0:>20.10f}')
 
     return hess_str
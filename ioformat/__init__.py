@@ -3,6 +3,8 @@
 """
 
 from ioformat._format import build_mako_str
+from ioformat._format import set_mako_cache
+from ioformat._format import prewarm_mako_templates
 from ioformat._format import indent
 from ioformat._format import add_line
 from ioformat._format import change_line
@@ -12,6 +14,9 @@ from ioformat._format import remove_whitespace_from_string
 from ioformat._format import remove_trail_whitespace
 from ioformat._format import remove_comment_lines
 from ioformat._format import remove_empty_lines
+from ioformat._array import vector_string
+from ioformat._array import matrix_string
+from ioformat._array import format_array
 from ioformat._string import hash_string
 from ioformat import pathtools
 from ioformat import phycon
@@ -21,6 +26,8 @@ from ioformat import ptt
 __all__ = [
     # format functions
     'build_mako_str',
+    'set_mako_cache',
+    'prewarm_mako_templates',
     'indent',
     'add_line',
     'change_line',
@@ -31,6 +38,10 @@ __all__ = [
     'remove_comment_lines',
     'remove_empty_lines',
     'addchar',
+    # arrays
+    'vector_string',
+    'matrix_string',
+    'format_array',
     # string
     'hash_string',
     # libs
@@ -0,0 +1,137 @@
+""" Fixed-width formatting of numeric arrays
+
+    Arrays are written with a single call to str.format on a template
+    holding one replacement field per value, which is built once for the
+    layout of the block, rather than formatting and appending the values
+    one at a time.
+"""
+
+import itertools
+import string
+import numpy
+
+
+def vector_string(vec, val_format='{0:>8.3f}', num_per_row=None):
+    """ Write the values of an array to a string, a number per row,
+        with the trailing whitespace removed
+
+        Arrays with more than one dimension are flattened, row by row.
+
+        :param vec: values to write
+        :type vec: list, tuple, or numpy.ndarray
+        :param val_format: format string for a single value
+        :type val_format: str
+        :param num_per_row: number of values per row; all in a single row
+            if not given
+        :type num_per_row: int
+        :rtype: str
+    """
+
+    vals = _flat_values(vec)
+    nvals = len(vals)
+    if num_per_row is None:
+        num_per_row = max(nvals, 1)
+    assert isinstance(num_per_row, int), 'Num per row must be an integer'
+
+    nrows, nrem = divmod(nvals, num_per_row)
+    val_format = _auto_numbered(val_format)
+    template = (val_format * num_per_row + '\n') * nrows + val_format * nrem
+
+    return template.format(*vals).rstrip()
+
+
+def matrix_string(mat, val_format='{0:>8.3f}', row_starts=None):
+    """ Write a matrix to a string, a row of the matrix per line,
+        with the trailing whitespace removed
+
+        :param mat: matrix to write
+        :type mat: list, tuple, or numpy.ndarray
+        :param val_format: format string for a single value
+        :type val_format: str
+        :param row_starts: strings to put at the start of each line
+        :type row_starts: tuple(str)
+        :rtype: str
+    """
+
+    nrows = len(mat)
+    ncols = len(mat[0]) if nrows else 0
+    if row_starts is None:
+        row_starts = ('',) * nrows
+    assert len(row_starts) == nrows, (
+        f'{len(row_starts)} row starts given for {nrows} rows')
+
+    vals_format = _auto_numbered(val_format) * ncols + '\n'
+    template = ''.join(
+        _escaped(row_start) + vals_format for row_start in row_starts)
+
+    return template.format(*_flat_values(mat)).rstrip()
+
+
+def format_array(template, arr, idxs=None):
+    """ Fill a template with the values of an array
+
+        The template has one automatically numbered replacement field for
+        each value written, such as '{:>14.8f}', so it can be built once
+        for a layout and reused for every array with that layout.
+
+        :param template: format string for the whole block
+        :type template: str
+        :param arr: array of values
+        :type arr: list, tuple, or numpy.ndarray
+        :param idxs: indices of the values to write, in the order that they
+            are placed in the template, as for numpy advanced indexing;
+            all values in row-major order if not given
+        :type idxs: tuple(numpy.ndarray)
+        :rtype: str
+    """
+
+    if idxs is not None:
+        arr = numpy.asarray(arr)[idxs]
+
+    return template.format(*_flat_values(arr))
+
+
+def _flat_values(arr):
+    """ Flatten an array of values, row by row, into a list
+
+        Arrays whose values convert to Python numbers without changing how
+        they are written are converted all at once; values of other arrays
+        are passed on unchanged.
+    """
+
+    if isinstance(arr, numpy.ndarray):
+        if arr.dtype == numpy.float64 or arr.dtype.kind in 'biu':
+            vals = arr.ravel().tolist()
+        else:
+            vals = list(arr.flat)
+    else:
+        vals = list(arr)
+        if vals and isinstance(vals[0], (list, tuple, numpy.ndarray)):
+            vals = list(itertools.chain.from_iterable(map(_flat_values, vals)))
+
+    return vals
+
+
+def _auto_numbered(val_format):
+    """ Rewrite a format string for a single value, such as '{0:>8.3f}',
+        with an automatically numbered field, so it can be repeated
+    """
+
+    fields = tuple(string.Formatter().parse(val_format))
+    assert sum(field[1] is not None for field in fields) == 1, (
+        f'Format {val_format} must have a single replacement field')
+
+    fmt = ''
+    for literal, name, spec, conv in fields:
+        fmt += _escaped(literal)
+        if name is not None:
+            fmt += '{' + (f'!{conv}' if conv else '') + (
+                f':{spec}' if spec else '') + '}'
+
+    return fmt
+
+
+def _escaped(literal):
+    """ Escape the braces in text to be placed in a template
+    """
+    return literal.replace('{', '{{').replace('}', '}}')
@@ -2,12 +2,23 @@
 """
 
 import os
-from mako.template import Template
+import importlib.util
+from mako.lookup import TemplateLookup
 import more_itertools as mit
 import autoparse.pattern as app
 import autoparse.find as apf
 
 
+# Packages with Mako templates, compiled by prewarm_mako_templates
+TEMPLATE_PACKAGES = (
+    'elstruct', 'intder_io', 'mess_io', 'nst_io', 'onedmin_io',
+    'polyrate_io', 'projrot_io', 'thermp_io', 'varecof_io')
+
+# Compiled templates, looked up by absolute path; the lookup recompiles a
+# template if its file has been modified since it was compiled
+_MAKO_LOOKUP = TemplateLookup(directories=['/'], filesystem_checks=True)
+
+
 # Build formatted strings
 def build_mako_str(template_file_name, template_src_path, template_keys,
                    remove_whitespace=True):
@@ -25,7 +36,7 @@ def build_mako_str(template_file_name, template_src_path, template_keys,
     """
 
     template_file_path = os.path.join(template_src_path, template_file_name)
-    mako_str = Template(filename=template_file_path).render(**template_keys)
+    mako_str = _mako_template(template_file_path).render(**template_keys)
 
     if remove_whitespace:
         mako_str = remove_trail_whitespace(mako_str)
@@ -33,6 +44,54 @@ def build_mako_str(template_file_name, template_src_path, template_keys,
     return mako_str
 
 
+def set_mako_cache(module_directory=None):
+    """ Reset the cache of compiled Mako templates used by build_mako_str
+
+        :param module_directory: directory in which to also store the
+            compiled template modules, so they can be reused by later
+            processes; None keeps them in memory only
+        :type module_directory: str
+    """
+    global _MAKO_LOOKUP  # pylint: disable=global-statement
+    _MAKO_LOOKUP = TemplateLookup(
+        directories=['/'], filesystem_checks=True,
+        module_directory=module_directory)
+
+
+def prewarm_mako_templates(template_src_paths=None):
+    """ Compile all of the Mako templates in some directories ahead of use
+
+        :param template_src_paths: directories searched, recursively, for
+            .mako files; defaults to the directories of TEMPLATE_PACKAGES
+        :type template_src_paths: tuple(str)
+        :returns: the number of templates compiled
+        :rtype: int
+    """
+
+    if template_src_paths is None:
+        template_src_paths = ()
+        for pkg_name in TEMPLATE_PACKAGES:
+            spec = importlib.util.find_spec(pkg_name)
+            if spec is not None and spec.submodule_search_locations:
+                template_src_paths += tuple(spec.submodule_search_locations)
+
+    ntemplates = 0
+    for src_path in template_src_paths:
+        for dir_path, _, file_names in os.walk(src_path):
+            for file_name in file_names:
+                if file_name.endswith('.mako'):
+                    _mako_template(os.path.join(dir_path, file_name))
+                    ntemplates += 1
+
+    return ntemplates
+
+
+def _mako_template(template_file_path):
+    """ Get the compiled Mako template for a file from the cache
+    """
+    return _MAKO_LOOKUP.get_template(os.path.abspath(template_file_path))
+
+
 def indent(string, nspaces):
     """ Indents each of the lines of a multiline string.
 
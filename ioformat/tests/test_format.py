@@ -3,6 +3,9 @@
 """
 
 import os
+import shutil
+import tempfile
+import numpy
 import ioformat
 
 
@@ -56,6 +59,39 @@ def test__string_build():
     assert ioformat.addchar(ini_string, ' +++', side='post') == 'molecule +++'
 
 
+def test__mako_cache():
+    """ test ioformat.set_mako_cache
+        test ioformat.prewarm_mako_templates
+    """
+
+    mako_keys = {'param1': 'molecule', 'param2': None, 'param3': 1}
+
+    tmp_path = tempfile.mkdtemp()
+    mod_path = tempfile.mkdtemp()
+    shutil.copy(os.path.join(MAKO_PATH, 'test.mako'), tmp_path)
+
+    ioformat.set_mako_cache(module_directory=mod_path)
+    assert ioformat.prewarm_mako_templates((tmp_path,)) == 1
+    assert any(name.endswith('.py')
+               for _, _, names in os.walk(mod_path) for name in names)
+    assert ioformat.build_mako_str('test.mako', tmp_path, mako_keys) == (
+        'param1 is molecule\n'
+        'param3 is 1\n'
+    )
+
+    # A modified template is compiled again
+    tmp_file_path = os.path.join(tmp_path, 'test.mako')
+    with open(tmp_file_path, mode='w', encoding='utf-8') as tmp_obj:
+        tmp_obj.write('changed ${param1}\n')
+    mtime = os.stat(tmp_file_path).st_mtime + 10.0
+    os.utime(tmp_file_path, (mtime, mtime))
+    assert ioformat.build_mako_str('test.mako', tmp_path, mako_keys) == (
+        'changed molecule\n'
+    )
+
+    ioformat.set_mako_cache()
+
+
 def test__string_alter():
     """ test ioformat.headlined_sections
     """
@@ -163,3 +199,33 @@ def test__string_change():
         '    Exponential\n'
         '      Factor[1/cm]                   550'
     )
+
+
+def test__array_string():
+    """ test ioformat.vector_string
+        test ioformat.matrix_string
+        test ioformat.format_array
+    """
+
+    mat = numpy.array([[1.0, -2.5, 0.125],
+                       [3.0, 4.0, -0.5]])
+
+    vec_str = ioformat.vector_string(mat, val_format='{0:>8.3f}',
+                                     num_per_row=4)
+    assert vec_str == (
+        '   1.000  -2.500   0.125   3.000\n'
+        '   4.000  -0.500')
+    assert ioformat.vector_string((1, 2, 3), val_format='{}') == '123'
+    assert ioformat.vector_string((), val_format='{}') == ''
+
+    mat_str = ioformat.matrix_string(mat, val_format='{0:>8.3f}',
+                                     row_starts=('a{', 'b}'))
+    assert mat_str == (
+        'a{   1.000  -2.500   0.125\n'
+        'b}   3.000   4.000  -0.500')
+    assert mat_str == ioformat.matrix_string(
+        mat.tolist(), val_format='{0:>8.3f}', row_starts=('a{', 'b}'))
+
+    arr_str = ioformat.format_array(
+        '{:.1f} {:.1f}\n', mat, idxs=([1, 0], [2, 1]))
+    assert arr_str == '-0.5 -2.5\n'
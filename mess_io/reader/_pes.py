@@ -2,12 +2,29 @@
   Read a MESS input file and compile data for the PES inside
 """
 
+import functools
+import collections
 import numpy as np
 import autoparse.find as apf
 import autoparse.pattern as app
 from ioformat import remove_comment_lines
 
 
+# Number of parsed inputs kept, for the readers called on the same string
+PES_CACHE_SIZE = 8
+
+BAD_SPC_WORDS = (
+    'WellDepth', 'WellCutoff', 'WellExtension',
+    'WellReductionThreshold', 'WellPartitionMethod',
+    'WellProjectionThreshold', 'PEDSpecies')
+
+# Data for the PES of a MESS input, shared by the readers of mess_io.reader
+MessPes = collections.namedtuple(
+    'MessPes',
+    ['energy_dct', 'conn_lst', 'conn_lst_dct', 'pes_label_dct',
+     'species_blocks'])
+
+
 def pes(input_string, read_fake=False):
     """ Read a MESS input file string and get info about PES
 
@@ -23,16 +40,43 @@ def pes(input_string, read_fake=False):
         :rtype: lst(str)
     """
 
-    # Initialize energy and connection information
-    energy_dct = {}
+    pes_dat = _pes_data(input_string, read_fake)
+
+    return (dict(pes_dat.energy_dct), pes_dat.conn_lst,
+            dict(pes_dat.conn_lst_dct), dict(pes_dat.pes_label_dct))
+
+
+@functools.lru_cache(maxsize=PES_CACHE_SIZE)
+def _pes_data(input_string, read_fake):
+    """ Read a MESS input file string into the energies, connectivity,
+        labels, and species blocks of the PES in a single pass, with the
+        line by line state kept for the sections whose energies and
+        fragments are still to be read
+
+        The result is cached and shared by the readers called on the same
+        input string, which only return copies of it.
+
+        :param input_string: string for a MESS (rates) input file
+        :type input_string: str
+        :param read_fake: value to include fake wells and barriers
+        :type read_fake: bool
+        :rtype: MessPes
+    """
+
+    # Energies and fragment names are read from the first lines holding
+    # them after each header, so each header leaves a slot filled in
+    # once that line is reached
+    ene_slots, lbl_slots = [], []
+    zero_ene_waits, ground_ene_waits, frag_waits = [], [], []
     conn_lst = tuple()
     conn_lst_dct = {}
-    pes_label_dct = {}
+
+    # Lines used to split the input into the species blocks
+    spc_lines, names_i, init_i, barrier_i = [], [], [], []
 
     input_string = remove_comment_lines(
         input_string, delim_pattern=app.escape('!'))
-    input_lines = input_string.splitlines()
-    for idx, line in enumerate(input_lines):
+    for line in input_string.splitlines():
 
         if 'Well' in line:
 
@@ -42,71 +86,34 @@ def pes(input_string, read_fake=False):
                 label = line_lst[1]
 
                 if ('F' not in label) or ('F' in label and read_fake):
-                    # Get energy
-                    for line2 in input_lines[idx:]:
-                        if 'ZeroEnergy' in line2:
-                            ene = float(line2.split()[-1])
-                            break
-
-                    # Add value to energy dct
-                    energy_dct[label] = ene
+                    ene_slot = []
+                    ene_slots.append((label, ene_slot))
+                    zero_ene_waits.append(ene_slot)
 
                     line_lst2 = line.split('!')
                     if len(line_lst2) == 1:
                         line_lst2 = line.split('#')
                     if len(line_lst2) > 1:
-                        spc = line_lst2[1]
-                        pes_label_dct[spc.strip()] = label
+                        lbl_slots.append((line_lst2[1].strip(), label))
                     else:
-                        pes_label_dct[label] = label
-                        #print('Warning: labeling not found for '
-                        #      f'species {label}')
+                        lbl_slots.append((label, label))
 
         if 'Bimolecular' in line:
 
             line_lst = line.strip().split()
-
             if line_lst[0].strip() == 'Bimolecular' and '!' not in line:
                 # Get label
                 label = line_lst[1]
 
-                # Get energy
-                for line2 in input_lines[idx:]:
-                    if 'Dummy' in line2:
-                        ene = -10.0
-                        break
-                    if 'GroundEnergy' in line2:
-                        ene = float(line2.split()[-1])
-                        break
-
-                # Add value to dct
-                energy_dct[label] = ene
+                ene_slot = []
+                ene_slots.append((label, ene_slot))
+                ground_ene_waits.append(ene_slot)
 
                 # Add value to PES dct - NB THIS DEPENDS ON THE INPUT FILE.
                 # IF NOT PRESENT, DO NOT GENERATE THE PES LABEL DICTIONARY
-                cnt = 0
                 frags = []
-                for line2 in input_lines[idx:]:
-                    if 'Fragment' in line2:
-                        # Try and grab name from comment line
-                        frag_line_lst = line2.split('!')
-                        if len(frag_line_lst) == 1:
-                            frag_line_lst = line2.split('#')
-                        if len(frag_line_lst) > 1:
-                            frag = frag_line_lst[1]
-                            # strip gets rid of the spaces before and after
-                            frags.append(frag.strip())
-                        else:
-                            frag_line_lst = line2.split()
-                            frag = frag_line_lst[1]
-                            frags.append(frag.strip())
-                            #print('Warning: labeling not found for '
-                            #      f'bimol fragments for {label}')
-                        cnt += 1
-                    if cnt == 2:
-                        break
-
-                pes_label_dct[' + '.join(frags)] = label
+                lbl_slots.append((frags, label))
+                frag_waits.append(frags)
 
         if 'Barrier' in line:
 
@@ -116,14 +123,9 @@ def pes(input_string, read_fake=False):
                 [tslabel, rlabel, plabel] = line_lst[1:4]
 
                 if ('F' not in tslabel) or ('F' in tslabel and read_fake):
-                    # Get energy
-                    for line2 in input_lines[idx:]:
-                        if 'ZeroEnergy' in line2:
-                            ene = float(line2.split()[-1])
-                            break
-
-                    # Add value to dct
-                    energy_dct[tslabel] = ene
+                    ene_slot = []
+                    ene_slots.append((tslabel, ene_slot))
+                    zero_ene_waits.append(ene_slot)
 
                     # Amend fake labels (may be wrong)
                     if not read_fake:
@@ -135,7 +137,116 @@ def pes(input_string, read_fake=False):
                     conn_lst += ((tslabel, plabel),)
                     conn_lst_dct[tslabel] = (rlabel, plabel)
 
-    return energy_dct, conn_lst, conn_lst_dct, pes_label_dct
+        # Fill the slots waiting on this line
+        if zero_ene_waits and 'ZeroEnergy' in line:
+            ene = float(line.split()[-1])
+            for ene_slot in zero_ene_waits:
+                ene_slot.append(ene)
+            zero_ene_waits = []
+        if ground_ene_waits and ('Dummy' in line or 'GroundEnergy' in line):
+            ene = -10.0 if 'Dummy' in line else float(line.split()[-1])
+            for ene_slot in ground_ene_waits:
+                ene_slot.append(ene)
+            ground_ene_waits = []
+        if frag_waits and 'Fragment' in line:
+            frag = _fragment_name(line)
+            for frags in frag_waits:
+                frags.append(frag)
+            frag_waits = [frags for frags in frag_waits if len(frags) < 2]
+
+        # Keep the lines that mark the species blocks
+        if line.strip() and all(bad not in line for bad in BAD_SPC_WORDS):
+            if 'Bimolecular' in line or 'Well' in line:
+                names_i.append(len(spc_lines))
+            if (('Fragment' in line or 'Species' in line) and
+                    'FragmentGeometry' not in line):
+                init_i.append(len(spc_lines))
+            if 'Barrier' in line:
+                barrier_i.append(len(spc_lines))
+            spc_lines.append(line)
+
+    # Add the values in the order of the headers; a section with no energy
+    # after its header keeps the energy of the section before it
+    energy_dct = {}
+    ene = None
+    for label, ene_slot in ene_slots:
+        if ene_slot:
+            ene = ene_slot[0]
+        energy_dct[label] = ene
+
+    pes_label_dct = {}
+    for spc, label in lbl_slots:
+        if not isinstance(spc, str):
+            spc = ' + '.join(spc)
+        pes_label_dct[spc] = label
+
+    species_blocks = _species_blocks(spc_lines, names_i, init_i, barrier_i)
+
+    return MessPes(
+        energy_dct=energy_dct, conn_lst=conn_lst, conn_lst_dct=conn_lst_dct,
+        pes_label_dct=pes_label_dct, species_blocks=species_blocks)
+
+
+def _fragment_name(line):
+    """ Get the name of a fragment from its line, using the comment if
+        there is one
+    """
+
+    frag_line_lst = line.split('!')
+    if len(frag_line_lst) == 1:
+        frag_line_lst = line.split('#')
+    if len(frag_line_lst) > 1:
+        # strip gets rid of the spaces before and after
+        frag = frag_line_lst[1].strip()
+    else:
+        frag = line.split()[1].strip()
+
+    return frag
+
+
+def _species_blocks(lines, names_i, init_i, barrier_i):
+    """ Split the lines of the input into the blocks of each species,
+        from the indices of the well and bimolecular headers (names_i),
+        the species and fragment headers (init_i), and the barriers
+    """
+
+    if not names_i:
+        return {}
+
+    names_i = np.array(names_i, dtype=int)
+    init_i = np.array(init_i, dtype=int)
+    init_i = init_i[init_i > names_i[0]]
+    # line before each name
+    final_i = np.append(init_i[1:], np.array(barrier_i, dtype=int)) - 1
+
+    # dictionary labels
+    labels = [lines[i].strip().split()[1] for i in names_i]
+    species_blocks = {k: [] for k in labels}
+
+    # extract the data
+    name = None
+    for i in np.arange(0, min(len(init_i), len(final_i))):
+
+        # type
+        sp_type = lines[init_i[i]].strip().split()[0]
+        label = lines[names_i[init_i[i] > names_i][-1]].strip().split()[1]
+
+        # name and label
+        if sp_type == 'Fragment':
+            name = 'Species ' + lines[init_i[i]].strip().split()[1]
+
+        elif sp_type == 'Species':
+            name = 'Species ' + label
+
+        elif name is None:
+            continue
+
+        # store in the dictionary
+        block = '\n'.join(lines[init_i[i]+1:final_i[i]])
+        block = name + '\n' + block
+        species_blocks[label].append(block)
+
+    return species_blocks
 
 
 def find_barrier(conn_lst_dct, reac, prod):
@@ -179,58 +290,10 @@ def get_species(input_string):
             {name:[frag1 block, frag2 block], name:[unimol block],}
         :rtype: dict{label: list}
     """
-    # find where data of interest are
-    bad_wrds = ['WellDepth', 'WellCutoff', 'WellExtension',
-                    'WellReductionThreshold', 'WellPartitionMethod',
-                    'WellProjectionThreshold', 'PEDSpecies']
-    
-    input_string = remove_comment_lines(
-        input_string, delim_pattern=app.escape('!'))
-    lines = input_string.splitlines()
-    lines = [line for line in lines if (line.strip() != '' and
-             all(bad not in line for bad in bad_wrds))]
-
-    _name_arr = np.array(
-        [('Bimolecular' in line or 'Well' in line)
-         for line in lines],
-        dtype=int)
-    names_i = np.where(_name_arr == 1)[0]
-
-    _init_arr = np.array(
-        [('Fragment' in line or 'Species' in line) and
-         'FragmentGeometry' not in line for line in lines],
-        dtype=int)
-    init_i = np.where(_init_arr == 1)[0]
-    init_i = init_i[init_i > names_i[0]]
-    
-    _barriers = np.array(['Barrier' in line for line in lines], dtype=int)
-    first_barrier = np.where(_barriers == 1)[0]
-    final_i = np.append(init_i[1:], first_barrier) -1 # line before each name
 
-    # dictionary labels
-    labels = [lines[i].strip().split()[1] for i in names_i]
-    species_blocks = {k: [] for k in labels}
-
-    # extract the data
-    for i in np.arange(0, len(init_i)):
-
-        # type
-        sp_type = lines[init_i[i]].strip().split()[0]
-        label = lines[names_i[init_i[i] > names_i][-1]].strip().split()[1]
-
-        # name and label
-        if sp_type == 'Fragment':
-            name = 'Species ' + lines[init_i[i]].strip().split()[1]
-
-        elif sp_type == 'Species':
-            name = 'Species ' + label
+    species_blocks = _pes_data(input_string, False).species_blocks
 
-        # store in the dictionary
-        block = '\n'.join(lines[init_i[i]+1:final_i[i]])
-        block = name + '\n' + block
-        species_blocks[label].append(block)
-
-    return species_blocks
+    return {label: list(blocks) for label, blocks in species_blocks.items()}
 
 
 def dct_species_fragments(species_blocks):
@@ -3,10 +3,12 @@
     Reads mess inp and log files
 """
 import sys
+import itertools
+import collections
 import numpy as np
 import pandas as pd
 import autoparse.find as apf
-from mess_io.reader._pes import pes
+from mess_io.reader._pes import _pes_data
 from mess_io.reader._label import name_label_dct
 from automol.util.dict_ import invert
 
@@ -22,7 +24,7 @@ def get_hot_species(input_str):
     """
 
     # Get the MESS input lines
-    energy_dct, _, _, _ = pes(input_str)
+    energy_dct = _pes_data(input_str, False).energy_dct
     mess_lines = input_str.splitlines()
     try:
         hotsp_i = apf.where_in('HotEnergies', mess_lines)[0]
@@ -192,6 +194,274 @@ def extract_hot_branching(hot_log_str, hotspecies_en, species_lst,
     return hoten_dct
 
 
+# Hot branching fractions for a hot species, stored as a dense array
+HotBranching = collections.namedtuple(
+    'HotBranching',
+    ['temps', 'pressures', 'energies', 'species', 'branch_ratios'])
+
+
+def extract_hot_branching_array(hot_log_str, hotspecies_en, species_lst,
+                                sp_labels='auto', filter_out01=False):
+    """ Extract hot branching fractions for the hot species into arrays
+
+        Reads the same values as extract_hot_branching in a single pass
+        over the blocks of the log, storing them for each hot species in
+        one array of shape (ntemps, npressures, nenergies, nspecies), with
+        NaN for the energies not read at a temperature and pressure. The
+        energies are in decreasing order, as in the MESS output.
+
+        :param hot_log_str: string of mess log file
+        :type hot_log_str: str
+        :param hotspecies_en: dct of hotspecies and corresponding energy
+        :type hotspecies_en: dct{hotspecies: en}
+        :param species_lst: list of all species on the PES
+        :type species_lst: list
+        :param sp_labels: type of species labels: 'inp' is how you find them
+                in mess input, 'out' is how they are labeled in the output;
+                'auto' decides 'inp' if it finds the lbl dct
+        :type sp_labels: str
+        :return hoten_arr_dct: hot branching fractions for hotspecies
+        :rtype hoten_arr_dct: dct{hotspecies: HotBranching}
+    """
+
+    # get label dictionary
+    lbl_dct = name_label_dct(hot_log_str)
+    if sp_labels == 'auto':
+        sp_labels = 'inp'*(not not lbl_dct) + 'out'*(not lbl_dct)
+    if sp_labels == 'inp':
+        messout_dct = {
+            hotspecies: invert(lbl_dct)[hotspecies]
+            for hotspecies in hotspecies_en}
+    elif sp_labels == 'out':
+        messout_dct = {hotspecies: hotspecies for hotspecies in hotspecies_en}
+    else:
+        raise ValueError('*Error: sp_labels must be "inp" (as in mess input) \
+            or "out" (as in mess output)')
+
+    lines = hot_log_str.splitlines()
+
+    # 1. find the lines limiting the blocks in a single pass
+    pt_i_array, hot_i_array, end_hot_i_array = _hot_branching_block_indices(
+        lines)
+
+    # extract P, T
+    pt_list = [
+        [float(var) for var in lines[pt_i].strip().split()[2:7:4]]
+        for pt_i in pt_i_array]
+    pressures = sorted(set(pt[0] for pt in pt_list))
+    temps = sorted(set(pt[1] for pt in pt_list))
+    temp_idx_dct = {temp: idx for idx, temp in enumerate(temps)}
+    press_idx_dct = {press: idx for idx, press in enumerate(pressures)}
+
+    # hot species whose names start each line, as matched by startswith
+    prefix_dct = {}
+
+    # 2. read the rows of each hot species from each block
+    blocks_dct = {hotspecies: [] for hotspecies in hotspecies_en}
+    for i, hot_i in enumerate(hot_i_array):
+
+        _press, _temp = pt_list[i]
+
+        # options for different outputs:
+        header = lines[hot_i+1].strip().split()
+        if 'WellE' in lines[hot_i+1]:
+            species_bf_i_messout = header[2:-1]
+            val_slc = slice(2, -1)
+        elif 'kcal ' in lines[hot_i+1]:
+            species_bf_i_messout = header[3:]
+            val_slc = slice(2, None)
+        else:
+            raise ValueError('*Error in reading hoten blocks')
+
+        if sp_labels == 'inp':
+            species_bf_i = [lbl_dct[sp_i] for sp_i in species_bf_i_messout]
+        else:
+            species_bf_i = species_bf_i_messout
+
+        # sort the lines of the block by the hot species they start with
+        rows_dct = {hotspecies: [] for hotspecies in hotspecies_en}
+        for line in lines[hot_i+2:end_hot_i_array[i]]:
+            line_lst = line.split()
+            if not line_lst:
+                continue
+            if line_lst[0] not in prefix_dct:
+                prefix_dct[line_lst[0]] = [
+                    hotspecies for hotspecies, messout in messout_dct.items()
+                    if line_lst[0].startswith(messout)]
+            for hotspecies in prefix_dct[line_lst[0]]:
+                rows_dct[hotspecies].append(line_lst)
+
+        for hotspecies, rows in rows_dct.items():
+            if rows:
+                sp_i = apf.where_is(
+                    messout_dct[hotspecies], species_bf_i_messout)
+                hot_es, branch_ratios = _hot_branching_rows(
+                    rows, val_slc, hotspecies_en[hotspecies], sp_i,
+                    filter_out01)
+                if hot_es:
+                    blocks_dct[hotspecies].append(
+                        (temp_idx_dct[_temp], press_idx_dct[_press],
+                         hot_es, branch_ratios,
+                         _hot_branching_columns(species_bf_i, species_lst)))
+
+    # 3. allocate the arrays
+    hoten_arr_dct = {}
+    for hotspecies, blocks in blocks_dct.items():
+        energies = sorted(
+            set(itertools.chain(*(block[2] for block in blocks))),
+            reverse=True)
+        species = list(dict.fromkeys(
+            itertools.chain(*(block[4][0] for block in blocks))))
+        ene_idx_dct = {ene: idx for idx, ene in enumerate(energies)}
+        spc_idx_dct = {spc: idx for idx, spc in enumerate(species)}
+
+        branch_arr = np.full(
+            (len(temps), len(pressures), len(energies), len(species)), np.nan)
+        for temp_idx, press_idx, hot_es, branch_ratios, cols in blocks:
+            block_cols, merge_idxs = cols
+            ene_idxs = [ene_idx_dct[ene] for ene in hot_es]
+            spc_idxs = [spc_idx_dct[spc] for spc in block_cols]
+            block_arr = np.zeros((len(hot_es), len(block_cols)))
+            for col_idx, br_idx in merge_idxs:
+                block_arr[:, col_idx] += branch_ratios[:, br_idx]
+            branch_arr[temp_idx, press_idx][np.ix_(ene_idxs, spc_idxs)] = (
+                block_arr)
+
+        hoten_arr_dct[hotspecies] = HotBranching(
+            temps=np.array(temps), pressures=np.array(pressures),
+            energies=np.array(energies), species=tuple(species),
+            branch_ratios=branch_arr)
+
+    return hoten_arr_dct
+
+
+def _hot_branching_block_indices(lines):
+    """ Indices of the lines with the pressure and temperature, of the
+        headers of the hot branching blocks, and of the lines ending them,
+        found as extract_hot_branching does with autoparse.find.where_in
+
+        :rtype: (list(int), list(int), list(int))
+    """
+
+    pt_idxs, hot_idxs, alt_hot_idxs, end_idxs = [], [], [], []
+    for idx, line in enumerate(lines):
+        if 'Pressure' in line and 'Temperature' in line:
+            pt_idxs.append(idx)
+        if 'Hot distribution branching ratios' in line:
+            hot_idxs.append(idx)
+        if 'hot energies branching fractions' in line:
+            alt_hot_idxs.append(idx)
+        if ('prompt' in line and 'isomerization' in line
+                and 'dissociation' in line):
+            end_idxs.append(idx)
+
+    # different output
+    if not hot_idxs:
+        hot_idxs = alt_hot_idxs
+
+    return pt_idxs, hot_idxs, end_idxs
+
+
+def _hot_branching_rows(rows, val_slc, ref_en, sp_i, filter_out01):
+    """ Read the energies and branching ratios of a hot species from its
+        rows of a block, keeping the first valid row at each energy above 0
+
+        :rtype: (list(float), numpy.ndarray)
+    """
+
+    # rescale energy by the hotspecies energy on the PES!!
+    hot_es = [float(row[1]) - ref_en for row in rows]
+    branch_ratio_arr = np.array([row[val_slc] for row in rows], dtype=float)
+
+    valid = np.ones(len(rows), dtype=bool)
+    if filter_out01:
+        # if the reactant branching is above 1, keep only the reactant
+        if sp_i.size > 0:
+            over_one = branch_ratio_arr[:, sp_i[0]] > 1
+            branch_ratio_arr[over_one] = 1e-19
+            branch_ratio_arr[over_one, sp_i[0]] = 1
+
+        # remove negative values or values >1 and renormalize
+        br_filter = np.abs(branch_ratio_arr * (
+            (1e-20 < branch_ratio_arr) & (branch_ratio_arr <= 1)))
+        valid = ~np.all(br_filter == 0, axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            branch_ratio_arr = br_filter / np.sum(br_filter, axis=1)[:, None]
+
+    # pick only values above 0, once per energy
+    keep_idxs, hot_e_lvl = [], set()
+    for idx, hot_e in enumerate(hot_es):
+        if hot_e > 0 and hot_e not in hot_e_lvl and valid[idx]:
+            keep_idxs.append(idx)
+            hot_e_lvl.add(hot_e)
+
+    return [hot_es[idx] for idx in keep_idxs], branch_ratio_arr[keep_idxs]
+
+
+def _hot_branching_columns(species_bf_i, species_lst):
+    """ Columns of the branching fractions of a block, after summing the
+        fake wells into their wells, along with the column each of the
+        species read is added to
+
+        :rtype: (list(str), list((int, int)))
+    """
+
+    fake_dct = {sp_i: sp_i.split('FakeW-')[1]
+                for sp_i in species_bf_i if 'FakeW' in sp_i}
+
+    cols = list(species_lst) + [
+        sp_i for sp_i in species_bf_i if sp_i not in species_lst]
+    cols = [col for col in dict.fromkeys(cols) if col not in fake_dct]
+    col_idx_dct = {col: idx for idx, col in enumerate(cols)}
+
+    # the real species are set first and the fake wells then added on
+    merge_idxs = [
+        (col_idx_dct[sp_i], br_idx) for br_idx, sp_i in enumerate(species_bf_i)
+        if sp_i not in fake_dct]
+    merge_idxs += [
+        (col_idx_dct[fake_dct[sp_i]], br_idx)
+        for br_idx, sp_i in enumerate(species_bf_i) if sp_i in fake_dct]
+
+    return cols, merge_idxs
+
+
+def hot_branching_dataframe(hot_branching):
+    """ Convert the hot branching fractions of a hot species from arrays
+        into the layout of extract_hot_branching
+
+        :param hot_branching: hot branching fractions of a hot species
+        :type hot_branching: HotBranching
+        :rtype: df[P][T]:df[allspecies][energies]
+    """
+
+    hoten_df = pd.DataFrame(
+        index=list(hot_branching.temps),
+        columns=list(hot_branching.pressures))
+    for temp_idx, temp in enumerate(hot_branching.temps):
+        for press_idx, press in enumerate(hot_branching.pressures):
+            branch_arr = hot_branching.branch_ratios[temp_idx, press_idx]
+            read = ~np.all(np.isnan(branch_arr), axis=1)
+            if np.any(read):
+                hoten_df.at[temp, press] = pd.DataFrame(
+                    branch_arr[read],
+                    index=hot_branching.energies[read],
+                    columns=list(hot_branching.species))
+
+    return hoten_df
+
+
+def hot_branching_dataframes(hoten_arr_dct):
+    """ Convert the hot branching fractions of all hot species from arrays
+        into the layout of extract_hot_branching
+
+        :param hoten_arr_dct: hot branching fractions for hotspecies
+        :type hoten_arr_dct: dct{hotspecies: HotBranching}
+        :rtype: dct{hotspecies: df[P][T]:df[allspecies][energies]}
+    """
+    return {hotspecies: hot_branching_dataframe(hot_branching)
+            for hotspecies, hot_branching in hoten_arr_dct.items()}
+
+
 def extract_fne(log_str, sp_labels='auto'):
     """ Extract fne from log file
         :param log_str: string of mess log file
@@ -4,6 +4,7 @@
 
 from doctest import OutputChecker
 import sys
+import itertools
 import numpy as np
 import pandas as pd
 import copy
@@ -72,71 +73,21 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
         :rtype ped_df_dct: {((reacs,),(prods,),(None,)): dataframe(series(float))}
         for hotwells is ((reacs,),(prods,),(None,)): dataframe(series(series((float)))
     """
-    def prob_en_single(probability, energy, del_neg = False):
-        # build the series and put in dataframe after
-        # removing negative probs and renormalizing
-        # integrate with the trapezoidal rule
-        # if PEDtype is bimol, it checks for neg vals.
-        prob_en = pd.Series(probability, index=energy, dtype=float)
-        # remove duplicate indices 
-        prob_en = prob_en[~prob_en.index.duplicated(keep = 'first')]
-        prob_en = prob_en.sort_index()
-
-        # if there are negative energies (might happen for multiple ped prods)
-        prob_en = prob_en[prob_en.index > 0]
-
-        # prob_en = prob_en[prob_en > 0]
-        if del_neg:
-            if np.trapz(prob_en.values, x=prob_en.index) < 0:
-                # I don't know how to treat negative probabilities
-                # alternative: set the absolute value? or do nothing
-                prob_en *= 0
-            
-            elif len(prob_en[prob_en <= 0]) > 0:
-                # find indexes of non positive  values
-                idx_neg = np.where(prob_en <= 0)[0]
-                idx_max = np.argmax(prob_en) #turn this to max val?
-                # indexes of negative values closest to the center of ped (always =1)
-                try:
-                    low = idx_neg[idx_neg < idx_max][-1]+1
-                except IndexError:
-                    low = 0
-                try:
-                    up = idx_neg[idx_neg > idx_max][0]
-                except IndexError:
-                    up = -1
-
-                prob_en = prob_en.iloc[low:up]
-        # algorithm before 05-25-2022
-        # if there are negative values of the probability: remove them
-        #    prob_en = prob_en[prob_en[prob_en < 0].index[-1]+1:]
-        #    print(prob_en, '\n')
-        # integrate with trapz
-        prob_en /= abs(np.trapz(prob_en.values, x=prob_en.index))
-
-        # if issues : keep only max value like dirac delta
-        if any(np.isnan(prob_en.values)) or any(np.isinf(prob_en.values)):
-            prob_en = np.nan
-
-        try:
-            if max(prob_en) > 1:
-                prob_en /= max(prob_en)
-        except ValueError:
-            prob_max = np.argmax(probability)
-            prob_en = pd.Series(probability[prob_max], index=energy[prob_max])
-
-        except TypeError:
-            pass
-
-        return prob_en
-
     def indexes(label_messout, ped_lines):
-        species_i = apf.where_in(label_messout, ped_lines)+1
-        empty_i = apf.where_is('', ped_lines)
-        final_i = np.array([empty_i[i < empty_i][0] for i in species_i])
+        species_i = _where_in(
+            label_messout, pedoutput_str, ped_lines, line_starts)+1
+        # first empty line after each species_i
+        final_i = empty_i[np.searchsorted(empty_i, species_i, side='right')]
 
         return species_i, final_i
 
+    def block_array(i_in, i_fin):
+        " energies and probabilities of a block, read once for all labels "
+        if (i_in, i_fin) not in block_dct:
+            block_dct[(i_in, i_fin)] = _block_array(ped_lines[i_in:i_fin])
+
+        return block_dct[(i_in, i_fin)]
+
     def def_prods_outinp(sp_labels, prods_list, lbl_dct):
         if sp_labels == 'inp':
             prods_outinp = pd.Series([lbl_dct[prod]
@@ -185,10 +136,15 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
         return ped_spc, hotwells
 
     ped_lines = pedoutput_str.splitlines()
+    line_starts = np.cumsum(
+        [0] + [len(line) for line in pedoutput_str.splitlines(keepends=True)])
+    empty_i = apf.where_is('', ped_lines)
+    block_dct = {}
 
     # apf.where data of interest are
-    pressure_i = apf.where_in('pressure', ped_lines)
-    temperature_i = apf.where_in('temperature', ped_lines)
+    pressure_i = _where_in('pressure', pedoutput_str, ped_lines, line_starts)
+    temperature_i = _where_in(
+        'temperature', pedoutput_str, ped_lines, line_starts)
 
     # get T, P list
     pressure_lst = np.array([ped_lines[P].strip().split('=')[1]
@@ -255,7 +211,7 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
         if outtype == 2 and len(label[0]) == 1:
             species_i, final_i = indexes('well: {}'.format(reacs), ped_lines) # TO BE TESTED
             species_i = np.array([i for i in species_i if 'hot' not in ped_lines[i-1]], dtype = int)+1   # remove "hot" labels
-            final_i = [final_i[final_i > i][0] for i in species_i] # first empty line after each species_i
+            final_i = final_i[np.searchsorted(final_i, species_i, side='right')] # first empty line after each species_i
             label_messout = copy.deepcopy(prods)
 
         # column label
@@ -274,12 +230,9 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
             pressure, temp = pressure_lst[i], temperature_lst[i]
             i_in, i_fin = species_i[i], final_i[i]
 
-            en_prob_all = np.array(
-                [line.strip().split() for line in ped_lines[i_in:i_fin]],
-                dtype=float).T
-            energy = en_prob_all[:][0] + ene0
-            probability = en_prob_all[:][column_i]
-            ped_df.at[temp,pressure] = prob_en_single(probability, energy)
+            en_prob_all = block_array(i_in, i_fin)
+            ped_df.at[temp,pressure] = _normalized_peds(
+                en_prob_all[:, 0], en_prob_all[:, [column_i]], [ene0])[0]
 
         ped_df_dct[label] = ped_df
 
@@ -304,25 +257,31 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
 
         prods_outinp = def_prods_outinp(sp_labels, prods_list, lbl_dct)
 
-        ene0_all = pd.Series(-np.array([energy_dct[prods_outinp[prods]]
-                                        for prods in prods_list]), index=prods_list)
+        ene0_all = -np.array([energy_dct[prods_outinp[prods]]
+                              for prods in prods_list])
         # allocate dataframes and labels
         for prods in prods_outinp.values:
             label = ((hotwell,), tuple(prods.split('+')), (None,))
             ped_df_dct[label] = pd.DataFrame(index=list(set(temperature_lst)),
                                              columns=list(set(pressure_lst)), dtype=object)
 
+        # P, T of each block: the last ones given before it
+        pressure_blk = _last_before(pressure_lst, pressure_i, species_i+1)
+        temperature_blk = _last_before(
+            temperature_lst, temperature_i, species_i+1)
+
         # extract the data
         for i in np.arange(0, len(species_i)):
             i_in, i_fin = species_i[i]+1, final_i[i]
-            pressure, temp = pressure_lst[pressure_i <
-                                          i_in][-1], temperature_lst[temperature_i < i_in][-1]
+            pressure, temp = pressure_blk[i], temperature_blk[i]
         
             init_energy = float(ped_lines[i_in -
                                           2].split('=')[-1].strip().split()[0]) - energy_dct[hotwell]
-            en_prob_all = np.array(
-                [line.strip().split() for line in ped_lines[i_in:i_fin]],
-                dtype=float).T
+            en_prob_all = block_array(i_in, i_fin)
+            # normalize the peds of all the products at once
+            peds = _normalized_peds(
+                en_prob_all[:, 0], en_prob_all[:, 1:len(prods_list)+1],
+                ene0_all)
 
             for pi, prods in enumerate(prods_list):
 
@@ -335,11 +294,7 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
                 except KeyError:
                     pass
                 finally:
-                    energy = en_prob_all[:][0] + ene0_all[prods]
-                    probability = en_prob_all[:][pi+1]
-                    # print(probability)
-                    ped_df_dct[label].at[temp, pressure][init_energy] = prob_en_single(
-                        probability, energy)
+                    ped_df_dct[label].at[temp, pressure][init_energy] = peds[pi]
                     # print(label, prods , pressure, temp , ped_df_dct[label][pressure][temp][init_energy])
                     ped_df_dct[label].at[temp, pressure] = ped_df_dct[label][pressure][temp].dropna(
                     )
@@ -352,3 +307,123 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
     [ped_df_dct.pop(key) for key in keydel]
             
     return ped_df_dct
+
+
+def _where_in(word, out_str, lines, line_starts):
+    """ Find the lines with the word, as autoparse.find.where_in, looking
+        for it in the whole output string rather than line by line
+
+        :param word: word/s to look for; all must be in the line
+        :type word: str/list for multiple words
+        :param out_str: output string
+        :type out_str: str
+        :param lines: lines of the output string
+        :type lines: list(str)
+        :param line_starts: position of the start of each line in out_str
+        :type line_starts: numpy.ndarray
+        :rtype: numpy.ndarray
+    """
+
+    words = [word] if isinstance(word, str) else list(word)
+
+    found_pos = []
+    pos = out_str.find(words[0])
+    while pos != -1:
+        found_pos.append(pos)
+        pos = out_str.find(words[0], pos+1)
+    line_i = np.unique(
+        np.searchsorted(line_starts, found_pos, side='right') - 1)
+
+    return np.array(
+        [i for i in line_i if all(word_i in lines[i] for word_i in words[1:])],
+        dtype=int)
+
+
+def _last_before(vals, vals_i, line_i):
+    """ Values read on the last of the lines vals_i before each of line_i
+
+        :param vals: values read on each of the lines vals_i
+        :type vals: numpy.ndarray
+        :param vals_i: indices of the lines with the values, increasing
+        :type vals_i: numpy.ndarray
+        :param line_i: indices of the lines to find the values for
+        :type line_i: numpy.ndarray
+        :rtype: numpy.ndarray
+    """
+    last_i = np.searchsorted(vals_i, line_i) - 1
+    if np.any(last_i < 0):
+        raise IndexError('*Error: PED block found before any T, P line')
+
+    return vals[last_i]
+
+
+def _block_array(block_lines):
+    """ Read the lines of a PED block into a 2-D array, with a row for each
+        energy and the energy in the first column
+
+        :param block_lines: lines of the block
+        :type block_lines: list(str)
+        :rtype: numpy.ndarray
+    """
+    rows = [line.split() for line in block_lines]
+    ncols = len(rows[0]) if rows else 0
+    if any(len(row) != ncols for row in rows):
+        raise ValueError('*Error: PED block rows of different lengths')
+
+    vals = list(itertools.chain.from_iterable(rows))
+    return np.array(vals, dtype=float).reshape(len(rows), ncols)
+
+
+def _normalized_peds(energy, probs, ene0s):
+    """ Build the energy distributions of several channels sharing the
+        energies of a block, each normalized to 1 with the trapezoidal rule
+
+        Duplicate energies are dropped, keeping the first, and only the
+        positive energies (which might not be all for multiple ped prods)
+        are kept after shifting each channel by its energy. Distributions
+        whose norm is not finite are returned as NaN; channels without
+        positive energies keep only the maximum probability, like a dirac
+        delta. Distributions with values above 1 are rescaled to a maximum
+        of 1.
+
+        :param energy: energies of the block
+        :type energy: numpy.ndarray
+        :param probs: probabilities, with a column for each channel
+        :type probs: numpy.ndarray
+        :param ene0s: energy to add to the energies of each channel
+        :type ene0s: list(float)
+        :return peds: energy distribution of each channel
+        :rtype peds: tuple(pandas.Series)
+    """
+
+    # sorted energies, without duplicates, shifted for each channel
+    _, uniq_idxs = np.unique(energy, return_index=True)
+    ene = energy[uniq_idxs][:, None] + np.asarray(ene0s)
+    prob = probs[uniq_idxs]
+    # energies are increasing, so the positive ones are the last of each
+    # column and a trapezoid counts if its first energy is positive
+    pos = ene > 0
+
+    trapz = np.diff(ene, axis=0) * (prob[1:] + prob[:-1]) / 2.0
+    norm = np.sum(np.where(pos[:-1], trapz, 0.), axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        prob = prob / np.abs(norm)
+        finite = np.all(np.isfinite(prob) | ~pos, axis=0)
+        prob_max = np.max(np.where(pos, prob, -np.inf), axis=0)
+        prob = np.where(prob_max > 1, prob / prob_max, prob)
+
+    peds = ()
+    for chn_i in range(probs.shape[1]):
+        chn_pos = pos[:, chn_i]
+        if not finite[chn_i]:
+            ped = np.nan
+        elif np.any(chn_pos):
+            ped = pd.Series(prob[chn_pos, chn_i], index=ene[chn_pos, chn_i])
+        else:
+            prob_max_i = np.argmax(probs[:, chn_i])
+            ped = pd.Series(
+                [probs[prob_max_i, chn_i]],
+                index=[energy[prob_max_i] + ene0s[chn_i]])
+        peds += (ped,)
+
+    return peds
@@ -12,8 +12,6 @@ from phydat import phycon
 import autoparse.find as apf
 from mess_io.reader._label import relabel
 from mess_io.reader._label import name_label_dct
-import pyparsing as pp
-from pyparsing import pyparsing_common as ppc
 
 # Global lists
 UNWANTED_RXN_TYPS = ('fake', 'self', 'loss', 'capture', 'reverse')
@@ -43,15 +41,18 @@ def get_rxn_ktp_dct(out_str,
     """
 
     # Get the MESS rxn in the tuple format ((rct,), (prd,), third_body))
-    # For each rxn pair, get rate constants, with filtering as indicated
+    # Index all of the rate tables once, then pull each reaction's k(T,P)s
     rxns = reactions(out_str)
+    tbl_idx = _rate_table_index(out_str.splitlines())
+    _pressures, _ = pressures(out_str, mess_file='out')
     rxn_ktp_dct = {}
     for rxn in rxns:
-        rxn_ktp_dct[rxn] = ktp_dct(out_str, rxn[0][0], rxn[1][0],
-                                   filter_kts=filter_kts, tmin=tmin,
-                                   tmax=tmax, pmin=pmin, pmax=pmax,
-                                   convert=convert)
-        
+        rxn_ktp_dct[rxn] = _ktp_dct_from_index(
+            tbl_idx, _pressures, rxn[0][0], rxn[1][0],
+            filter_kts=filter_kts, tmin=tmin,
+            tmax=tmax, pmin=pmin, pmax=pmax,
+            convert=convert)
+
     # Reformat the dictionary keys to follow the tuple of tuples format
     lbl_dct = name_label_dct(out_str)
     # Read the reactions; filter them if requested
@@ -100,22 +101,76 @@ def ktp_dct(output_str, reactant, product, filter_kts=True, tmin=None,
         :rtype dict[float: (float, float)]
     """
 
-    # Get the MESS output lines
-    out_lines = output_str.splitlines()
-    # Initialize dictionary with high-pressure rate constants
-    _highp = _highp_kts(out_lines, reactant, product)
+    tbl_idx = _rate_table_index(output_str.splitlines())
+    _pressures, _ = pressures(output_str, mess_file='out')
+
+    return _ktp_dct_from_index(tbl_idx, _pressures, reactant, product,
+                               filter_kts=filter_kts, tmin=tmin, tmax=tmax,
+                               pmin=pmin, pmax=pmax, convert=convert)
+
+
+def ktp_tables(output_str):
+    """ Parses every k(T) table in the MESS output file string in a
+        single pass over the lines.
+
+        Each table is stored with the temperatures, the product column
+        labels, and the rate constants as a (ntemps, nproducts) array.
+        Undefined rate constants (***, nan) are stored as NaN.
+        Pressures in atm; units of the rate constants are as in the file.
+
+        :param output_str: string of lines of MESS output file
+        :type output_str: str
+        :rtype: dict[str: dict[float/str: (numpy.ndarray, tuple(str),
+            numpy.ndarray)]]
+    """
+
+    hp_dct, pdep_dct = _rate_table_index(output_str.splitlines())
+
+    tbl_dct = {}
+    for reactant, table in hp_dct.items():
+        tbl_dct.setdefault(reactant, {})['high'] = table
+    for reactant, pdep_tables in pdep_dct.items():
+        rct_dct = tbl_dct.setdefault(reactant, {})
+        for mess_press, mess_punit, table in pdep_tables:
+            atm_pressure = _convert_pressure(mess_press, mess_punit)
+            rct_dct.setdefault(atm_pressure, table)
+
+    return tbl_dct
+
+
+def _ktp_dct_from_index(tbl_idx, _pressures, reactant, product,
+                        filter_kts=True, tmin=None, tmax=None,
+                        pmin=None, pmax=None, convert=True):
+    """ Build the ktp dictionary for a single reaction from the
+        rate-table index built by `_rate_table_index`.
 
-    if _highp is not None:
-        _ktp_dct = {'high': _highp_kts(out_lines, reactant, product)}
+        :param tbl_idx: high-pressure and pressure-dependent table index
+        :type tbl_idx: (dict, dict)
+        :param _pressures: pressures read from the MESS output (with 'high')
+        :type _pressures: tuple(float, str)
+        :param reactant: label for the reactant used in the MESS output
+        :type reactant: str
+        :param product: label for the product used in the MESS output
+        :type product: str
+        :rtype dict[float: (float, float)]
+    """
+
+    hp_dct, pdep_dct = tbl_idx
+
+    # Initialize dictionary with high-pressure rate constants
+    if reactant in hp_dct:
+        _ktp_dct = {'high': _table_kts(hp_dct[reactant], product)}
     else:
         _ktp_dct = {}
 
-    # Read the pressures and convert them to atm if needed
-    _pressures, _ = pressures(output_str, mess_file='out')
-
     # Update the dictionary with the pressure-dependent rate constants
+    pdep_tables = pdep_dct.get(reactant, ())
     for pressure in (_press for _press in _pressures if _press != 'high'):
-        _ktp_dct.update(_pdep_kts(out_lines, reactant, product, pressure))
+        for mess_press, mess_punit, table in pdep_tables:
+            if numpy.isclose(mess_press, pressure):
+                atm_pressure = _convert_pressure(pressure, mess_punit)
+                _ktp_dct[atm_pressure] = _table_kts(table, product)
+                break
     bimol = (reactant[0] == 'P') or ('+' in reactant)
 
     # Note: filtering is before unit conversion, so bimolthresh is in cm^3.s^-1
@@ -128,132 +183,109 @@ def ktp_dct(output_str, reactant, product, filter_kts=True, tmin=None,
     return _ktp_dct
 
 
-def _highp_kts(out_lines, reactant, product):
-    """ Parses the MESS output file string for the rate constants [k(T)]s
-        for a single reaction at the high-pressure limit.
+def _rate_table_index(out_lines):
+    """ Scans the lines of the MESS output once and reads every table in the
+        high-pressure and the pressure-dependent Temperature-Species
+        Rate Tables blocks.
+
+        Only the first table for a given reactant (and pressure) is used
+        downstream, mirroring the order the blocks appear in the file.
 
         :param out_lines: all of the lines of MESS output
         :type out_lines: list(str)
-        :param reactant: label for the reactant used in the MESS output
-        :type reactant: str
-        :param product: label for the product used in the MESS output
-        :type product: str
-        :return rate_constants: all high-P rate constants for the reaction
-        :rtype list(float)
+        :return: high-pressure tables {reactant: table} and pressure-dependent
+            tables {reactant: [(pressure, unit, table), ...]}
+        :rtype: (dict, dict)
     """
 
-    # Find where the block of text where the high-pressure rates exist
-    block_str = ('High Pressure Rate Coefficients ' +
-                 '(Temperature-Species Rate Tables):')
-    for i, line in enumerate(out_lines):
-        if block_str in line:
-            block_start = i
-            for j in range(i, len(out_lines)):
-                if '_________________________________' in out_lines[j]:
-                    block_end = j
-                    break
-            break
-    block_lines = out_lines[block_start: block_end]
-    # Get the high-pressure rate constants
-    rate_constants = None
-    for i, line in enumerate(block_lines):
-        # Find line with reactant name
-        # If they match desired reactant, read rates
-        # Rates start one line later in output
-        if 'Reactant =' in line:
-            mess_reac = line.strip().split()[2]
-            if mess_reac == reactant:
-                rate_constants = _parse_reactant_rate_constants(
-                    block_lines, i+1, product)
-                break
+    hp_block_str = ('High Pressure Rate Coefficients ' +
+                    '(Temperature-Species Rate Tables):')
+    pdep_block_str = 'Temperature-Species Rate Tables:'
+    block_end_str = '_________________________________'
+
+    hp_dct, pdep_dct = {}, {}
+    block, seen_blocks = None, set()
+    idx, nlines = 0, len(out_lines)
+    while idx < nlines:
+        line = out_lines[idx]
+        if block is None:
+            # Only the first occurrence of each block is read
+            if hp_block_str in line and 'high' not in seen_blocks:
+                block = 'high'
+                seen_blocks.add(block)
+            elif pdep_block_str in line and 'pdep' not in seen_blocks:
+                block = 'pdep'
+                seen_blocks.add(block)
+            idx += 1
+        elif block_end_str in line:
+            block = None
+            idx += 1
+        elif 'Reactant =' in line:
+            # Reactant = <rct>                        [high]
+            # Reactant = <rct>   Pressure = <P> <unit> [pdep]
+            # Product headers start one [high] or two [pdep] lines later
+            tmp = line.strip().split()
+            if block == 'high':
+                table, idx = _read_rate_table(out_lines, idx+1)
+                hp_dct.setdefault(tmp[2], table)
+            else:
+                mess_press, mess_punit = float(tmp[5]), tmp[6]
+                table, idx = _read_rate_table(out_lines, idx+2)
+                pdep_dct.setdefault(tmp[2], []).append(
+                    (mess_press, mess_punit, table))
+        else:
+            idx += 1
 
-    return rate_constants
+    return hp_dct, pdep_dct
 
 
-def _pdep_kts(out_lines, reactant, product, pressure):
-    """ Parses the MESS output file string for the rate constants [k(T,P)]s
-        for a single reaction at a given numerical pressure, P.
+def _read_rate_table(out_lines, header_idx):
+    """ Reads a single Temperature-Species table, which starts with a
+        T(K) <prod1> <prod2> ... header and ends at the first blank line.
 
         :param out_lines: all of the lines of MESS output
         :type out_lines: list(str)
-        :param reactant: reactant name in MESS output
-        :type reactant: str
-        :param product: product name in MESS output
-        :type product: str
-        :param pressure: pressure that k(T,P)s will be read for
-        :type pressure: float
-        :return rate_constants: k(T,P)s for the reaction at given pressure
-        :rtype list(float)
+        :param header_idx: line num of the table header
+        :type header_idx: int
+        :return: (temps, products, kts) table and the line num after it
+        :rtype: ((numpy.ndarray, tuple(str), numpy.ndarray), int)
     """
 
-    for i, line in enumerate(out_lines):
-        if 'Temperature-Species Rate Tables:' in line:
-            block_start = i
-            for j in range(i, len(out_lines)):
-                if '_________________________________' in out_lines[j]:
-                    block_end = j
-                    break
-            break
-    block_lines = out_lines[block_start: block_end]
-
-    # Find where the block of text where the pressure-dependent rates exist
-    pdep_dct = {}
-    for i, line in enumerate(block_lines):
-        # Find line with reactant name and pressure
-        # If they match desired reactant and pressure, read rates
-        # Rates start two lines later in output
-        if 'Reactant =' in line:
-            tmp = line.strip().split()
-            mess_reac = tmp[2]
-            mess_press, mess_punit = float(tmp[5]), tmp[6]
-            if (
-                mess_reac == reactant and
-                numpy.isclose(mess_press, pressure)
-            ):
-                atm_pressure = _convert_pressure(pressure, mess_punit)
-                pdep_dct[atm_pressure] = _parse_reactant_rate_constants(
-                    block_lines, i+2, product)
-                break
+    products = tuple(out_lines[header_idx].strip().split()[1:])
 
-    return pdep_dct
+    end_idx = header_idx + 1
+    nlines = len(out_lines)
+    while end_idx < nlines and out_lines[end_idx].strip() != '':
+        end_idx += 1
 
+    # Undefined values (***, nan, -nan) are all read in as NaN
+    vals = ' '.join(out_lines[header_idx+1:end_idx]).replace('***', 'nan')
+    vals = numpy.array(vals.split(), dtype=numpy.float64)
+    vals = vals.reshape(end_idx-header_idx-1, -1)
 
-def _parse_reactant_rate_constants(out_lines, block_start, product):
-    """ Parses specific rate constants from the correct column
-        in the MESS output file string.
+    return (vals[:, 0], products, vals[:, 1:]), end_idx
 
-        :param out_lines: all of the lines of MESS output
-        :type out_lines: list(str)
-        :param block_start: line num corresponding to reaction and pressure
-        :type block_start: int
+
+def _table_kts(table, product):
+    """ Pull the k(T)s for a product out of a rate table in the
+        (temps, kts) format of the ktp dictionaries, with None for any
+        undefined rate constants.
+
+        :param table: rate table built by `_read_rate_table`
+        :type table: (numpy.ndarray, tuple(str), numpy.ndarray)
         :param product: label for the product used in the MESS output
         :type product: str
-        :return rate_constants: all rate constants for the reaction
-        :rtype: list(str, float)
+        :rtype: (tuple(float), tuple(float))
     """
-    # Find the column corresponding to the reaction
-    product_col = 0
-    product_headers = out_lines[block_start].strip().split()
-    for i, product_header in enumerate(product_headers):
-        if product == product_header:
-            product_col = i
-            break
-
-    nan_expr = pp.Opt(pp.Char("-")) + pp.Literal("nan")
-    line_expr = ppc.number("T") + pp.OneOrMore(ppc.number | pp.Literal("***") | nan_expr)("k")
-
-    # Parse the following lines and store the constants in a list
-    temps, kts = [], []
-    for i in range(block_start+1, len(out_lines)):
-        if out_lines[i].strip() == '':
-            break
 
-        res = line_expr.parse_string(out_lines[i])
-        temps.append(res.get("T"))
-        kts.append(res.get("k")[product_col-1])
+    temps, products, kts = table
+    # Missing products fall back to the final column, as in MESS headers
+    # without Loss/Capture columns
+    product_col = products.index(product) if product in products else -1
 
-    fin_temps = tuple(temps)
-    fin_kts = tuple(None if isinstance(k, str) else k for k in kts)
+    fin_temps = tuple(temps.tolist())
+    fin_kts = tuple(None if numpy.isnan(k) else k
+                    for k in kts[:, product_col].tolist())
 
     return (fin_temps, fin_kts)
 
@@ -701,8 +733,7 @@ def reactions(out_str, third_body=(None,)):
                 )
 
     # Remove duplcates while preserving order
-    rxns = tuple(n for i, n in enumerate(rxns)
-                 if n not in rxns[:i])
+    rxns = tuple(dict.fromkeys(rxns))
 
     return rxns
 
@@ -0,0 +1,80 @@
+""" Benchmark the template and compiled modes of the MESS block writers
+    on a synthetic PES with 500 reaction channels
+
+    Run as a script: python bench_write_rxnchan.py
+"""
+
+import time
+import mess_io.writer
+
+
+NCHANNELS = 500
+
+GEO = (
+    ('C', (-1.4283035320563338, 0.013425343735546437, -0.030302158896694683)),
+    ('C', (1.4283027358735494, -0.013425597530894248, 0.0303022919384165)),
+    ('H', (-2.1972722614281355, -0.19229727219177065, 1.8778380427620682)),
+    ('H', (-2.121310184939721, 1.792702413487708, -0.8231106338374065)),
+    ('H', (-2.1448124562913287, -1.5396513482615042, -1.191852168914227)),
+    ('H', (2.1448121742707795, 1.539654946791746, 1.1918517388178247)),
+    ('H', (2.1972712765396953, 0.1922944277301287, -1.8778395029874426)),
+    ('H', (2.121312248031497, -1.7927029137609576, 0.8231123911174519)))
+POT = {(0.,): 0.00, (30.,): 2.91, (60.,): 9.06, (90.,): 12.63,
+       (120.,): 9.06, (150.,): 2.91, (180.,): 0.00}
+FREQS_STR = (
+    '  Frequencies[1/cm]         3\n'
+    '    100.00  200.00  300.00\n'
+    '  ElectronicLevels[1/cm]    1\n'
+    '    0  1.0\n')
+TUNNEL_STR = (
+    'Tunneling  Eckart\n'
+    '  ImaginaryFrequency[1/cm]  2000\n'
+    '  WellDepth[kcal/mol]       10\n'
+    '  WellDepth[kcal/mol]       20')
+
+
+def pes_str():
+    """ Write the Well and Barrier sections of a synthetic PES, with a
+        rigid-rotor core and a hindered rotor for each species
+    """
+
+    sec_strs = []
+    for idx in range(NCHANNELS):
+        core_str = mess_io.writer.core_rigidrotor(GEO, 3.0)
+        rotor_str = mess_io.writer.rotor_hindered(
+            (2, 3, 4), (0, 1), 3, POT, rotor_id=f'D{idx}')
+        mol_str = '\n'.join(('RRHO', core_str, rotor_str, FREQS_STR))
+
+        sec_strs.append(mess_io.writer.well(
+            f'W{idx}', mol_str, zero_ene=-float(idx)))
+        sec_strs.append(mess_io.writer.species(
+            f'S{idx}', mol_str, zero_ene=float(idx)))
+        sec_strs.append(mess_io.writer.ts_sadpt(
+            f'B{idx}', f'W{idx}', f'W{idx+1}', mol_str,
+            zero_ene=float(idx), tunnel=TUNNEL_STR))
+
+    return '\n'.join(sec_strs)
+
+
+def benchmark():
+    """ Time both writer modes and check that their output is identical
+    """
+
+    timings = {}
+    outputs = {}
+    for compiled in (False, True):
+        mess_io.writer.set_compiled_mode(compiled)
+        start = time.perf_counter()
+        outputs[compiled] = pes_str()
+        timings[compiled] = time.perf_counter() - start
+    mess_io.writer.set_compiled_mode(False)
+
+    assert outputs[False] == outputs[True]
+    print(f'{NCHANNELS} channels, {len(outputs[True])} characters')
+    print(f'template: {timings[False]:.3f} s')
+    print(f'compiled: {timings[True]:.3f} s')
+    print(f'speedup:  {timings[False] / timings[True]:.1f}x')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -74,6 +74,33 @@ def test_extract_hot_branching():
                        np.array([0.002120,  0.441947,  0.011999,    0.543935]),
                        atol=1e-5)
 
+def test_extract_hot_branching_array():
+    """ test mess_io.read.extract_hot_branching_array
+    """
+    hotspecies_en = {'DMM-R2': 0.0, 'DMM-R1': 2.77}
+    species_lst = ('DMM-R2', 'FakeW-CH3+CH3OCHO', 'DMM-R1',
+                   'FakeW-CH2O+CH3OCH2', 'CH3+CH3OCHO', 'CH2O+CH3OCH2')
+    hoten_arr_dct = mess_io.reader.hoten.extract_hot_branching_array(
+        HOTWFAKE_LOG_STR, hotspecies_en, species_lst, filter_out01=True)
+
+    hoten1 = hoten_arr_dct['DMM-R1']
+    assert hoten1.species == (
+        'DMM-R2', 'DMM-R1', 'CH3+CH3OCHO', 'CH2O+CH3OCH2')
+    assert hoten1.branch_ratios.shape == (
+        len(hoten1.temps), len(hoten1.pressures),
+        len(hoten1.energies), len(hoten1.species))
+
+    # converted back, the values match those of extract_hot_branching
+    hoten_branch_dct = mess_io.reader.hoten.hot_branching_dataframes(
+        hoten_arr_dct)
+    hoten1 = hoten_branch_dct['DMM-R1']
+    hoten2 = hoten_branch_dct['DMM-R2']
+    assert np.allclose(hoten1[1.0][1000].iloc[85].values,
+                       np.array([1.2e-11, 0.27, 0, 0.73]), atol=1e-5)
+    assert np.allclose(hoten2[1.0][1000].iloc[102].values,
+                       np.array([0.3381, 3.43e-17, 0.6619, 0]), atol=1e-5)
+
+
 def test_extract_fne():
 
     dct_bf_tp_df = mess_io.reader.hoten.extract_fne(HOT_LOG_SGL)
@@ -91,4 +118,5 @@ def test_extract_fne():
 if __name__ == '__main__':
     test_get_hot_species()
     test_extract_hot_branching()
+    test_extract_hot_branching_array()
     test_extract_fne()
@@ -3,6 +3,7 @@
 
 import os
 import numpy as np
+import pytest
 from ioformat import pathtools
 import mess_io
 
@@ -83,6 +84,37 @@ def test_ped_get_ped():
     assert np.isclose(ped_dct4[(('OH', 'DMM'), ('H2O', 'DMM-R1'), (None,))
                                ][1][1000].iloc[50], 2.2e-6, atol=1e-7)
 
+
+def test_normalized_peds():
+    """ test mess_io.reader.ped._normalized_peds
+    """
+    # pylint: disable=protected-access
+    energy = np.array([1., 2., 2., 3., 4.])
+    probs = np.array([[1., 0.1, 0.],
+                      [2., 0.5, 0.],
+                      [5., 0.2, 0.],
+                      [2., 0.3, 0.],
+                      [1., 0.4, 0.]])
+    peds = mess_io.reader.ped._normalized_peds(
+        energy, probs, [0., -10., 0.])
+
+    # first value kept at each energy, normalized with the trapezoidal rule
+    assert np.allclose(peds[0].index, [1., 2., 3., 4.])
+    assert np.allclose(peds[0].values, [0.2, 0.4, 0.4, 0.2])
+    # no positive energy: only the maximum is kept
+    assert np.allclose(peds[1].index, [-8.])
+    assert np.allclose(peds[1].values, [0.5])
+    # zero norm
+    assert np.isnan(peds[2])
+
+    block_lines = ['1.0 0.1 0.2', '2.0 0.3 0.4']
+    assert np.allclose(mess_io.reader.ped._block_array(block_lines),
+                       [[1.0, 0.1, 0.2], [2.0, 0.3, 0.4]])
+    # rows of different lengths
+    with pytest.raises(ValueError):
+        mess_io.reader.ped._block_array(['1.0 0.1 0.2 0.3', '2.0 0.3'])
+
 if __name__ == '__main__':
     test_ped_names()
     test_ped_get_ped()
+    test_normalized_peds()
@@ -2,6 +2,7 @@
 """
 
 import os
+import copy
 import numpy
 from ioformat import pathtools
 from ioformat import remove_comment_lines
@@ -105,6 +106,28 @@ def test_get_species():
         for i, val_i in enumerate(val):
             assert val_i.split('\n')[-3:] == pes2check[sp][i] 
 
+
+def test_pes_cache():
+    """ test that mess_io.reader.pes and mess_io.reader.get_species
+        return copies of the PES parsed once for an input string
+    """
+
+    pes_dat = mess_io.reader.pes(PED_INP_STR)
+    species_blocks = mess_io.reader.get_species(PED_INP_STR)
+    ref_pes_dat = copy.deepcopy(pes_dat)
+    ref_species_blocks = copy.deepcopy(species_blocks)
+
+    # Changing what the readers return leaves the cached data unchanged
+    energy_dct, _, conn_lst_dct, pes_label_dct = pes_dat
+    energy_dct['W0'] = 100.0
+    conn_lst_dct.clear()
+    pes_label_dct.clear()
+    species_blocks['W0'].append('')
+
+    assert mess_io.reader.pes(PED_INP_STR) == ref_pes_dat
+    assert mess_io.reader.get_species(PED_INP_STR) == ref_species_blocks
+
+
 def test_find_barrier():
     """ test mess_io.reader.find_barrier
     """
@@ -153,6 +153,33 @@ def test__ktp_dct():
     assert numpy.allclose(ref_ktp_dct[1.0], tktorr)
 
 
+def test__ktp_tables():
+    """ test mess_io.reader.rates.ktp_tables
+    """
+
+    ref_press = ('high', 0.03, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0)
+
+    tbl_dct = mess_io.reader.rates.ktp_tables(KTP_OUT_STR)
+    assert set(tbl_dct.keys()) == {'W1', 'P1', 'P2', 'P3'}
+    assert tuple(tbl_dct['W1'].keys()) == ref_press
+
+    temps, prods, kts = tbl_dct['W1']['high']
+    assert prods == ('W1', 'P1', 'P2', 'P3')
+    assert kts.shape == (len(temps), len(prods))
+    assert numpy.all(numpy.isnan(kts[:, 0]))
+    assert numpy.allclose(kts[:3, 1], (1.72e-10, 2.44e-08, 1.53e-06))
+
+    temps, prods, kts = tbl_dct['W1'][0.03]
+    assert prods == ('P1', 'P2', 'P3', 'Loss', 'Capture')
+    assert numpy.allclose(temps[:3], (500., 550., 600.))
+    assert numpy.allclose(kts[:3, 0], (3.62e-14, 4.14e-12, 2.13e-10))
+
+    # Table pressures are converted to atm
+    tbl_dct_torr = mess_io.reader.rates.ktp_tables(KTP_OUT_TORR_STR)
+    assert any(numpy.isclose(press, 0.0013157894736842107)
+               for press in tbl_dct_torr['W1'] if press != 'high')
+
+
 def test__ke_dct():
     """ test mess_io.reader.rates.ke_dct
     """
@@ -436,6 +463,7 @@ def test__barriers()
 if __name__ == '__main__':
     test__get_rxn_ktp_dct()
     test__ktp_dct()
+    test__ktp_tables()
     test__ke_dct()
     test__tp()
     test__rxns_labels()
@@ -336,6 +336,19 @@ def test__tunnel_read_writer():
     assert tunnel_read2_str == pathtools.read_file(
         INP_PATH, 'tunnel_read2.inp')
 
+
+def test__compiled_mode():
+    """ test mess_io.writer.set_compiled_mode
+    """
+
+    mess_io.writer.set_compiled_mode()
+    try:
+        test__core_rigidrotor_writer()
+        test__rotor_hindered_writer()
+    finally:
+        mess_io.writer.set_compiled_mode(False)
+
+
 if __name__ == '__main__':
     test__core_multirotor_writer()
     test__core_phasespace_writer()
@@ -344,4 +357,5 @@ if __name__ == '__main__':
     test__rotor_hindered_writer()
     test__tunnel_eckart_writer()
     test__tunnel_read_writer()
-    test__umbrella_writer()
\ No newline at end of file
+    test__umbrella_writer()
+    test__compiled_mode()
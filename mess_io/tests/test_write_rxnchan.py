@@ -214,6 +214,21 @@ def test__configs_union_writer():
     assert union1_str == pathtools.read_file(INP_PATH, 'union1.inp')
     assert union2_str == pathtools.read_file(INP_PATH, 'union2.inp')
 
+
+def test__compiled_mode():
+    """ test mess_io.writer.set_compiled_mode
+    """
+
+    mess_io.writer.set_compiled_mode()
+    try:
+        assert mess_io.writer.compiled_mode()
+        test__species_writer()
+        test__well_writer()
+        test__ts_sadpt_writer()
+    finally:
+        mess_io.writer.set_compiled_mode(False)
+
+
 if __name__ == '__main__':
     test__bimolecular_writer()
     test__configs_union_writer()
@@ -222,3 +237,4 @@ if __name__ == '__main__':
     test__ts_sadpt_writer()
     test__ts_variational_writer()
     test__well_writer()
+    test__compiled_mode()
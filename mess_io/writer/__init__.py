@@ -38,6 +38,8 @@ from mess_io.writer._monte_carlo import monte_carlo_species
 from mess_io.writer._monte_carlo import monte_carlo_data
 from mess_io.writer._monte_carlo import fluxional_mode
 from mess_io.writer._sec import SPC_SEP_STR
+from mess_io.writer._compiled import set_compiled_mode
+from mess_io.writer._compiled import compiled_mode
 
 
 __all__ = [
@@ -81,5 +83,8 @@ __all__ = [
     'monte_carlo_data',
     'fluxional_mode',
     # section library
-    'SPC_SEP_STR'
+    'SPC_SEP_STR',
+    # writer mode
+    'set_compiled_mode',
+    'compiled_mode'
 ]
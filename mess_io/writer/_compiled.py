@@ -0,0 +1,158 @@
+"""
+  Template-free writers for the most frequently written MESS blocks
+
+  Each writer takes the same keys as the corresponding Mako template and
+  assembles the block directly into a list of strings, joined once, giving
+  output identical to build_mako_str on that template. They are used in
+  place of the templates once set_compiled_mode has been turned on.
+"""
+
+
+_COMPILED = False
+
+
+def set_compiled_mode(compiled=True):
+    """ Turn the template-free writers for the Species, Well, Barrier,
+        Core RigidRotor, and hindered Rotor blocks on or off
+
+        :param compiled: whether to use the template-free writers
+        :type compiled: bool
+    """
+    global _COMPILED  # pylint: disable=global-statement
+    _COMPILED = compiled
+
+
+def compiled_mode():
+    """ Whether the template-free writers are in use
+
+        :rtype: bool
+    """
+    return _COMPILED
+
+
+def species(keys):
+    """ Assemble the `Species` section (species.mako)
+    """
+
+    buf = [f'Species {keys["spc_label"]}\n', keys['spc_data']]
+    if keys['zero_ene'] is not None:
+        buf.append(f'    ZeroEnergy[kcal/mol]      {keys["zero_ene"]}\n')
+    buf.append('End')
+
+    return _remove_trail_whitespace(buf)
+
+
+def well(keys):
+    """ Assemble the `Well` section (well.mako)
+    """
+
+    buf = [f'Well {keys["well_label"]} \n']
+    if keys['well_cap'] is not None:
+        buf.append(f'  WellExtensionCap[kcal/mol]    {keys["well_cap"]}\n')
+    buf += ['  Species\n', keys['well_data']]
+    if keys['zero_ene'] is not None:
+        buf.append(f'      ZeroEnergy[kcal/mol]      {keys["zero_ene"]}\n')
+    buf.append('  End  ! Species\n')
+    if keys['edown_str'] is not None:
+        buf.append(f'{keys["edown_str"]}\n')
+    if keys['collid_freq_str'] is not None:
+        buf.append(f'{keys["collid_freq_str"]}\n')
+    buf.append('End  ! Well')
+
+    return _remove_trail_whitespace(buf)
+
+
+def ts_sadpt(keys):
+    """ Assemble the `Barrier` section for a saddle point (ts_sadpt.mako)
+    """
+
+    buf = [f'Barrier {keys["rxn_label"]}\n', keys['ts_data']]
+    if keys['zero_ene'] is not None:
+        buf.append(f'    ZeroEnergy[kcal/mol]      {keys["zero_ene"]}\n')
+    if keys['tunnel'] != '':
+        buf.append(f'{keys["tunnel"]}\n  End\n')
+    buf.append('End  ! Barrier')
+
+    return _remove_trail_whitespace(buf)
+
+
+def core_rigidrotor(keys):
+    """ Assemble the `Core RigidRotor` section (core_rigidrotor.mako)
+    """
+
+    buf = [
+        f'  Geometry[angstrom]        {keys["natom"]}\n',
+        f'{keys["geo"]}\n',
+        '  Core RigidRotor\n',
+        f'    SymmetryFactor          {keys["sym_factor"]}\n'
+    ]
+    if keys['interp_emax'] is not None:
+        buf += [
+            '    ZeroPointEnergy[1/cm]             0.0\n',
+            f'    InterpolationEnergyMax[kcal/mol]  {keys["interp_emax"]}\n'
+        ]
+    if keys['anharm'] != '':
+        if keys['nfreqs'] > 0:
+            buf += [f'    Frequencies[1/cm]         {keys["nfreqs"]}\n',
+                    f'{keys["freqs"]}\n']
+        buf += ['    Anharmonicities[1/cm]\n', f'{keys["anharm"]}\n']
+        if keys['rovib_coups'] != '':
+            buf += ['    RovibrationalCouplings[1/cm]\n',
+                    f'{keys["rovib_coups"]}\n']
+        if keys['rot_dists'] != '':
+            buf += ['    RotationalDistortion[1/cm]\n',
+                    f'{keys["rot_dists"]}\n',
+                    '    End\n']
+    buf.append('  End  ! Core\n')
+
+    return _remove_trail_whitespace(buf)
+
+
+def rotor_hindered(keys):
+    """ Assemble the hindered `Rotor` section (rotor_hindered.mako)
+    """
+
+    if keys['rotor_id'] != '':
+        buf = [f'Rotor  Hindered   # {keys["rotor_id"]}\n']
+    else:
+        buf = ['Rotor  Hindered\n']
+    if keys['geo']:
+        buf += [f'  Geometry[angstrom]     {keys["natom"]}\n',
+                f'{keys["geo"]}\n']
+    buf += [
+        f'  Group                        {keys["group"]}\n',
+        f'  Axis                         {keys["axis"]}\n',
+        f'  Symmetry                     {keys["symmetry"]}\n'
+    ]
+    npot = keys['npotential']
+    if keys['potential_form'] == 'spline':
+        buf += [f'  PotentialSpline[kcal/mol]    {npot}   {npot-1}\n',
+                f'{keys["pot_coords"]} \n',
+                f'{keys["pot_enes"]} \n']
+    elif keys['potential_form'] == 'fourier':
+        buf += [f'  Potential[kcal/mol]          {npot}\n',
+                f'{keys["pot_enes"]} \n']
+    if keys['hmin'] is not None:
+        buf.append(f'  HamiltonSizeMin            {keys["hmin"]}\n')
+    if keys['hmax'] is not None:
+        buf.append(f'  HamiltonSizeMax            {keys["hmax"]}\n')
+    if keys['lvl_ene_max'] is not None:
+        buf.append(f'  LevelEnergyMax[kcal/mol]   {keys["lvl_ene_max"]}\n')
+    if keys['therm_pow_max'] is not None:
+        buf.append(f'  ThermalPowerMax      {keys["therm_pow_max"]}\n')
+    buf.append('End  ! HindRot\n')
+
+    return _remove_trail_whitespace(buf)
+
+
+def _remove_trail_whitespace(buf):
+    """ Join the buffer and remove trailing spaces and empty lines, as
+        ioformat.remove_trail_whitespace does for the template output
+    """
+
+    lines = ''.join(buf).split('\n')
+    last_line = lines.pop().rstrip(' \t')
+    lines = [line.rstrip(' \t') for line in lines if line.strip(' \t')]
+    lines.append(last_line)
+
+    return '\n'.join(lines)
@@ -7,6 +7,7 @@ import automol._deprecated
 from ioformat import build_mako_str
 from ioformat import indent
 from mess_io.writer import _format as messformat
+from mess_io.writer import _compiled
 
 
 # OBTAIN THE PATH TO THE DIRECTORY CONTAINING THE TEMPLATES #
@@ -66,6 +67,9 @@ def core_rigidrotor(
         'rot_dists': rot_dists,
     }
 
+    if _compiled.compiled_mode():
+        return _compiled.core_rigidrotor(core_keys)
+
     return build_mako_str(
         template_file_name='core_rigidrotor.mako',
         template_src_path=SPEC_INFO_PATH,
@@ -264,6 +268,9 @@ def rotor_hindered(group, axis, symmetry, potential,
         'rotor_id': rotor_id
     }
 
+    if _compiled.compiled_mode():
+        return _compiled.rotor_hindered(rotor_keys)
+
     return build_mako_str(
         template_file_name='rotor_hindered.mako',
         template_src_path=SPEC_INFO_PATH,
@@ -5,6 +5,7 @@ Writes MESS input for a molecule
 import os
 from ioformat import build_mako_str
 from mess_io.writer import _format as messformat
+from mess_io.writer import _compiled
 
 
 # OBTAIN THE PATH TO THE DIRECTORY CONTAINING THE TEMPLATES #
@@ -47,6 +48,9 @@ def species(spc_label, spc_data, aux_id_label=None, zero_ene=None):
         'zero_ene': zero_ene
     }
 
+    if _compiled.compiled_mode():
+        return _compiled.species(spc_keys)
+
     return build_mako_str(
         template_file_name='species.mako',
         template_src_path=RXNCHAN_PATH,
@@ -107,6 +111,9 @@ def well(well_label, well_data,
         'collid_freq_str': collid_freq_str
     }
 
+    if _compiled.compiled_mode():
+        return _compiled.well(well_keys)
+
     return build_mako_str(
         template_file_name='well.mako',
         template_src_path=RXNCHAN_PATH,
@@ -210,6 +217,9 @@ def ts_sadpt(ts_label, reac_label, prod_label, ts_data,
         'tunnel': tunnel
     }
 
+    if _compiled.compiled_mode():
+        return _compiled.ts_sadpt(ts_sadpt_keys)
+
     return build_mako_str(
         template_file_name='ts_sadpt.mako',
         template_src_path=RXNCHAN_PATH,
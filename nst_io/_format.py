@@ -2,6 +2,7 @@
 """
 
 import automol.geom
+from ioformat import vector_string
 
 
 def format_geometry(geo):
@@ -31,11 +32,8 @@ def format_hessian(hess):
         read by the NST code.
     """
 
-    hess_str = ''
-
-    ndim = len(hess)
-    for i in range(ndim):
-        for j in range(ndim):
-            hess_str += f'{hess[i][j]}\n'
+    hess_str = vector_string(hess, val_format='{}', num_per_row=1)
+    if hess_str:
+        hess_str += '\n'
 
     return hess_str
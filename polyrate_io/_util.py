@@ -2,9 +2,9 @@
 utility functions
 """
 
-from itertools import chain
-import automol
 from ioformat import indent
+from ioformat import vector_string
+from ioformat import matrix_string
 
 
 def pt_format(header, hess, vlabel, vval,
@@ -57,7 +57,7 @@ def geometry_format(geo):
     """
 
     xyzs = tuple(xyz for _, xyz in geo)
-    geo_str = automol.util.matrix.string(xyzs, val_format='{:>12.8f}')
+    geo_str = matrix_string(xyzs, val_format='{:>12.8f}')
 
     return _end_format('geom', 'end', geo_str)
 
@@ -66,7 +66,7 @@ def gradient_format(grad):
     """ format hessian
     """
 
-    grad_str = automol.util.matrix.string(grad, val_format='{:>12.8f}')
+    grad_str = matrix_string(grad, val_format='{:>12.8f}')
 
     return _end_format('grads', 'end', grad_str)
 
@@ -75,9 +75,7 @@ def hessian_format(hess):
     """ format hessian
     """
 
-    hess = list(chain.from_iterable(hess))
-    hess_str = automol.util.vector.string(
-        hess, num_per_row=6, val_format='{0:>12.8f}')
+    hess_str = vector_string(hess, num_per_row=6, val_format='{0:>12.8f}')
 
     return _end_format('hessian', 'end', hess_str)
 
@@ -2,9 +2,12 @@
   Additional functions for formatting information for MESS strings
 """
 
+import functools
 import numpy
 from phydat import phycon, ptab
 from ioformat import remove_trail_whitespace
+from ioformat import matrix_string
+from ioformat import format_array
 
 
 def write_data_str(geos, grads, hessians):
@@ -23,19 +26,20 @@ def write_data_str(geos, grads, hessians):
 
     nsteps = len(geos)
 
-    data_str = ''
+    data_strs = []
     for i, (geo, grad, hess) in enumerate(zip(geos, grads, hessians)):
-        data_str += f'Step    {str(i+1)}\n'
-        data_str += 'geometry\n'
-        data_str += _format_geo_str(geo)
-        data_str += 'gradient\n'
-        data_str += _format_grad_str(geo, grad)
-        data_str += 'Hessian\n'
-        data_str += _format_hessian_str(hess)
+        data_strs += [
+            f'Step    {str(i+1)}\n',
+            'geometry\n',
+            _format_geo_str(geo),
+            'gradient\n',
+            _format_grad_str(geo, grad),
+            'Hessian\n',
+            _format_hessian_str(hess)]
         if i < nsteps-1:
-            data_str += '\n'
+            data_strs.append('\n')
 
-    return remove_trail_whitespace(data_str)
+    return remove_trail_whitespace(''.join(data_strs))
 
 
 def _format_geo_str(geo):
@@ -47,14 +51,14 @@ def _format_geo_str(geo):
     """
 
     # Format the strings for the xyz coordinates
-    geo_str = ''
-    for i, (sym, xyzs) in enumerate(geo):
-        anum = int(ptab.to_number(sym))
-        xyzs = [xyz * phycon.BOHR2ANG for xyz in xyzs]
-        xyzs_str = f'{xyzs[0]:>14.8f}{xyzs[1]:>14.8f}{xyzs[2]:>14.8f}'
-        geo_str += f'{i+1:2d}{anum:4d}{0:4d}{xyzs_str}\n'
+    row_starts = tuple(
+        f'{i+1:2d}{int(ptab.to_number(sym)):4d}{0:4d}'
+        for i, (sym, _) in enumerate(geo))
+    xyzs = numpy.multiply([xyz for _, xyz in geo], phycon.BOHR2ANG)
+    geo_str = matrix_string(xyzs, val_format='{:>14.8f}',
+                            row_starts=row_starts)
 
-    return remove_trail_whitespace(geo_str)
+    return remove_trail_whitespace(geo_str + '\n')
 
 
 def _format_grad_str(geo, grad):
@@ -67,17 +71,14 @@ def _format_grad_str(geo, grad):
         :rtype: str
     """
 
-    atom_list = []
-    for i, (sym, _) in enumerate(geo):
-        atom_list.append(int(ptab.to_number(sym)))
-
     # Format the strings for the xyz gradients
-    full_grads_str = ''
-    for i, grads in enumerate(grad):
-        grads_str = f'{grads[0]:>14.8f}{grads[1]:>14.8f}{grads[2]:>14.8f}'
-        full_grads_str += f'{i+1:2d}{atom_list[i]:4d}{grads_str}\n'
+    row_starts = tuple(
+        f'{i+1:2d}{int(ptab.to_number(sym)):4d}'
+        for i, (sym, _) in enumerate(geo))
+    grad_str = matrix_string(grad, val_format='{:>14.8f}',
+                             row_starts=row_starts)
 
-    return remove_trail_whitespace(full_grads_str)
+    return remove_trail_whitespace(grad_str + '\n')
 
 
 def _format_hessian_str(hess):
@@ -88,10 +89,22 @@ def _format_hessian_str(hess):
         :rtype: str
     """
 
-    # Format the Hessian
     hess = numpy.array(hess)
-    nrows = numpy.shape(hess)[0]
-    ncols = numpy.shape(hess)[1]
+    nrows, ncols = numpy.shape(hess)
+    template, idxs = _hessian_template(nrows, ncols)
+
+    # The template has no trailing whitespace or empty lines to remove
+    return format_array(template, hess, idxs=idxs)
+
+
+@functools.lru_cache(maxsize=16)
+def _hessian_template(nrows, ncols):
+    """ Build the template for a Hessian of a given shape, written as the
+        lower triangle in blocks of five columns, along with the indices
+        of the values in the order they are placed in the template
+
+        :rtype: (str, (numpy.ndarray, numpy.ndarray))
+    """
 
     if nrows % 5 == 0:
         nchunks = nrows // 5
@@ -99,6 +112,7 @@ def _format_hessian_str(hess):
         nchunks = (nrows // 5) + 1
 
     hess_str = '   ' + '    '.join([str(val) for val in range(1, 6)]) + '\n'
+    row_idxs, col_idxs = [], []
     cnt = 0
     while cnt+1 <= nchunks:
         for i in range(nrows):
@@ -108,7 +122,9 @@ def _format_hessian_str(hess):
                 for j in range(5*cnt, ncols):
                     if i >= j:
                         if col_tracker <= 5:
-                            hess_str += f'  {hess[i][j]:5.8f}'
+                            hess_str += '  {:5.8f}'
+                            row_idxs.append(i)
+                            col_idxs.append(j)
                             col_tracker += 1
                             if col_tracker == 6:
                                 hess_str += '\n'
@@ -131,4 +147,6 @@ def _format_hessian_str(hess):
                 hess_str += '    ' + val_str + '\n'
         cnt += 1
 
-    return remove_trail_whitespace(hess_str)
+    idxs = (numpy.array(row_idxs, dtype=int), numpy.array(col_idxs, dtype=int))
+
+    return hess_str, idxs